@@ -0,0 +1,38 @@
+"""Batch benchmark: compares per-state `apply_circuit` calls with a single `apply_circuit_batch` call"""
+
+import argparse
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+def bench_batch(width: int, depth: int, batch_sizes: list) -> None:
+    """Prints wall time of a loop over `apply_circuit` and of `apply_circuit_batch` for each batch size"""
+    circuit = QuantumCircuit(width=width, depth=depth, weight_2q=0.3)
+    circuit.generate_gates_and_unite()
+    emulator = CustomQuantumEmulator()
+    print(f"width={width} depth={depth}")
+
+    for batch_size in batch_sizes:
+        state_vectors = [QuantumStateVector(width) for _ in range(batch_size)]
+
+        start = time.perf_counter()
+        for state_vector in state_vectors:
+            emulator.apply_circuit(circuit, state_vector)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        emulator.apply_circuit_batch(circuit, state_vectors)
+        batch_time = time.perf_counter() - start
+        print(f"batch={batch_size:5d} loop={loop_time:7.3f} s batch={batch_time:7.3f} s speedup={loop_time / batch_time:6.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=100)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+    bench_batch(args.width, args.depth, args.batch_sizes)
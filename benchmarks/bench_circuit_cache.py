@@ -0,0 +1,33 @@
+"""Circuit cache benchmark: compares cold (generated) and warm (loaded from `CircuitCache`) circuit construction time"""
+
+import argparse
+import tempfile
+import time
+
+from quantum_simulator.circuit_cache import CircuitCache
+
+
+def bench_cache(width: int, depths: list, weight_2q: float, fuse: bool) -> None:
+    """Prints cold and warm `CircuitCache.generate()` time and total cache size after each depth"""
+    with tempfile.TemporaryDirectory() as directory:
+        for depth in depths:
+            times = []
+            for _ in range(2):
+                cache = CircuitCache(directory)
+                start = time.perf_counter()
+                cache.generate(width, depth, weight_2q, fuse=fuse)
+                times.append(time.perf_counter() - start)
+            print(
+                f"width={width} depth={depth:7d} fuse={fuse} cold={times[0]:8.3f} s warm={times[1]:8.3f} s "
+                f"speedup={times[0] / times[1]:6.1f}x cache size={cache.size / 2**20:7.2f} MB"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=16)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--weight-2q", type=float, default=0.3)
+    parser.add_argument("--fuse", action="store_true", help="cache fused circuits")
+    args = parser.parse_args()
+    bench_cache(args.width, args.depths, args.weight_2q, args.fuse)
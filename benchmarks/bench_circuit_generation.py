@@ -0,0 +1,38 @@
+"""Circuit generation benchmark: compares per-gate `rand_unitary()` with batched `rand_unitaries()` and times circuit generation"""
+
+import argparse
+import time
+
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.random_generator import RandomGenerator
+
+
+def bench_generation(n_unitaries: int, width: int, depths: list) -> None:
+    """Prints random unitaries generation time and `generate_gates_and_unite()` time for each depth"""
+    for mode in ["1q", "2q"]:
+        rand_gen = RandomGenerator()
+        start = time.perf_counter()
+        for _ in range(n_unitaries):
+            rand_gen.rand_unitary(mode)
+        expm_time = time.perf_counter() - start
+
+        rand_gen = RandomGenerator()
+        start = time.perf_counter()
+        rand_gen.rand_unitaries(mode, n_unitaries)
+        eigh_time = time.perf_counter() - start
+        print(f"mode={mode} unitaries={n_unitaries} expm={expm_time:7.3f} s batched eigh={eigh_time:7.3f} s speedup={expm_time / eigh_time:6.1f}x")
+
+    for depth in depths:
+        circuit = QuantumCircuit(width=width, depth=depth, weight_2q=0.3)
+        start = time.perf_counter()
+        circuit.generate_gates_and_unite()
+        print(f"width={width} depth={depth:8d} generate_gates_and_unite={time.perf_counter() - start:7.3f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--unitaries", type=int, default=20000)
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--depths", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+    bench_generation(args.unitaries, args.width, args.depths)
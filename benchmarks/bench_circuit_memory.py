@@ -0,0 +1,38 @@
+"""Circuit storage benchmark: reports `QuantumCircuit` packed gates memory and layers iteration time"""
+
+import argparse
+import time
+import tracemalloc
+
+from quantum_simulator.quantum_circuit import QuantumCircuit
+
+
+def bench_memory(width: int, depths: list, weight_2q: float) -> None:
+    """Prints traced memory of generated circuits and time of `iter_layers()` and `gate_layers` passes"""
+    for depth in depths:
+        tracemalloc.start()
+        circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q)
+        circuit.generate_gates_and_unite()
+        circuit_mb = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        n_gates = sum(len(layer_gates) for layer_gates in circuit.iter_layers())
+        iter_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _ = circuit.gate_layers
+        view_time = time.perf_counter() - start
+        print(
+            f"width={width} gates={n_gates:8d} layers={circuit.layers_count:7d} memory={circuit_mb:8.1f} MB "
+            f"iter_layers={iter_time:7.3f} s gate_layers={view_time:7.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--depths", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--weight-2q", type=float, default=0.3)
+    args = parser.parse_args()
+    bench_memory(args.width, args.depths, args.weight_2q)
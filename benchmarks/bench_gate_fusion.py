@@ -0,0 +1,48 @@
+"""Gate fusion benchmark: reports `QuantumCircuit.fuse_gates()` gate count reduction and `apply_circuit` speedup per circuit"""
+
+import argparse
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+def timed_apply(emulator: CustomQuantumEmulator, circuit: QuantumCircuit, state_vector: QuantumStateVector) -> float:
+    """Returns `apply_circuit` wall time"""
+    start = time.perf_counter()
+    emulator.apply_circuit(circuit, state_vector)
+    return time.perf_counter() - start
+
+
+def bench_fusion(width: int, depths: list, weights_2q: list, seed: int) -> None:
+    """Prints gate count reduction and wall-time speedup of fused circuits"""
+    emulator = CustomQuantumEmulator()
+    state_vector = QuantumStateVector(width)
+    for depth in depths:
+        for weight_2q in weights_2q:
+            circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q, seed=seed)
+            circuit.generate_gates_and_unite()
+
+            start = time.perf_counter()
+            fused_circuit = circuit.fuse_gates()
+            fusion_time = time.perf_counter() - start
+
+            time_original = timed_apply(emulator, circuit, state_vector)
+            time_fused = timed_apply(emulator, fused_circuit, state_vector)
+            print(
+                f"width={width} depth={depth:4d} weight_2q={weight_2q:.2f} "
+                f"gates={circuit.gates_count:4d}->{fused_circuit.gates_count:4d} "
+                f"layers={len(circuit.gate_layers):4d}->{len(fused_circuit.gate_layers):4d} "
+                f"fusion={fusion_time * 1e3:7.2f} ms apply={time_original:6.3f} s->{time_fused:6.3f} s speedup={time_original / time_fused:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--depths", type=int, nargs="+", default=[100, 400])
+    parser.add_argument("--weights-2q", type=float, nargs="+", default=[0.1, 0.3, 0.6])
+    parser.add_argument("--seed", type=int, default=27)
+    args = parser.parse_args()
+    bench_fusion(args.width, args.depths, args.weights_2q, args.seed)
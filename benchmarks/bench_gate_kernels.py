@@ -0,0 +1,37 @@
+"""Gate kernels benchmark: measures `CustomQuantumEmulator` single gate application time for different state sizes"""
+
+import argparse
+import time
+
+import numpy as np
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_operation import OneQubitOperation, TwoQubitsOperation
+from quantum_simulator.random_generator import RandomGenerator
+
+
+def bench_kernels(widths: list, repeats: int) -> None:
+    """Prints mean in-place kernel time and throughput for 1-qubit and 2-qubit gates"""
+    rand_gen = RandomGenerator()
+    for width in widths:
+        vector = np.zeros(2**width, dtype=complex)
+        vector[0] = 1
+        state = vector.reshape((2,) * width)
+        gates = [
+            ("1q", OneQubitOperation(rand_gen.rand_unitary("1q"), [width // 2])),
+            ("2q", TwoQubitsOperation(rand_gen.rand_unitary("2q"), [0, width - 1])),
+        ]
+        for name, gate in gates:
+            start = time.perf_counter()
+            for _ in range(repeats):
+                CustomQuantumEmulator._apply_matrix(state, gate.matrix, gate.target_qubits)
+            elapsed = (time.perf_counter() - start) / repeats
+            print(f"width={width:2d} gate={name} time={elapsed * 1e3:9.3f} ms amplitudes/s={2**width / elapsed:.3e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--widths", type=int, nargs="+", default=[10, 14, 18, 20, 22])
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+    bench_kernels(args.widths, args.repeats)
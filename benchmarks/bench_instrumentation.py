@@ -0,0 +1,48 @@
+"""Instrumentation benchmark: measures `CustomQuantumEmulator` overhead of disabled, enabled and allocation tracing instrumentation"""
+
+import argparse
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.instrumentation import Instrumentation
+from quantum_simulator.quantum_circuit import QuantumCircuit
+
+
+def bench_instrumentation(widths: list, depth: int, repeats: int, trace: str = None) -> None:
+    """Prints min `execute` time per instrumentation mode and the gate kinds summary of the last width. Saves its trace to `trace`"""
+    modes = [("disabled", lambda: None), ("enabled", Instrumentation), ("allocations", lambda: Instrumentation(trace_allocations=True))]
+    for width in widths:
+        circuit = QuantumCircuit(width=width, depth=depth, weight_2q=0.5)
+        circuit.generate_gates_and_unite()
+        emulator = CustomQuantumEmulator()
+        times = {}
+        for name, make_instrumentation in modes:
+            best = float("inf")
+            for _ in range(repeats):
+                emulator.instrumentation = make_instrumentation()
+                start = time.perf_counter()
+                emulator.execute(circuit)
+                best = min(best, time.perf_counter() - start)
+            times[name] = best
+        print(
+            f"width={width:2d} depth={depth} gates={circuit.gates_count} "
+            + " ".join(f"{name}={value:8.4f} s ({value / times['disabled'] - 1:+6.1%})" for name, value in times.items())
+        )
+
+    for kind, record in emulator.instrumentation.summary().items():
+        print(
+            f"  {kind:15s} count={record['count']:6d} kernel_time={record['kernel_time_s']:8.4f} s "
+            f"touched={record['bytes_touched'] / 2**20:10.1f} MiB allocated={record['allocated'] / 2**20:10.1f} MiB"
+        )
+    if trace:
+        emulator.instrumentation.save_trace(trace)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--widths", type=int, nargs="+", default=[10, 16, 20])
+    parser.add_argument("--depth", type=int, default=40)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--trace", help="Chrome trace event format JSON output path of the last width allocations traced run")
+    args = parser.parse_args()
+    bench_instrumentation(args.widths, args.depth, args.repeats, args.trace)
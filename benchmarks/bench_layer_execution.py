@@ -0,0 +1,45 @@
+"""
+Layer execution benchmark: compares `CustomQuantumEmulator.apply_circuit` with one sweep per gate
+(`layer_block_qubits=1`) against united layer blocks on wide shallow random circuits
+"""
+
+import argparse
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+def count_sweeps(circuit: QuantumCircuit, layer_block_qubits: int) -> int:
+    """Returns number of full state sweeps made by `CustomQuantumEmulator.apply_circuit`"""
+    # pylint: disable=protected-access
+    return sum(len(CustomQuantumEmulator._unite_layer_gates(layer_gates, layer_block_qubits)) for layer_gates, _ in circuit.gate_layers)
+
+
+def bench_layers(width: int, depth: int, weight_2q: float, block_sizes: list) -> None:
+    """Prints `apply_circuit` wall time and amount of state memory traffic for each layer block size"""
+    circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q)
+    circuit.generate_gates_and_unite()
+    state_vector = QuantumStateVector(width)
+    print(f"width={width} depth={depth} weight_2q={weight_2q} layers={len(circuit.gate_layers)}")
+
+    for layer_block_qubits in block_sizes:
+        emulator = CustomQuantumEmulator(layer_block_qubits=layer_block_qubits)
+        start = time.perf_counter()
+        emulator.apply_circuit(circuit, state_vector)
+        elapsed = time.perf_counter() - start
+        sweeps = count_sweeps(circuit, layer_block_qubits)
+        # every sweep reads and writes the whole state once
+        traffic = 2 * sweeps * state_vector.nbytes
+        print(f"layer_block_qubits={layer_block_qubits} time={elapsed:7.3f} s sweeps={sweeps:5d} traffic={traffic / 2**30:8.2f} GiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=22)
+    parser.add_argument("--depth", type=int, default=88)
+    parser.add_argument("--weight-2q", type=float, default=0.2)
+    parser.add_argument("--block-sizes", type=int, nargs="+", default=[1, 2, 3, 4, 5, 6])
+    args = parser.parse_args()
+    bench_layers(args.width, args.depth, args.weight_2q, args.block_sizes)
@@ -0,0 +1,46 @@
+"""Memory-mapped state benchmark: measures `CustomQuantumEmulator` chunked circuit application throughput vs. chunk size"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+def bench_memmap(width: int, depth: int, weight_2q: float, chunk_qubits: list, directory: str) -> None:
+    """Prints number of passes over the file, time and gate amplitudes throughput of a memory-mapped state for each chunk size"""
+    circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q)
+    circuit.generate_gates_and_unite()
+    gates = [gate for layer_gates in circuit.iter_layers() for gate in layer_gates]
+
+    start = time.perf_counter()
+    CustomQuantumEmulator().apply_circuit_inplace(circuit, QuantumStateVector(width))
+    print(f"width={width} gates={len(gates)} in-memory time={time.perf_counter() - start:8.3f} s")
+
+    filename = os.path.join(directory, f"bench_memmap_state_{width}.bin")
+    try:
+        for chunk in chunk_qubits:
+            n_passes = len(CustomQuantumEmulator._schedule_passes(gates, width, chunk))
+            state_vector = QuantumStateVector().from_file(filename, width)
+            start = time.perf_counter()
+            CustomQuantumEmulator(chunk_qubits=chunk).apply_circuit_inplace(circuit, state_vector)
+            elapsed = time.perf_counter() - start
+            print(f"width={width} chunk_qubits={chunk:2d} passes={n_passes:5d} time={elapsed:8.3f} s gate amplitudes/s={len(gates) * 2**width / elapsed:.3e}")
+            del state_vector
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=24)
+    parser.add_argument("--depth", type=int, default=200)
+    parser.add_argument("--weight-2q", type=float, default=0.3)
+    parser.add_argument("--chunk-qubits", type=int, nargs="+", default=[12, 16, 18, 20, 22])
+    parser.add_argument("--dir", default=tempfile.gettempdir(), help="directory of the temporary state file")
+    args = parser.parse_args()
+    bench_memmap(args.width, args.depth, args.weight_2q, args.chunk_qubits, args.dir)
@@ -0,0 +1,46 @@
+"""MPS benchmark: measures `MPSQuantumEmulator` time, memory and truncation on wide shallow random circuits"""
+
+import argparse
+import time
+
+import numpy as np
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.mps_quantum_emulator import MPSQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+
+
+def bench_mps(widths: list, layers: int, weight_2q: float, max_bond_dimension: int, n_shots: int) -> None:
+    """Prints execution and sampling time, bond dimensions, memory and truncation error. Fidelity is checked for widths up to 22"""
+    emulator = MPSQuantumEmulator(max_bond_dimension=max_bond_dimension)
+    for width in widths:
+        circuit = QuantumCircuit(width=width, depth=layers * width, weight_2q=weight_2q)
+        circuit.generate_gates_and_unite()
+
+        start = time.perf_counter()
+        state = emulator.execute_mps(circuit)
+        execute_time = time.perf_counter() - start
+        start = time.perf_counter()
+        state.sample_counts(n_shots, seed=1)
+        shots_time = time.perf_counter() - start
+
+        fidelity = ""
+        if width <= 22:
+            expected_vector = CustomQuantumEmulator().execute(circuit).vector
+            fidelity = f" fidelity={abs(np.vdot(expected_vector, state.to_state_vector().vector)) ** 2:.8f}"
+        print(
+            f"width={width:3d} gates={circuit.gates_count:5d} execute={execute_time:7.3f} s shots={shots_time:7.3f} s "
+            f"max_bond={max(state.bond_dimensions, default=1):4d} memory={state.nbytes / 2**20:8.2f} MiB "
+            f"state_vector={16 * 2.0**width / 2**20:10.3g} MiB truncation_error={state.truncation_error:.2e}{fidelity}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--widths", type=int, nargs="+", default=[16, 20, 40, 64, 100])
+    parser.add_argument("--layers", type=int, default=2, help="circuit depth is `layers * width` gates")
+    parser.add_argument("--weight-2q", type=float, default=0.1)
+    parser.add_argument("--max-bond-dimension", type=int, default=64)
+    parser.add_argument("--shots", type=int, default=1000)
+    args = parser.parse_args()
+    bench_mps(args.widths, args.layers, args.weight_2q, args.max_bond_dimension, args.shots)
@@ -0,0 +1,56 @@
+"""Observables benchmark: compares `Observable` expectation values with Qiskit `Statevector.expectation_value` per term"""
+
+import argparse
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.observable import Observable
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.random_generator import RandomGenerator
+
+
+def bench_observables(widths: list, n_terms: int, locality: int) -> None:
+    """Prints time of all terms expectation values for random `locality`-local Pauli strings and for Ising-like Z strings"""
+    rand_gen = RandomGenerator()
+    for width in widths:
+        circuit = QuantumCircuit(width=width, depth=2 * width, weight_2q=0.5)
+        circuit.generate_gates_and_unite()
+        state_vector = CustomQuantumEmulator().execute(circuit)
+        qiskit_state_vector = state_vector.to_qiskit()
+
+        local_labels = []
+        for _ in range(n_terms):
+            label = ["I"] * width
+            for _ in range(locality):
+                label[rand_gen.rand_int() % width] = "XYZ"[rand_gen.rand_int() % 3]
+            local_labels.append("".join(label))
+        ising_labels = [
+            "".join("Z" if qubit in (q1, (q1 + shift) % width) else "I" for qubit in range(width))
+            for q1 in range(width)
+            for shift in range(1, n_terms // width + 1)
+        ]
+
+        for name, labels in [("local", local_labels), ("ising", ising_labels)]:
+            observable = Observable([(label, 1) for label in labels])
+            start = time.perf_counter()
+            observable.term_expectation_values(state_vector)
+            observable_time = time.perf_counter() - start
+
+            qiskit_operators = [Observable([(label, 1)]).to_qiskit() for label in labels]
+            start = time.perf_counter()
+            for qiskit_operator in qiskit_operators:
+                qiskit_state_vector.expectation_value(qiskit_operator)
+            qiskit_time = time.perf_counter() - start
+            print(
+                f"width={width:2d} terms={len(labels):5d} kind={name} x_groups={len(set(observable.x_masks.tolist())):5d} "
+                f"observable={observable_time:8.3f} s qiskit={qiskit_time:8.3f} s speedup={qiskit_time / observable_time:6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--widths", type=int, nargs="+", default=[10, 16, 20])
+    parser.add_argument("--terms", type=int, default=400)
+    parser.add_argument("--locality", type=int, default=2)
+    args = parser.parse_args()
+    bench_observables(args.widths, args.terms, args.locality)
@@ -0,0 +1,40 @@
+"""Precision benchmark: compares `complex64` and `complex128` `CustomQuantumEmulator` time, memory and fidelity drift on deep random circuits"""
+
+import argparse
+import time
+
+import numpy as np
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.qiskit_quantum_emulator import QiskitQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+
+
+def bench_precision(width: int, depths: list, weight_2q: float) -> None:
+    """Prints execution time, state size and infidelity against double precision `QiskitQuantumEmulator` result for each depth"""
+    for depth in depths:
+        circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q)
+        circuit.generate_gates_and_unite()
+        reference = QiskitQuantumEmulator().execute(circuit).vector
+        for dtype in [np.complex128, np.complex64]:
+            start = time.perf_counter()
+            result = CustomQuantumEmulator(dtype=dtype).execute(circuit)
+            elapsed = time.perf_counter() - start
+            vector = result.vector.astype(np.complex128)
+            norm = np.linalg.norm(vector)
+            # infidelity of the normalized state, norm drift is reported separately
+            infidelity = 1 - np.abs(np.vdot(reference, vector)) ** 2 / norm**2
+            norm_drift = abs(1 - norm)
+            print(
+                f"width={width} depth={depth:6d} dtype={np.dtype(dtype).name:10s} time={elapsed:8.3f} s "
+                f"state={result.nbytes / 2**20:8.1f} MB infidelity={infidelity:.3e} norm drift={norm_drift:.3e}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=16)
+    parser.add_argument("--depths", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--weight-2q", type=float, default=0.3)
+    args = parser.parse_args()
+    bench_precision(args.width, args.depths, args.weight_2q)
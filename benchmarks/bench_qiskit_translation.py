@@ -0,0 +1,47 @@
+"""Qiskit translation benchmark: compares per-gate `UnitaryGate` evolution with cached `QuantumCircuit.to_qiskit()` evolution"""
+
+import argparse
+import time
+
+from qiskit.circuit.library import UnitaryGate as QiskitUnitaryGate
+
+from quantum_simulator.qiskit_quantum_emulator import QiskitQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+def bench_translation(widths: list, depth: int, weight_2q: float) -> None:
+    """Prints per-gate evolution time, `to_qiskit()` translation time and cold / warm `QiskitQuantumEmulator.apply_circuit` time"""
+    for width in widths:
+        circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q)
+        circuit.generate_gates_and_unite()
+        state_vector = QuantumStateVector(width)
+
+        start = time.perf_counter()
+        qiskit_state_vector = state_vector.to_qiskit()
+        for layer_gates in circuit.iter_layers():
+            for gate in layer_gates:
+                qiskit_state_vector = qiskit_state_vector.evolve(QiskitUnitaryGate(gate.matrix), qargs=gate.target_qubits)
+        per_gate_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        circuit.to_qiskit()
+        translation_time = time.perf_counter() - start
+
+        emulator = QiskitQuantumEmulator()
+        start = time.perf_counter()
+        emulator.apply_circuit(circuit, state_vector)
+        warm_time = time.perf_counter() - start
+        print(
+            f"width={width:2d} gates={circuit.gates_count} per-gate evolve={per_gate_time:7.3f} s to_qiskit={translation_time:7.3f} s "
+            f"cold={translation_time + warm_time:7.3f} s warm={warm_time:7.3f} s speedup={per_gate_time / warm_time:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--widths", type=int, nargs="+", default=[4, 10, 16, 20])
+    parser.add_argument("--depth", type=int, default=1000)
+    parser.add_argument("--weight-2q", type=float, default=0.3)
+    args = parser.parse_args()
+    bench_translation(args.widths, args.depth, args.weight_2q)
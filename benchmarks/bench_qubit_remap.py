@@ -0,0 +1,52 @@
+"""Qubit remapping benchmark: compares `CustomQuantumEmulator` circuit execution without and with `remap_qubits` scheduling"""
+
+import argparse
+import time
+
+import numpy as np
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_operation import OneQubitOperation, TwoQubitsOperation
+from quantum_simulator.random_generator import RandomGenerator
+
+
+def hot_qubits_circuit(width: int, depth: int) -> QuantumCircuit:
+    """Returns circuit of random 1-qubit gates on qubits 1..3 and CZ gates on qubits 2 and 3"""
+    rand_gen = RandomGenerator()
+    circuit = QuantumCircuit(width=width, depth=0, weight_2q=0)
+    for index in range(depth):
+        if index % 4 == 3:
+            circuit.append_gate(TwoQubitsOperation.CZ([2, 3]))
+        else:
+            circuit.append_gate(OneQubitOperation(rand_gen.rand_unitary("1q"), [1 + index % 3]))
+    return circuit
+
+
+def bench_qubit_remap(widths: list, depth: int, layer_block_qubits: list) -> None:
+    """Prints circuit execution time of random and hot qubits circuits without and with qubits remapping"""
+    for width in widths:
+        random_circuit = QuantumCircuit(width=width, depth=depth, weight_2q=0.5)
+        random_circuit.generate_gates_and_unite()
+        for name, circuit in [("random", random_circuit), ("hot", hot_qubits_circuit(width, depth))]:
+            for block_qubits in layer_block_qubits:
+                times, results = [], []
+                for remap_qubits in [False, True]:
+                    emulator = CustomQuantumEmulator(layer_block_qubits=block_qubits, remap_qubits=remap_qubits)
+                    start = time.perf_counter()
+                    results.append(emulator.execute(circuit).vector)
+                    times.append(time.perf_counter() - start)
+                assert np.allclose(results[0], results[1])
+                print(
+                    f"width={width:2d} circuit={name:6s} layer_block_qubits={block_qubits} "
+                    f"original={times[0]:7.3f} s remapped={times[1]:7.3f} s speedup={times[0] / times[1]:5.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--widths", type=int, nargs="+", default=[16, 20, 22])
+    parser.add_argument("--depth", type=int, default=60)
+    parser.add_argument("--layer-block-qubits", type=int, nargs="+", default=[1, 5])
+    args = parser.parse_args()
+    bench_qubit_remap(args.widths, args.depth, args.layer_block_qubits)
@@ -0,0 +1,36 @@
+"""Random generator benchmark: compares sequential `rand_int()` / `rand()` calls with bulk `rand_ints()` / `rands()` draws"""
+
+import argparse
+import time
+
+from quantum_simulator.random_generator import RandomGenerator
+
+
+def bench_random_generator(sizes: list) -> None:
+    """Prints sequential and bulk generation time for each number of values"""
+    for n in sizes:
+        rand_gen = RandomGenerator()
+        start = time.perf_counter()
+        for _ in range(n):
+            rand_gen.rand(L=100)
+        sequential_time = time.perf_counter() - start
+
+        rand_gen = RandomGenerator()
+        start = time.perf_counter()
+        rand_gen.rands(n, L=100)
+        bulk_time = time.perf_counter() - start
+
+        rand_gen = RandomGenerator()
+        start = time.perf_counter()
+        rand_gen.skip(n)
+        skip_time = time.perf_counter() - start
+        print(
+            f"n={n:9d} sequential={sequential_time:8.4f} s bulk={bulk_time:8.4f} s speedup={sequential_time / bulk_time:7.1f}x skip={skip_time * 1e6:6.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 10000000])
+    args = parser.parse_args()
+    bench_random_generator(args.sizes)
@@ -0,0 +1,40 @@
+"""Shared memory benchmark: compares circuit application by a single process, worker threads and shared memory worker processes"""
+
+import argparse
+import os
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.shared_memory_quantum_emulator import SharedMemoryQuantumEmulator
+
+
+def bench_shared_memory(widths: list, depth: int, workers: list) -> None:
+    """Prints `execute` wall time and speedup over a single process for threads and processes of each count"""
+    for width in widths:
+        circuit = QuantumCircuit(width=width, depth=depth, weight_2q=0.3, seed=0)
+        circuit.generate_gates_and_unite()
+        print(f"width={width} gates={circuit.gates_count} state={2**width * 16 / 2**20:.0f} MiB")
+
+        start = time.perf_counter()
+        CustomQuantumEmulator().execute(circuit)
+        single_time = time.perf_counter() - start
+        print(f"  single process        time={single_time:8.3f} s")
+        for n_workers in workers:
+            for name, emulator in [("threads", CustomQuantumEmulator(n_workers=n_workers)), ("processes", SharedMemoryQuantumEmulator(n_workers=n_workers))]:
+                # the first circuit starts the worker processes
+                emulator.execute(QuantumCircuit(width, 0, 0.0))
+                start = time.perf_counter()
+                emulator.execute(circuit)
+                elapsed = time.perf_counter() - start
+                print(f"  {name:9s} n_workers={n_workers:2d} time={elapsed:8.3f} s speedup={single_time / elapsed:5.2f}x")
+                emulator.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--widths", type=int, nargs="+", default=[20, 24])
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({2, os.cpu_count() or 1}))
+    args = parser.parse_args()
+    bench_shared_memory(args.widths, args.depth, args.workers)
@@ -0,0 +1,35 @@
+"""Shots sampling benchmark: measures `execute_shots` sampling time on a random circuit final state"""
+
+import argparse
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+
+
+def bench_shots(width: int, depth: int, shots: list) -> None:
+    """Prints circuit simulation time, raw shots sampling time and counts building time"""
+    circuit = QuantumCircuit(width=width, depth=depth, weight_2q=0.3)
+    circuit.generate_gates_and_unite()
+
+    start = time.perf_counter()
+    state_vector = CustomQuantumEmulator().execute(circuit)
+    print(f"width={width} depth={depth} simulation={time.perf_counter() - start:.3f} s")
+
+    for n_shots in shots:
+        start = time.perf_counter()
+        state_vector.sample(n_shots, seed=1)
+        sample_time = time.perf_counter() - start
+        start = time.perf_counter()
+        counts = state_vector.sample_counts(n_shots, seed=1)
+        counts_time = time.perf_counter() - start
+        print(f"shots={n_shots:8d} sample={sample_time * 1e3:8.2f} ms sample_counts={counts_time * 1e3:8.2f} ms distinct={len(counts)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=200)
+    parser.add_argument("--shots", type=int, nargs="+", default=[1000, 100000, 1000000])
+    args = parser.parse_args()
+    bench_shots(args.width, args.depth, args.shots)
@@ -0,0 +1,56 @@
+"""Stabilizer benchmark: compares Clifford circuits shots sampling on state vectors and on `StabilizerTableau`"""
+
+import argparse
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_operation import OneQubitOperation, TwoQubitsOperation
+from quantum_simulator.random_generator import RandomGenerator
+from quantum_simulator.stabilizer_quantum_emulator import StabilizerQuantumEmulator
+
+
+def clifford_circuit(width: int, depth: int, seed: int = 27) -> QuantumCircuit:
+    """Returns circuit of a Hadamard layer followed by `depth` random H, X, Z, CX and CZ gates"""
+    rand_gen = RandomGenerator(seed=seed)
+    gates = [OneQubitOperation.H, OneQubitOperation.X, OneQubitOperation.Z, TwoQubitsOperation.CX, TwoQubitsOperation.CZ]
+    circuit = QuantumCircuit(width, 0, 0.0)
+    for qubit in range(width):
+        circuit.append_gate(OneQubitOperation.H([qubit]))
+    for _ in range(depth):
+        gate = gates[rand_gen.rand_int() % len(gates)]
+        qubit = rand_gen.rand_int() % width
+        other = (qubit + 1 + rand_gen.rand_int() % (width - 1)) % width
+        circuit.append_gate(gate([qubit]) if gate in gates[:3] else gate([qubit, other]))
+    return circuit
+
+
+def bench_stabilizer(widths: list, state_vector_widths: list, depth_per_qubit: int, n_shots: int) -> None:
+    """Prints `execute_shots` time of Clifford circuits by state vector emulator (routing disabled) and stabilizer emulator"""
+    state_vector_emulator = CustomQuantumEmulator()
+    state_vector_emulator.route_clifford = False
+    stabilizer_emulator = StabilizerQuantumEmulator()
+    for width in sorted(set(widths) | set(state_vector_widths)):
+        circuit = clifford_circuit(width, depth_per_qubit * width)
+        line = f"width={width:5d} gates={circuit.gates_count:6d}"
+        if width in state_vector_widths:
+            start = time.perf_counter()
+            state_vector_emulator.execute_shots(circuit, n_shots, seed=1)
+            line += f" state_vector={time.perf_counter() - start:8.3f} s"
+        start = time.perf_counter()
+        tableau = stabilizer_emulator.execute_tableau(circuit)
+        tableau_time = time.perf_counter() - start
+        start = time.perf_counter()
+        tableau.sample_counts(n_shots, seed=1)
+        line += f" tableau={tableau_time:8.3f} s shots={time.perf_counter() - start:8.3f} s memory={tableau.nbytes / 2**20:7.2f} MiB"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--widths", type=int, nargs="+", default=[100, 1000, 2000])
+    parser.add_argument("--state-vector-widths", type=int, nargs="+", default=[16, 20, 24])
+    parser.add_argument("--depth-per-qubit", type=int, default=5)
+    parser.add_argument("--n-shots", type=int, default=10000)
+    args = parser.parse_args()
+    bench_stabilizer(args.widths, args.state_vector_widths, args.depth_per_qubit, args.n_shots)
@@ -0,0 +1,36 @@
+"""Sweep benchmark: compares `SweepRunner` ensembles run time by worker processes count and pickled job size with pickled circuits"""
+
+import argparse
+import os
+import pickle
+import tempfile
+import time
+
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.sweep_runner import SweepRunner
+
+
+def bench_sweep(widths: list, depth: int, n_seeds: int, workers: list) -> None:
+    """Prints ensemble sweep time and jobs per second for every workers count"""
+    job = {"emulator": "custom", "width": max(widths), "depth": depth, "weight_2q": 0.5, "seed": 0}
+    circuit = QuantumCircuit(width=max(widths), depth=depth, weight_2q=0.5, seed=0)
+    circuit.generate_gates_and_unite()
+    print(f"pickled job={len(pickle.dumps(job))} B pickled circuit={len(pickle.dumps(circuit))} B")
+
+    for n_workers in workers:
+        with tempfile.TemporaryDirectory() as directory:
+            runner = SweepRunner(os.path.join(directory, "results.jsonl"), ["custom"], n_workers=n_workers)
+            start = time.perf_counter()
+            records = runner.run(widths, [depth], [0.1, 0.5], list(range(n_seeds)))
+            sweep_time = time.perf_counter() - start
+        print(f"workers={n_workers:2d} jobs={len(records):5d} time={sweep_time:8.3f} s jobs_per_s={len(records) / sweep_time:8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--widths", type=int, nargs="+", default=[8, 12, 16])
+    parser.add_argument("--depth", type=int, default=200)
+    parser.add_argument("--n-seeds", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, os.cpu_count() or 1])
+    args = parser.parse_args()
+    bench_sweep(args.widths, args.depth, args.n_seeds, args.workers)
@@ -0,0 +1,35 @@
+"""Threads scaling benchmark: measures `CustomQuantumEmulator` circuit application time for different worker counts"""
+
+import argparse
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+def bench_threads(width: int, depth: int, workers: list) -> None:
+    """Prints `apply_circuit` wall time and speedup over a single worker for each worker count"""
+    circuit = QuantumCircuit(width=width, depth=depth, weight_2q=0.3)
+    circuit.generate_gates_and_unite()
+    state_vector = QuantumStateVector(width)
+    print(f"width={width} depth={depth}")
+
+    single_time = None
+    for n_workers in workers:
+        emulator = CustomQuantumEmulator(n_workers=n_workers)
+        start = time.perf_counter()
+        emulator.apply_circuit(circuit, state_vector)
+        elapsed = time.perf_counter() - start
+        emulator.close()
+        single_time = single_time or elapsed
+        print(f"n_workers={n_workers:2d} time={elapsed:7.3f} s speedup={single_time / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=24)
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+    bench_threads(args.width, args.depth, args.workers)
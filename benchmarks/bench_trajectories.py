@@ -0,0 +1,46 @@
+"""Trajectories benchmark: measures `TrajectorySimulator` trajectory time of noise models against noiseless execution and by worker processes count"""
+
+import argparse
+import os
+import time
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.noise_model import NoiseModel
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.trajectory_simulator import TrajectorySimulator
+
+
+def bench_trajectories(width: int, depth: int, n_trajectories: int, workers: list) -> None:
+    """Prints time per trajectory of every noise model and workers count, and noiseless circuit execution time"""
+    circuit = QuantumCircuit(width=width, depth=depth, weight_2q=0.3, seed=0)
+    circuit.generate_gates_and_unite()
+
+    start = time.perf_counter()
+    CustomQuantumEmulator().execute(circuit)
+    print(f"width={width} gates={circuit.gates_count} noiseless execute={(time.perf_counter() - start) * 1e3:8.2f} ms")
+
+    models = {
+        "depolarizing": NoiseModel().add_depolarizing(0.01).add_readout_error(0.02),
+        "depolarizing+damping_2q": NoiseModel().add_depolarizing(0.01).add_amplitude_damping(0.01, gate_kinds=["2q"]).add_readout_error(0.02),
+        "depolarizing+damping": NoiseModel().add_depolarizing(0.01).add_amplitude_damping(0.01).add_readout_error(0.02),
+    }
+    for name, model in models.items():
+        for n_workers in workers:
+            simulator = TrajectorySimulator(model, n_trajectories=n_trajectories, n_workers=n_workers)
+            start = time.perf_counter()
+            simulator.execute_shots(circuit, 10 * n_trajectories, seed=1)
+            run_time = time.perf_counter() - start
+            print(
+                f"{name:24s} workers={n_workers:2d} trajectories={n_trajectories:5d} time={run_time:8.3f} s "
+                f"per_trajectory={run_time / n_trajectories * 1e3:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=12)
+    parser.add_argument("--depth", type=int, default=200)
+    parser.add_argument("--n-trajectories", type=int, default=100)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+    bench_trajectories(args.width, args.depth, args.n_trajectories, args.workers)
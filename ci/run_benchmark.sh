@@ -0,0 +1 @@
+cd "$(dirname "$0")/.." && python -m quantum_simulator.emulator_benchmark --json ./benchmark_results.json --csv ./benchmark_results.csv "$@"
\ No newline at end of file
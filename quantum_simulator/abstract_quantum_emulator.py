@@ -1,15 +1,28 @@
 """Abstract quantum emulator module"""
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Dict, List, Union
+
+from quantum_simulator.instrumentation import Instrumentation
+from quantum_simulator.observable import Observable
 from quantum_simulator.quantum_circuit import QuantumCircuit
 from quantum_simulator.quantum_operation import QuantumOperation
 from quantum_simulator.quantum_state_vector import QuantumStateVector
+from quantum_simulator.stabilizer_tableau import StabilizerTableau
 
 
 class AbstractQuantumEmulator(ABC):
     """Abstract quantum emulator class"""
 
+    instrumentation: Instrumentation = None
+    "Instrumentation recording applied gates and circuits, `None` (default) to disable"
+
+    route_clifford: bool = True
+    "Sample shots and evaluate expectation values of Clifford-only circuits on `StabilizerTableau` instead of a state vector"
+
     @abstractmethod
     def apply_gate(self, operation: QuantumOperation, state_vector: QuantumStateVector) -> QuantumStateVector:
         """Applies quantum operation to a given state vector"""
@@ -18,12 +31,33 @@ class AbstractQuantumEmulator(ABC):
     def apply_circuit(self, circuit: QuantumCircuit, state_vector: QuantumStateVector) -> QuantumStateVector:
         """Applies quantum circuit to a given state vector"""
 
-    # TODO clarify function arguments
+    def apply_circuit_batch(self, circuit: QuantumCircuit, state_vectors: List[QuantumStateVector]) -> List[QuantumStateVector]:
+        """Applies quantum circuit to each of the given state vectors"""
+        return [self.apply_circuit(circuit, state_vector) for state_vector in state_vectors]
+
     @abstractmethod
-    def execute(self, circuit: QuantumCircuit):
-        """Executes given circuit"""
+    def execute(self, circuit: QuantumCircuit) -> QuantumStateVector:
+        """Executes given circuit on |0...0⟩ state. Returns final state vector"""
 
-    # TODO clarify function arguments
     @abstractmethod
-    def execute_shots(self, circuit: QuantumCircuit, n_shots: int):
-        """Executes shots using given circuit"""
+    def execute_shots(self, circuit: QuantumCircuit, n_shots: int, seed: int = None) -> Dict[str, int]:
+        """Executes shots using given circuit. Returns `{bitstring: count}` of the measured bitstrings"""
+
+    def expectation_value(self, circuit: QuantumCircuit, observable: Observable) -> Union[float, complex]:
+        """Executes given circuit on |0...0⟩ state. Returns ⟨ψ|H|ψ⟩ of the final state and `observable` H"""
+        tableau = self._clifford_tableau(circuit)
+        if tableau is not None:
+            return tableau.expectation_value(observable)
+        return observable.expectation_value(self.execute(circuit))
+
+    def _clifford_tableau(self, circuit: QuantumCircuit) -> StabilizerTableau:
+        """Returns stabilizer tableau of the executed circuit if `route_clifford` is set and the circuit is Clifford-only, `None` otherwise"""
+        if not self.route_clifford:
+            return None
+        return StabilizerTableau.from_circuit(circuit)
+
+    def _circuit_span(self, name: str, **args):
+        """Returns `instrumentation` circuit span context manager, no-op context manager if instrumentation is disabled"""
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.circuit(name, **args)
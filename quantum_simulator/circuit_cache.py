@@ -0,0 +1,139 @@
+"""Persistent compiled circuits cache module"""
+
+import hashlib
+import os
+import tempfile
+import zipfile
+
+from quantum_simulator.quantum_circuit import QuantumCircuit
+
+
+class CircuitCache:
+    """
+    Content-addressed on-disk cache of generated and fused circuits
+
+    Circuits are stored by `QuantumCircuit.save()` as `<key>.npz` files of `directory`. Keys are SHA-256 hashes of the random
+    circuit generator parameters (`generate`) or of the gates data (`fuse`). Files are evicted in least recently used order
+    (by modification time, updated on every hit) when their total size exceeds `max_bytes`. Files are written atomically,
+    so the cache directory can be shared by concurrent jobs
+    """
+
+    FORMAT_VERSION: int = 1
+    "Version of the cached circuits format and generation algorithm. Part of every key"
+
+    directory: str
+    "Cache directory"
+
+    max_bytes: int
+    "Max total size of the cached circuit files"
+
+    hits: int
+    "Number of circuits loaded from the cache"
+
+    misses: int
+    "Number of circuits `generate` and `fuse` built and stored to the cache"
+
+    def __init__(self, directory: str, max_bytes: int = 2**30):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self.directory = str(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def generate(self, width: int, depth: int, weight_2q: float, seed: int = 27, fuse: bool = False) -> QuantumCircuit:
+        """
+        Returns `QuantumCircuit(width, depth, weight_2q, seed)` with generated gates (and fused, if `fuse` is set)
+
+        Circuit is loaded from the cache if present, otherwise it is generated and stored
+        """
+        key = self.params_key(width, depth, weight_2q, seed, fuse)
+        circuit = self.get(key)
+        if circuit is None:
+            circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q, seed=seed)
+            circuit.generate_gates_and_unite()
+            if fuse:
+                circuit = circuit.fuse_gates()
+            self.misses += 1
+            self.put(key, circuit)
+        return circuit
+
+    def fuse(self, circuit: QuantumCircuit) -> QuantumCircuit:
+        """Returns `circuit.fuse_gates()` result. Fused circuit is loaded from the cache by the hash of `circuit` gates data if present"""
+        key = self.content_key(circuit, "fused")
+        fused = self.get(key)
+        if fused is None:
+            fused = circuit.fuse_gates()
+            self.misses += 1
+            self.put(key, fused)
+        return fused
+
+    def get(self, key: str) -> QuantumCircuit:
+        """Returns cached circuit stored with `key`, `None` if it is absent"""
+        path = self._path(key)
+        try:
+            circuit = QuantumCircuit.load(path)
+            os.utime(path)
+        except (FileNotFoundError, zipfile.BadZipFile, KeyError, ValueError):
+            # absent, evicted by a concurrent job or damaged file is a miss
+            return None
+        self.hits += 1
+        return circuit
+
+    def put(self, key: str, circuit: QuantumCircuit) -> None:
+        """Stores `circuit` with `key` and evicts least recently used circuits exceeding `max_bytes`"""
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                circuit.save(file)
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes least recently used circuits until total size of the cached files does not exceed `max_bytes`"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npz"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    @property
+    def size(self) -> int:
+        """Returns total size of the cached circuit files in bytes"""
+        return sum(entry.stat().st_size for entry in os.scandir(self.directory) if entry.name.endswith(".npz"))
+
+    @staticmethod
+    def params_key(width: int, depth: int, weight_2q: float, seed: int, fuse: bool = False) -> str:
+        """Returns cache key of the random circuit generator parameters"""
+        params = f"v{CircuitCache.FORMAT_VERSION}:generate:{int(width)}:{int(depth)}:{float(weight_2q)!r}:{int(seed)}:{bool(fuse)}"
+        return hashlib.sha256(params.encode()).hexdigest()
+
+    @staticmethod
+    def content_key(circuit: QuantumCircuit, tag: str = "") -> str:
+        """Returns cache key of the `circuit` width and gates data (matrices, targets and layers), prefixed by `tag`"""
+        digest = hashlib.sha256(f"v{CircuitCache.FORMAT_VERSION}:{tag}:{circuit.width}:".encode())
+        for array in [circuit.gate_matrices, circuit.gate_offsets, circuit.gate_targets, circuit.gate_layer]:
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Returns cached circuit file path"""
+        return os.path.join(self.directory, f"{key}.npz")
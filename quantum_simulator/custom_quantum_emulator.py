@@ -1,19 +1,94 @@
 """Custom quantum emulator module"""
 
-# TODO: typing.List is deprecated since Python 3.9. Use list after version update
-from typing import List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from itertools import islice, product
+
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Dict, Iterable, Iterator, List
+
+import numpy as np
 
 from quantum_simulator.abstract_quantum_emulator import AbstractQuantumEmulator
 from quantum_simulator.quantum_circuit import QuantumCircuit
-from quantum_simulator.quantum_operation import QuantumOperation
+from quantum_simulator.quantum_operation import QuantumOperation, TwoQubitsOperation
 from quantum_simulator.quantum_state_vector import QuantumStateVector
 
 
 class CustomQuantumEmulator(AbstractQuantumEmulator):
-    """Custom quantum emulator class"""
+    """
+    Custom quantum emulator class
+
+    Gates are applied by NumPy kernels working in place on the state vector reshaped to a rank-n tensor of shape `(2,) * n`.
+    Qubit `k` corresponds to the tensor axis `n - 1 - k`, which keeps the `QuantumStateVector` qubit indexing convention.
+    Kernels count axes from the end, so a batch of states can be processed as a `(batch,) + (2,) * n` tensor.
+    Diagonal gates only multiply amplitudes by phases and permutation gates only move amplitudes, skipping the unchanged ones
+    (see `QuantumOperation.classify`).
+
+    With `n_workers > 1` states of at least `PARALLEL_MIN_QUBITS` qubits are split into disjoint chunks by fixing the highest
+    non-targeted qubits, and the chunks are processed by a thread pool. NumPy releases the GIL inside the kernels.
+    The pool is started by the first split gate and kept until `close`.
+
+    States are simulated in their own precision: gate matrices are cast to the state dtype, so `complex64` states are not
+    upcast. `dtype` is the precision of the states created by `execute` and `execute_shots`.
+
+    Memory-mapped states (see `QuantumStateVector.from_file`) are processed by `apply_circuit_inplace` in passes over the file.
+    Each pass holds `chunk_qubits`-qubit chunks in memory one by one and applies to each chunk all gates scheduled to the pass.
+
+    NumPy kernels are slowest on the low qubits above qubit 0: their amplitudes blocks are contiguous runs of only 2..16
+    amplitudes. With `remap_qubits` circuit blocks are applied to a logical-to-physical permutation of the qubits, moving
+    qubits used soon out of the `SLOW_QUBITS` by SWAP passes over the state, and the final state is swapped back to the
+    `QuantumStateVector` qubit indexing.
+
+    With `instrumentation` set every applied gate is recorded: single gates of `apply_gate`, united layer blocks of `apply_circuit`
+    and blocks applied to each chunk of memory-mapped states. Gates split between worker threads are recorded once.
+    """
+
+    PARALLEL_MIN_QUBITS: int = 16
+    "States (or batches of states) with less than `2**PARALLEL_MIN_QUBITS` amplitudes are processed by the calling thread"
+
+    SLOW_QUBITS: range = range(1, 5)
+    "Physical qubits with short contiguous amplitudes runs, avoided by `remap_qubits` scheduling"
 
-    def __init__(self):
-        pass
+    REMAP_MIN_QUBITS: int = 16
+    "States (or batches of states) with less than `2**REMAP_MIN_QUBITS` amplitudes are not remapped"
+
+    REMAP_LOOKAHEAD: int = 16
+    "Number of upcoming circuit blocks considered by `remap_qubits` scheduling"
+
+    layer_block_qubits: int
+    "Max number of qubits of the disjoint layer gates united into a single sweep over the state"
+
+    n_workers: int
+    "Number of threads applying gates to disjoint state chunks"
+
+    chunk_qubits: int
+    "Number of qubits of the chunks of memory-mapped states held in memory"
+
+    dtype: np.dtype
+    "Amplitudes dtype of the executed circuits states - `complex128` or `complex64` (half memory and bandwidth)"
+
+    remap_qubits: bool
+    "Whether to schedule circuit blocks on remapped qubits, keeping frequently used qubits out of `SLOW_QUBITS`"
+
+    _executor: ThreadPoolExecutor = None
+    "Thread pool used when `n_workers > 1`, started by the first split gate"
+
+    def __init__(self, layer_block_qubits: int = 5, n_workers: int = 1, chunk_qubits: int = 20, dtype: type = np.complex128, remap_qubits: bool = False):
+        if layer_block_qubits < 1:
+            raise ValueError("layer_block_qubits must be not less than one")
+        if n_workers < 1:
+            raise ValueError("n_workers must be not less than one")
+        if chunk_qubits < 2:
+            raise ValueError("chunk_qubits must be not less than two")
+        if np.dtype(dtype) not in QuantumStateVector.SUPPORTED_DTYPES:
+            raise TypeError(f"Unsupported dtype {dtype}. Should be one of {QuantumStateVector.SUPPORTED_DTYPES}")
+        self.layer_block_qubits = layer_block_qubits
+        self.n_workers = n_workers
+        self.chunk_qubits = chunk_qubits
+        self.dtype = np.dtype(dtype)
+        self.remap_qubits = remap_qubits
 
     def apply_gate(self, operation: QuantumOperation, state_vector: QuantumStateVector) -> QuantumStateVector:
         """Applies quantum operation to a given state vector"""
@@ -22,78 +97,392 @@ class CustomQuantumEmulator(AbstractQuantumEmulator):
         if any(id >= state_vector.num_qubits for id in target_qubits):
             # raise OperandOutOfBoundsError(operation, state_vector.num_qubits)
             raise ValueError()
-
-        output = None
-        if len(target_qubits) == 1:
-            output = self._apply1Q(state_vector, operation)
-        elif len(target_qubits) == 2:
-            output = self._apply2Q(state_vector, operation)
-        else:
+        if len(target_qubits) not in (1, 2):
             # raise UnsupportedNumberOfQubits(operation)
             raise ValueError()
+
+        output = state_vector.copy()
+        structure = (operation.kind, operation.permutation, operation.phases) if isinstance(operation, QuantumOperation) else None
+        self._apply(self._as_tensor(output), operation.matrix, target_qubits, structure)
         return output
 
     def apply_circuit(self, circuit: QuantumCircuit, state_vector: QuantumStateVector) -> QuantumStateVector:
-        """Applies quantum circuit to a given state vector"""
+        """
+        Applies quantum circuit to a given state vector
+
+        Gates of each layer of `circuit.gate_layers` target disjoint qubits, so they are united into blocks of up to
+        `layer_block_qubits` qubits and each block is applied in a single sweep over the state
+        """
+        return self.apply_circuit_inplace(circuit, state_vector.copy())
+
+    def apply_circuit_inplace(self, circuit: QuantumCircuit, state_vector: QuantumStateVector) -> QuantumStateVector:
+        """
+        Applies quantum circuit to a given state vector in place. Returns the same state vector
+
+        Memory-mapped states are processed chunk by chunk, so only `2**chunk_qubits` amplitudes are held in memory at once
+        """
         if circuit.width != state_vector.num_qubits:
             raise ValueError("state_vector and circuit size mismatch")
 
-        output = state_vector
-        for gate in circuit.gates:
-            output = self.apply_gate(gate, output)
-        return output
+        with self._circuit_span("apply_circuit", width=circuit.width, gates=circuit.gates_count):
+            if state_vector.filename is None:
+                self._apply_layers(self._as_tensor(state_vector), circuit)
+            else:
+                self._apply_out_of_core(self._as_tensor(state_vector), circuit)
+                state_vector.flush()
+        return state_vector
+
+    def apply_circuit_batch(self, circuit: QuantumCircuit, state_vectors: List[QuantumStateVector]) -> List[QuantumStateVector]:
+        """
+        Applies quantum circuit to each of the given state vectors
+
+        States are stacked into a single `(batch, 2**n)` array, so each layer block is applied once to the whole batch.
+        Returned state vectors are views of the rows of that array
+        """
+        if any(circuit.width != state_vector.num_qubits for state_vector in state_vectors):
+            raise ValueError("state_vector and circuit size mismatch")
+        if not state_vectors:
+            return []
+
+        dtype = np.result_type(*[state_vector.dtype for state_vector in state_vectors])
+        batch = np.stack([state_vector.vector for state_vector in state_vectors]).astype(dtype, copy=False)
+        with self._circuit_span("apply_circuit_batch", width=circuit.width, gates=circuit.gates_count, batch=len(state_vectors)):
+            self._apply_layers(batch.reshape((len(state_vectors),) + (2,) * circuit.width), circuit)
+        return [QuantumStateVector(vector, dtype=dtype) for vector in batch]
 
-    # TODO clarify function arguments
-    def execute(self, circuit: QuantumCircuit):
-        """Executes given circuit"""
+    def execute(self, circuit: QuantumCircuit) -> QuantumStateVector:
+        """Executes given circuit on |0...0⟩ state. Returns final state vector"""
+        return self.apply_circuit_inplace(circuit, QuantumStateVector(circuit.width, dtype=self.dtype))
 
-    # TODO clarify function arguments
-    def execute_shots(self, circuit: QuantumCircuit, n_shots: int):
-        """Executes shots using given circuit"""
+    def execute_shots(self, circuit: QuantumCircuit, n_shots: int, seed: int = None) -> Dict[str, int]:
+        """
+        Executes shots using given circuit. Returns `{bitstring: count}` of the measured bitstrings
+
+        The circuit is simulated once and all shots are sampled from the final state. Clifford-only circuits are simulated
+        on a stabilizer tableau (see `route_clifford`)
+        """
+        tableau = self._clifford_tableau(circuit)
+        if tableau is not None:
+            return tableau.sample_counts(n_shots, seed)
+        return self.execute(circuit).sample_counts(n_shots, seed)
+
+    def close(self) -> None:
+        """Stops the worker threads. They are started again by the next split gate"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _apply_layers(self, state: np.ndarray, circuit: QuantumCircuit) -> None:
+        """Applies `circuit.gate_layers` to a state tensor `state` in place"""
+        for matrix, target_qubits, structure in self._circuit_blocks(state, circuit):
+            self._apply(state, matrix, target_qubits, structure)
+
+    def _circuit_blocks(self, state: np.ndarray, circuit: QuantumCircuit) -> Iterator[tuple]:
+        """Yields `(matrix, target_qubits, structure)` layer blocks of `circuit` to apply to a state tensor `state` in order"""
+        blocks = (
+            (matrix, target_qubits, QuantumOperation.classify(matrix))
+            for layer_gates in circuit.iter_layers()
+            for matrix, target_qubits in self._unite_layer_gates(layer_gates, self.layer_block_qubits)
+        )
+        if self.remap_qubits and circuit.width > 0 and state.size >= 2**self.REMAP_MIN_QUBITS:
+            blocks = self._remap_blocks(blocks, circuit.width, self.REMAP_LOOKAHEAD)
+        return blocks
 
     @staticmethod
-    def _replace_bit(num: int, loc: int, val: bool) -> int:
-        """Sets bit located at `loc` in `num` to `val`"""
-        if val:
-            return num | (1 << loc)
-        return num & (~(1 << loc))
+    def _remap_blocks(blocks: Iterable[tuple], width: int, lookahead: int) -> Iterator[tuple]:
+        """
+        Schedules `(matrix, target_qubits, structure)` blocks on physical qubits. Yields blocks with physical target qubits
+
+        Blocks on a qubit mapped to one of `SLOW_QUBITS` swap it with the fast qubit not used for the longest time, if the
+        qubit is used again within `lookahead` blocks. Generic blocks of more than two qubits are applied by a tensor
+        contraction, which does not depend on the qubits order, so they do not trigger swaps. Blocks restoring the
+        identity mapping are yielded last
+        """
+        swap = TwoQubitsOperation.SWAP()
+        swap_structure = (swap.kind, swap.permutation, swap.phases)
+        slow = set(CustomQuantumEmulator.SLOW_QUBITS).intersection(range(width))
+        physical = list(range(width))
+        logical = list(range(width))
+
+        blocks = iter(blocks)
+        window = deque(islice(blocks, lookahead + 1))
+        while window:
+            matrix, target_qubits, structure = window.popleft()
+            window.extend(islice(blocks, 1))
+            if structure[0] != QuantumOperation.GENERIC or len(target_qubits) <= 2:
+                for qubit in target_qubits:
+                    if physical[qubit] not in slow or not any(qubit in block[1] for block in window):
+                        continue
+                    next_use = {}
+                    for index, block in enumerate(window):
+                        for used in block[1]:
+                            next_use.setdefault(used, index)
+                    candidates = [logical[fast] for fast in range(width) if fast not in slow and logical[fast] not in target_qubits]
+                    if not candidates:
+                        continue
+                    _, victim = max((next_use.get(candidate, len(window)), candidate) for candidate in candidates)
+                    yield swap.matrix, [physical[qubit], physical[victim]], swap_structure
+                    physical[qubit], physical[victim] = physical[victim], physical[qubit]
+                    logical[physical[qubit]], logical[physical[victim]] = qubit, victim
+            yield matrix, [physical[qubit] for qubit in target_qubits], structure
+
+        for position in range(width):
+            if logical[position] != position:
+                displaced = logical[position]
+                yield swap.matrix, [position, physical[position]], swap_structure
+                physical[displaced] = physical[position]
+                logical[physical[displaced]] = displaced
+                physical[position] = logical[position] = position
+
+    def _apply_out_of_core(self, state: np.ndarray, circuit: QuantumCircuit) -> None:
+        """Applies circuit to a (memory-mapped) state tensor `state` in place by passes over `chunk_qubits`-qubit chunks"""
+        gates = [gate for layer_gates in circuit.iter_layers() for gate in layer_gates]
+        for resident_qubits, pass_gates in self._schedule_passes(gates, circuit.width, self.chunk_qubits):
+            # chunk keeps the order of resident qubits axes, so qubit is renumbered to its rank among resident qubits
+            rank = {qubit: index for index, qubit in enumerate(resident_qubits)}
+            prepared = []
+            for run in self._disjoint_runs(pass_gates):
+                for matrix, target_qubits in self._unite_layer_gates(run, self.layer_block_qubits):
+                    prepared.append((matrix, [rank[qubit] for qubit in target_qubits], QuantumOperation.classify(matrix)))
+
+            # highest qubits vary slowest, so chunks are visited in the file order
+            fixed_axes = [self._qubit_axis(state, qubit) for qubit in reversed(range(circuit.width)) if qubit not in rank]
+            for values in product((0, 1), repeat=len(fixed_axes)):
+                index = [slice(None)] * state.ndim
+                for axis, value in zip(fixed_axes, values):
+                    index[axis] = value
+                view = state[tuple(index)]
+                chunk = np.array(view)
+                for matrix, target_qubits, structure in prepared:
+                    self._apply(chunk, matrix, target_qubits, structure)
+                view[...] = chunk
 
     @staticmethod
-    def _replace_bits(num: int, locs: List[int], vals: List[bool]) -> int:
-        """in 'num', set bits located at 'locs' to values provided in 'vals'"""
-        assert len(locs) == len(vals), f"Number indeces != number of values, got {len(locs)} != {len(vals)}"
-        for loc, val in zip(locs, vals):
-            num = CustomQuantumEmulator._replace_bit(num, loc, val)
-        return num
+    def _disjoint_runs(gates: List[QuantumOperation]) -> list:
+        """Splits `gates` into runs of consecutive gates targeting disjoint qubits (like layers), keeping their order"""
+        runs, used = [], set()
+        for gate in gates:
+            if not runs or not used.isdisjoint(gate.target_qubits):
+                runs.append([])
+                used = set()
+            runs[-1].append(gate)
+            used.update(gate.target_qubits)
+        return runs
 
     @staticmethod
-    def _apply1Q(state: QuantumStateVector, operation: QuantumOperation) -> QuantumStateVector:
-        """Applies 1-qubit gate `operation` to a state vector `state`"""
-        target_qubit_ind = operation.target_qubits[0]
-        output_state = QuantumStateVector([0] * state.length)
-        matrix = operation.matrix
-
-        for state_ind in range(output_state.length):
-            j_k = (state_ind >> target_qubit_ind) & 1
-            for i_k in range(2):
-                running_index = CustomQuantumEmulator._replace_bit(state_ind, target_qubit_ind, i_k)
-                output_state[state_ind] += state[running_index] * matrix[j_k, i_k]
-        return output_state
+    def _schedule_passes(gates: List[QuantumOperation], width: int, chunk_qubits: int) -> list:
+        """
+        Schedules `gates` (in order of application) into passes over a state split into `chunk_qubits`-qubit chunks.
+
+        Returns list of `(resident_qubits, pass_gates)`. Resident qubits of a pass are the lowest qubits (contiguous in memory)
+        and the higher qubits targeted by pass gates. Gate is pulled into the current pass ahead of deferred gates when it
+        does not share qubits with them (so it commutes with them) and its qubits fit into the resident qubits
+        """
+        chunk_qubits = min(chunk_qubits, width)
+        passes = []
+        remaining = list(gates)
+        while remaining:
+            used, blocked = set(), set()
+            pass_gates, deferred = [], []
+            for index, gate in enumerate(remaining):
+                if len(blocked) == width:
+                    deferred.extend(remaining[index:])
+                    break
+                candidate = used.union(gate.target_qubits)
+                if blocked.isdisjoint(gate.target_qubits) and CustomQuantumEmulator._resident_qubits(candidate, chunk_qubits) is not None:
+                    pass_gates.append(gate)
+                    used = candidate
+                else:
+                    deferred.append(gate)
+                    blocked.update(gate.target_qubits)
+            passes.append((CustomQuantumEmulator._resident_qubits(used, chunk_qubits), pass_gates))
+            remaining = deferred
+        return passes
+
+    @staticmethod
+    def _resident_qubits(used_qubits: set, chunk_qubits: int) -> list:
+        """Returns sorted `chunk_qubits` qubits - lowest qubits and all higher `used_qubits`, `None` if `used_qubits` do not fit"""
+        n_low = chunk_qubits
+        high = {qubit for qubit in used_qubits if qubit >= n_low}
+        while n_low > chunk_qubits - len(high):
+            n_low = chunk_qubits - len(high)
+            high = {qubit for qubit in used_qubits if qubit >= n_low}
+        if n_low < 0:
+            return None
+        return list(range(n_low)) + sorted(high)
+
+    def _apply(self, state: np.ndarray, matrix: np.ndarray, target_qubits: List[int], structure: tuple = None) -> None:
+        """
+        Applies gate `matrix` on `target_qubits` to a state tensor `state` in place, using worker threads if enabled
+
+        `structure` is `(kind, permutation, phases)` of `matrix` as returned by `QuantumOperation.classify`.
+        The gate is recorded to `instrumentation` if it is enabled
+        """
+        if self.instrumentation is None:
+            self._apply_split(state, matrix, target_qubits, structure)
+            return
+        with self.instrumentation.gate(state, target_qubits, structure):
+            self._apply_split(state, matrix, target_qubits, structure)
+
+    def _apply_split(self, state: np.ndarray, matrix: np.ndarray, target_qubits: List[int], structure: tuple = None) -> None:
+        """Applies gate `matrix` on `target_qubits` to a state tensor `state` in place, split into chunks of worker threads if enabled"""
+        if self.n_workers == 1 or state.size < 2**self.PARALLEL_MIN_QUBITS:
+            self._apply_matrix(state, matrix, target_qubits, structure)
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.n_workers)
+        chunks = self._split_state(state, target_qubits, self.n_workers)
+        futures = [self._executor.submit(self._apply_matrix, chunk, matrix, chunk_target_qubits, structure) for chunk, chunk_target_qubits in chunks]
+        for future in futures:
+            future.result()
+
+    @staticmethod
+    def _split_state(state: np.ndarray, target_qubits: List[int], n_chunks: int) -> list:
+        """
+        Splits state tensor `state` into at least `n_chunks` disjoint views by fixing the highest qubits not in `target_qubits`.
+
+        Returns list of `(chunk_view, chunk_target_qubits)`. Gates on `target_qubits` can be applied to each chunk independently
+        """
+        # leading batch axis is fixed only if it has size 2, as the highest qubit. Batch entries are independent, so such chunks are valid
+        free_qubits = [qubit for qubit in reversed(range(state.ndim)) if qubit not in target_qubits and state.shape[-1 - qubit] == 2]
+        n_fixed = min(max(n_chunks - 1, 0).bit_length(), len(free_qubits))
+        fixed_qubits = free_qubits[:n_fixed]
+        chunk_target_qubits = [qubit - sum(fixed < qubit for fixed in fixed_qubits) for qubit in target_qubits]
+        return [(chunk, chunk_target_qubits) for chunk in CustomQuantumEmulator._chunk_views(state, fixed_qubits)]
 
     @staticmethod
-    def _apply2Q(state: QuantumStateVector, operation: QuantumOperation) -> QuantumStateVector:
-        """Applies 1-qubit gate `operation` to a state vector `state`"""
-        qubit1_index, qubit2_index = operation.target_qubits
-        output_state = QuantumStateVector([0] * state.length)
-        matrix = operation.matrix
-
-        for state_ind in range(output_state.length):
-            j_k1 = (state_ind >> qubit1_index) & 1
-            j_k2 = (state_ind >> qubit2_index) & 1
-            bra = int(f"{j_k2}{j_k1}", base=2)
-            for i_k1 in range(2):
-                for i_k2 in range(2):
-                    running_index = CustomQuantumEmulator._replace_bits(state_ind, [qubit1_index, qubit2_index], [i_k1, i_k2])
-                    ket = int(f"{i_k2}{i_k1}", base=2)
-                    output_state[state_ind] += state[running_index] * matrix[bra, ket]
-        return output_state
+    def _chunk_views(state: np.ndarray, fixed_qubits: List[int]) -> List[np.ndarray]:
+        """Returns `2**len(fixed_qubits)` disjoint views of a state tensor `state` with every combination of `fixed_qubits` values"""
+        fixed_axes = [CustomQuantumEmulator._qubit_axis(state, qubit) for qubit in fixed_qubits]
+        chunks = []
+        for values in product((0, 1), repeat=len(fixed_qubits)):
+            index = [slice(None)] * state.ndim
+            for axis, value in zip(fixed_axes, values):
+                index[axis] = value
+            chunks.append(state[tuple(index)])
+        return chunks
+
+    @staticmethod
+    def _as_tensor(state_vector: QuantumStateVector) -> np.ndarray:
+        """Returns `(2,) * n` tensor view of the state vector amplitudes"""
+        return state_vector.vector.reshape((2,) * state_vector.num_qubits)
+
+    @staticmethod
+    def _unite_layer_gates(layer_gates: List[QuantumOperation], max_qubits: int) -> list:
+        """
+        Unites disjoint gates of a single layer into blocks of up to `max_qubits` qubits.
+
+        Returns list of `(block_matrix, block_target_qubits)`. Block matrix is a Kronecker product of the gate matrices,
+        with the first gate targets being the lowest bits of the block matrix index
+        """
+        blocks = []
+        block_gates = []
+        block_size = 0
+        for gate in layer_gates:
+            gate_size = len(gate.target_qubits)
+            if block_gates and block_size + gate_size > max_qubits:
+                blocks.append(block_gates)
+                block_gates, block_size = [], 0
+            block_gates.append(gate)
+            block_size += gate_size
+        if block_gates:
+            blocks.append(block_gates)
+
+        united = []
+        for block in blocks:
+            matrix = reduce(lambda acc, gate: np.kron(gate.matrix, acc), block[1:], block[0].matrix)
+            target_qubits = [qubit for gate in block for qubit in gate.target_qubits]
+            united.append((matrix, target_qubits))
+        return united
+
+    @staticmethod
+    def _qubit_axis(state: np.ndarray, qubit: int) -> int:
+        """Returns axis of the state tensor `state` corresponding to `qubit`"""
+        return state.ndim - 1 - qubit
+
+    @staticmethod
+    def _apply_matrix(state: np.ndarray, matrix: np.ndarray, target_qubits: List[int], structure: tuple = None) -> None:
+        """Applies gate `matrix` with optional `(kind, permutation, phases)` `structure` on `target_qubits` to a state tensor `state` in place"""
+        kind, permutation, phases = structure if structure is not None else (QuantumOperation.GENERIC, None, None)
+        # keep kernels in the state precision
+        matrix = matrix.astype(state.dtype, copy=False)
+        if kind == QuantumOperation.DIAGONAL:
+            CustomQuantumEmulator._applyDiagonal(state, phases, target_qubits)
+        elif kind == QuantumOperation.PERMUTATION:
+            CustomQuantumEmulator._applyPermutation(state, permutation, phases, target_qubits)
+        elif len(target_qubits) == 1:
+            CustomQuantumEmulator._apply1Q(state, matrix, target_qubits[0])
+        else:
+            CustomQuantumEmulator._applyNQ(state, matrix, target_qubits)
+
+    @staticmethod
+    def _apply1Q(state: np.ndarray, matrix: np.ndarray, target_qubit: int) -> None:
+        """Applies 1-qubit gate `matrix` to a state tensor `state` in place"""
+        axis = CustomQuantumEmulator._qubit_axis(state, target_qubit)
+
+        # amplitudes with target qubit in |0> and |1> states (views into `state`)
+        amp0 = state[(slice(None),) * axis + (slice(0, 1),)]
+        amp1 = state[(slice(None),) * axis + (slice(1, 2),)]
+
+        new_amp0 = matrix[0, 0] * amp0 + matrix[0, 1] * amp1
+        amp1 *= matrix[1, 1]
+        amp1 += matrix[1, 0] * amp0
+        amp0[...] = new_amp0
+
+    @staticmethod
+    def _applyNQ(state: np.ndarray, matrix: np.ndarray, target_qubits: List[int]) -> None:
+        """
+        Applies N-qubit gate `matrix` to a state tensor `state` in place
+
+        Bit `i` of the matrix row/column index corresponds to `target_qubits[i]`
+        """
+        n = len(target_qubits)
+        axes = [CustomQuantumEmulator._qubit_axis(state, qubit) for qubit in reversed(target_qubits)]
+        matrix = matrix.reshape((2,) * 2 * n)
+
+        evolved = np.tensordot(matrix, state, axes=(list(range(n, 2 * n)), axes))
+        state[...] = np.moveaxis(evolved, list(range(n)), axes)
+
+    @staticmethod
+    def _basis_index(state: np.ndarray, target_qubits: List[int], basis: int) -> tuple:
+        """Returns index of the state tensor `state` view with `target_qubits` in the states given by bits of `basis`"""
+        index = [slice(None)] * state.ndim
+        for bit, qubit in enumerate(target_qubits):
+            value = (basis >> bit) & 1
+            index[CustomQuantumEmulator._qubit_axis(state, qubit)] = slice(value, value + 1)
+        return tuple(index)
+
+    @staticmethod
+    def _applyDiagonal(state: np.ndarray, phases: np.ndarray, target_qubits: List[int]) -> None:
+        """Applies diagonal gate with `phases` diagonal to a state tensor `state` in place. Amplitudes with unit phase are not touched"""
+        for basis, phase in enumerate(phases.tolist()):
+            if phase != 1:
+                state[CustomQuantumEmulator._basis_index(state, target_qubits, basis)] *= phase
+
+    @staticmethod
+    def _applyPermutation(state: np.ndarray, permutation: np.ndarray, phases: np.ndarray, target_qubits: List[int]) -> None:
+        """
+        Applies permutation gate `new[i] = phases[i] * old[permutation[i]]` to a state tensor `state` in place
+
+        Amplitudes are moved along permutation cycles, so fixed points with unit phase are not touched
+        """
+        permutation, phases = permutation.tolist(), phases.tolist()
+        visited = [False] * len(permutation)
+        for start in range(len(permutation)):
+            if visited[start]:
+                continue
+            cycle = [start]
+            visited[start] = True
+            while permutation[cycle[-1]] != start:
+                cycle.append(permutation[cycle[-1]])
+                visited[cycle[-1]] = True
+
+            views = [state[CustomQuantumEmulator._basis_index(state, target_qubits, basis)] for basis in cycle]
+            first = views[0].copy() if len(cycle) > 1 else views[0]
+            for basis, view, source in zip(cycle, views, views[1:] + [first]):
+                if phases[basis] == 1:
+                    if view is not source:
+                        view[...] = source
+                else:
+                    np.multiply(source, phases[basis], out=view)
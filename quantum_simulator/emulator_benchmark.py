@@ -0,0 +1,274 @@
+"""Quantum emulators benchmark module"""
+
+import argparse
+import csv
+import json
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Dict, List
+
+import numpy as np
+
+from quantum_simulator.abstract_quantum_emulator import AbstractQuantumEmulator
+from quantum_simulator.circuit_cache import CircuitCache
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.mps_quantum_emulator import MPSQuantumEmulator
+from quantum_simulator.qiskit_quantum_emulator import QiskitQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+EMULATORS = {
+    "custom": CustomQuantumEmulator,
+    "qiskit": QiskitQuantumEmulator,
+    "mps": MPSQuantumEmulator,
+}
+"Benchmarked emulators - `{name: emulator_class}`"
+
+DEFAULT_EMULATORS = ["custom", "qiskit"]
+"Emulators benchmarked by default. MPS emulator truncates highly entangled random circuits states, failing fidelity checks"
+
+
+class EmulatorBenchmark:
+    """
+    Quantum emulators benchmark class
+
+    Sweeps `QuantumCircuit(width, depth, weight_2q, seed)` grid, applies every circuit to |0...0⟩ state with every emulator and
+    records wall time, peak memory, gates per second and fidelity against the reference emulator result
+
+    `peak_rss_mb` is the peak resident set size of the process during the timed runs of the record. The peak is reset before
+    the runs (see `reset_peak_rss`), so it is recorded only where the reset is supported (Linux) and is `None` elsewhere
+    """
+
+    FIELDS = (
+        "emulator",
+        "width",
+        "depth",
+        "weight_2q",
+        "seed",
+        "gates",
+        "layers",
+        "wall_time_s",
+        "gates_per_s",
+        "peak_alloc_mb",
+        "peak_rss_mb",
+        "fidelity",
+    )
+    "Result record fields"
+
+    emulators: Dict[str, AbstractQuantumEmulator]
+    "Benchmarked emulators - `{name: emulator}`"
+
+    reference: str
+    "Name of the emulator used as a fidelity reference"
+
+    repeats: int
+    "Number of timed runs per circuit. Min wall time is recorded"
+
+    trace_memory: bool
+    "Whether to run an additional `tracemalloc` traced run per circuit to record peak allocated memory"
+
+    cache: CircuitCache
+    "Generated circuits cache, `None` to generate circuits on every run"
+
+    results: List[dict]
+    "Result records"
+
+    def __init__(
+        self,
+        emulators: Dict[str, AbstractQuantumEmulator],
+        reference: str = None,
+        repeats: int = 1,
+        trace_memory: bool = True,
+        cache: CircuitCache = None,
+    ):
+        if not emulators:
+            raise ValueError("At least one emulator should be benchmarked")
+        if reference is None:
+            reference = next(iter(emulators))
+        if reference not in emulators:
+            raise ValueError(f"Unknown reference emulator '{reference}'")
+        if repeats < 1:
+            raise ValueError("repeats must be not less than one")
+        self.emulators = emulators
+        self.reference = reference
+        self.repeats = repeats
+        self.trace_memory = trace_memory
+        self.cache = cache
+        self.results = []
+
+    def run(self, widths: List[int], depths: List[int], weights_2q: List[float], seeds: List[int]) -> List[dict]:
+        """Runs all emulators on all circuits of the parameters grid. Returns new result records"""
+        records = []
+        for width in widths:
+            for depth in depths:
+                for weight_2q in weights_2q:
+                    for seed in seeds:
+                        if self.cache is not None:
+                            circuit = self.cache.generate(width, depth, weight_2q, seed)
+                        else:
+                            circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q, seed=seed)
+                            circuit.generate_gates_and_unite()
+                        records.extend(self.run_circuit(circuit))
+        return records
+
+    def run_circuit(self, circuit: QuantumCircuit) -> List[dict]:
+        """Runs all emulators on a single circuit. Returns new result records"""
+        state_vector = QuantumStateVector(circuit.width)
+        reference_vector = self.emulators[self.reference].apply_circuit(circuit, state_vector).vector
+
+        records = []
+        for name, emulator in self.emulators.items():
+            wall_time = np.inf
+            rss_reset = self.reset_peak_rss()
+            for _ in range(self.repeats):
+                start = time.perf_counter()
+                output = emulator.apply_circuit(circuit, state_vector)
+                wall_time = min(wall_time, time.perf_counter() - start)
+            peak_rss = self.peak_rss_mb() if rss_reset else None
+
+            peak_alloc = None
+            if self.trace_memory:
+                tracemalloc.start()
+                emulator.apply_circuit(circuit, state_vector)
+                peak_alloc = tracemalloc.get_traced_memory()[1] / 2**20
+                tracemalloc.stop()
+
+            gates = circuit.gates_count
+            records.append(
+                {
+                    "emulator": name,
+                    "width": circuit.width,
+                    "depth": circuit.depth,
+                    "weight_2q": circuit.weight_2q,
+                    "seed": circuit.seed,
+                    "gates": gates,
+                    "layers": circuit.layers_count,
+                    "wall_time_s": wall_time,
+                    "gates_per_s": gates / wall_time if wall_time > 0 else None,
+                    "peak_alloc_mb": peak_alloc,
+                    "peak_rss_mb": peak_rss,
+                    "fidelity": float(np.abs(np.vdot(reference_vector, output.vector)) ** 2),
+                }
+            )
+        self.results.extend(records)
+        return records
+
+    @staticmethod
+    def reset_peak_rss() -> bool:
+        """Resets peak resident set size of the process to the current one. Returns `False` if the reset is not supported"""
+        try:
+            with open("/proc/self/clear_refs", "w", encoding="ascii") as file:
+                file.write("5")
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def peak_rss_mb() -> float:
+        """Returns peak resident set size of the process in megabytes since the start or the last `reset_peak_rss`"""
+        try:
+            with open("/proc/self/status", encoding="ascii") as file:
+                for line in file:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) / 2**10
+        except OSError:
+            pass
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+        return peak_rss / 2**20 if sys.platform == "darwin" else peak_rss / 2**10
+
+    @staticmethod
+    def metadata() -> dict:
+        """Returns environment description stored together with results"""
+        return {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        }
+
+    def to_json(self, path: str) -> None:
+        """Saves metadata and result records to JSON file"""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"metadata": self.metadata(), "results": self.results}, file, indent=2)
+
+    def to_csv(self, path: str) -> None:
+        """Saves result records to CSV file"""
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=self.FIELDS)
+            writer.writeheader()
+            writer.writerows(self.results)
+
+    @staticmethod
+    def load_json(path: str) -> List[dict]:
+        """Loads result records from JSON file saved by `to_json()`"""
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)["results"]
+
+    @staticmethod
+    def compare(baseline: List[dict], results: List[dict], max_slowdown: float = 1.2, min_fidelity: float = 1 - 1e-6) -> List[str]:
+        """
+        Compares result records with baseline records of the same emulator and circuit parameters.
+
+        Returns list of regression descriptions: wall time grown more than `max_slowdown` times or fidelity below `min_fidelity`
+        """
+
+        def key(record):
+            return tuple(record[field] for field in ("emulator", "width", "depth", "weight_2q", "seed"))
+
+        baseline_records = {key(record): record for record in baseline}
+        regressions = []
+        for record in results:
+            if record["fidelity"] < min_fidelity:
+                regressions.append(f"{key(record)}: fidelity {record['fidelity']:.8f} < {min_fidelity}")
+            old_record = baseline_records.get(key(record))
+            if old_record is not None and record["wall_time_s"] > max_slowdown * old_record["wall_time_s"]:
+                regressions.append(f"{key(record)}: wall time {old_record['wall_time_s']:.4f} s -> {record['wall_time_s']:.4f} s")
+        return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    """Benchmark command line entry point. Returns exit code: 1 if regressions against baseline were found"""
+    parser = argparse.ArgumentParser(description="Compares quantum emulators on random circuits")
+    parser.add_argument("--emulators", nargs="+", default=DEFAULT_EMULATORS, choices=list(EMULATORS))
+    parser.add_argument("--reference", default="qiskit", choices=list(EMULATORS))
+    parser.add_argument("--widths", type=int, nargs="+", default=[4, 8, 12, 16])
+    parser.add_argument("--depths", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--weights-2q", type=float, nargs="+", default=[0.1, 0.5])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[27])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--no-trace-memory", action="store_true", help="skip tracemalloc traced runs")
+    parser.add_argument("--json", help="JSON results output path")
+    parser.add_argument("--csv", help="CSV results output path")
+    parser.add_argument("--baseline", help="JSON results of a previous run to check for regressions")
+    parser.add_argument("--cache-dir", help="generated circuits cache directory, reused by later runs")
+    parser.add_argument("--max-slowdown", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    emulators = {name: EMULATORS[name]() for name in args.emulators}
+    reference = args.reference if args.reference in emulators else None
+    cache = CircuitCache(args.cache_dir) if args.cache_dir else None
+    benchmark = EmulatorBenchmark(emulators, reference=reference, repeats=args.repeats, trace_memory=not args.no_trace_memory, cache=cache)
+    for record in benchmark.run(args.widths, args.depths, args.weights_2q, args.seeds):
+        print(" ".join(f"{field}={record[field]}" for field in EmulatorBenchmark.FIELDS))
+
+    if args.json:
+        benchmark.to_json(args.json)
+    if args.csv:
+        benchmark.to_csv(args.csv)
+    if args.baseline:
+        regressions = EmulatorBenchmark.compare(EmulatorBenchmark.load_json(args.baseline), benchmark.results, max_slowdown=args.max_slowdown)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""Emulators instrumentation module"""
+
+import json
+import threading
+import time
+import tracemalloc
+import weakref
+from contextlib import contextmanager
+
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from quantum_simulator.quantum_operation import QuantumOperation
+
+
+class Instrumentation:
+    """
+    Opt-in emulator instrumentation class
+
+    Set as `emulator.instrumentation` to record every applied gate kernel: per-gate-kind counters, cumulative kernel time,
+    bytes of amplitudes read and written, and (with `trace_allocations`) peak bytes allocated by the kernel.
+    Gate kind is `"<diagonal|permutation|generic>_<n>q"` (see `QuantumOperation.classify`); emulators without own kernels
+    record whole operations with their own kind names. Emulators check `instrumentation` once per gate, so disabled
+    instrumentation (`None`, the default) costs nothing measurable.
+
+    Recorded spans are exported by `to_trace()` as Chrome trace event format JSON, read by Perfetto, speedscope and
+    other flame-graph tools. Circuit spans (`apply_circuit`, `apply_circuit_batch`) enclose gate spans of the same thread.
+    """
+
+    counters: Dict[str, int]
+    "Number of applied kernels per gate kind"
+
+    kernel_time: Dict[str, float]
+    "Cumulative kernel wall time per gate kind, in seconds"
+
+    bytes_touched: Dict[str, int]
+    "Cumulative bytes of amplitudes read and written per gate kind"
+
+    allocations: Dict[str, int]
+    "Cumulative peak bytes allocated by kernels per gate kind. Recorded only with `trace_allocations`"
+
+    callback: Callable[[dict], None]
+    "Function called with every recorded event (after the span end), `None` to disable"
+
+    trace_allocations: bool
+    "Whether to measure kernel allocations by `tracemalloc` (started if not tracing). Slows down small gates considerably"
+
+    record_events: bool
+    "Whether to keep events for `to_trace()`. Counters are updated regardless"
+
+    events: List[dict]
+    "Recorded events - `{name, start, duration, thread, ...}` with times in seconds since `origin`"
+
+    origin: float
+    "`time.perf_counter()` value of the instrumentation creation or `reset()`"
+
+    _lock: threading.Lock
+    "Lock of the counters updated by the emulator worker threads"
+
+    _tracing_stop: weakref.finalize = None
+    "Stops `tracemalloc` started by this instrumentation, on `close` or when the instrumentation is garbage collected"
+
+    def __init__(self, callback: Callable[[dict], None] = None, trace_allocations: bool = False, record_events: bool = True):
+        self.callback = callback
+        self.trace_allocations = trace_allocations
+        self.record_events = record_events
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears counters and events"""
+        self.counters = {}
+        self.kernel_time = {}
+        self.bytes_touched = {}
+        self.allocations = {}
+        self.events = []
+        self.origin = time.perf_counter()
+
+    @contextmanager
+    def gate(self, state: np.ndarray, target_qubits: List[int], structure: tuple = None):
+        """
+        Context manager recording a gate kernel applied to a state tensor `state` on `target_qubits`
+
+        `structure` is `(kind, permutation, phases)` of the gate matrix as returned by `QuantumOperation.classify`.
+        Diagonal and permutation kernels touch only amplitudes with non-unit phases or moved ones
+        """
+        kind, permutation, phases = structure if structure is not None else (QuantumOperation.GENERIC, None, None)
+        if kind == QuantumOperation.GENERIC:
+            touched = state.nbytes
+        else:
+            changed = (permutation != np.arange(len(permutation))) | (phases != 1)
+            touched = state.nbytes * int(changed.sum()) // len(changed)
+        with self.span(f"{kind}_{len(target_qubits)}q", bytes_touched=2 * touched, target_qubits=list(target_qubits)):
+            yield
+
+    @contextmanager
+    def span(self, kind: str, **args):
+        """
+        Context manager recording a gate of the `kind` (or an enclosing circuit span) and its timing
+
+        Keyword arguments are stored in the event. `bytes_touched` is accumulated in the `bytes_touched` counter.
+        `tracemalloc` started by a traced span is stopped by the first span after `trace_allocations` is turned off
+        """
+        # nested gate spans reset the peak, so circuit spans do not measure allocations
+        tracing = self.trace_allocations and not args.get("circuit", False)
+        if tracing:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing_stop = weakref.finalize(self, tracemalloc.stop)
+            self._reset_peak()
+            allocated_before = tracemalloc.get_traced_memory()[0]
+        elif self._tracing_stop is not None and not self.trace_allocations:
+            self.close()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            event = {"name": kind, "start": start - self.origin, "duration": duration, "thread": threading.get_ident(), **args}
+            if tracing:
+                event["allocated"] = tracemalloc.get_traced_memory()[1] - allocated_before
+            self._record(event)
+
+    def close(self) -> None:
+        """Stops `tracemalloc` if it was started by this instrumentation. It is started again by the next traced gate"""
+        if self._tracing_stop is not None:
+            self._tracing_stop()
+            self._tracing_stop = None
+
+    def circuit(self, name: str, **args):
+        """Context manager recording circuit span `name` (not counted as a gate) enclosing gate spans"""
+        return self.span(name, circuit=True, **args)
+
+    @staticmethod
+    def _reset_peak() -> None:
+        """
+        Resets `tracemalloc` peak to the current traced memory
+
+        Python 3.8 has no `tracemalloc.reset_peak()`, so traces are cleared instead: traced memory and its peak restart
+        from zero, which also resets the peak of an enclosing `tracemalloc` measurement
+        """
+        reset_peak = getattr(tracemalloc, "reset_peak", None)
+        if reset_peak is not None:
+            reset_peak()
+        else:
+            tracemalloc.clear_traces()
+
+    def _record(self, event: dict) -> None:
+        """Updates counters with `event` (except circuit spans), stores it and calls the callback"""
+        kind = event["name"]
+        with self._lock:
+            if not event.get("circuit", False):
+                self.counters[kind] = self.counters.get(kind, 0) + 1
+                self.kernel_time[kind] = self.kernel_time.get(kind, 0.0) + event["duration"]
+                self.bytes_touched[kind] = self.bytes_touched.get(kind, 0) + event.get("bytes_touched", 0)
+                if "allocated" in event:
+                    self.allocations[kind] = self.allocations.get(kind, 0) + event["allocated"]
+            if self.record_events:
+                self.events.append(event)
+        if self.callback is not None:
+            self.callback(event)
+
+    def summary(self) -> Dict[str, dict]:
+        """Returns `{gate_kind: {count, kernel_time_s, bytes_touched, allocated}}` of the recorded gates"""
+        return {
+            kind: {
+                "count": count,
+                "kernel_time_s": self.kernel_time[kind],
+                "bytes_touched": self.bytes_touched[kind],
+                "allocated": self.allocations.get(kind),
+            }
+            for kind, count in sorted(self.counters.items())
+        }
+
+    def to_trace(self) -> dict:
+        """Returns recorded events as Chrome trace event format (`"X"` complete events with microsecond times)"""
+        trace_events = []
+        for event in self.events:
+            args = {key: value for key, value in event.items() if key not in ("name", "start", "duration", "thread")}
+            trace_events.append(
+                {
+                    "name": event["name"],
+                    "cat": "circuit" if event.get("circuit", False) else "gate",
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["duration"] * 1e6,
+                    "pid": 0,
+                    "tid": event["thread"],
+                    "args": args,
+                }
+            )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms", "otherData": {"summary": self.summary()}}
+
+    def save_trace(self, path: str) -> None:
+        """Saves `to_trace()` JSON to `path`"""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_trace(), file)
@@ -0,0 +1,260 @@
+"""Matrix product state module"""
+
+from copy import deepcopy
+
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Dict, List, Union
+
+import numpy as np
+
+from quantum_simulator.observable import Observable
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+class MatrixProductState:
+    """
+    Matrix product state class
+
+    Site tensors have shape `(left_bond, 2, right_bond)` and the product `A_0[s_0] A_1[s_1] ... A_{n-1}[s_{n-1}]` is the
+    amplitude of the basis state with qubit `qubit_at[k]` in state `s_k`. Memory is `O(n * max_bond_dimension**2)` instead
+    of `O(2**n)`.
+
+    The state is kept in mixed canonical form: tensors left of the orthogonality center are left-orthonormal and tensors
+    right of it are right-orthonormal. Two-qubit gates are applied to adjacent sites with the center moved to them and
+    split back by SVD, dropping singular values below `truncation_threshold` of the largest one and beyond
+    `max_bond_dimension`. The discarded weight is accumulated in `truncation_error`. Gates on non-adjacent qubits are
+    routed by SWAP gates moving the first qubit next to the second one. Qubits are not swapped back: the qubit-to-site
+    permutation is tracked instead, so qubits interacting repeatedly stay close. Conversions, sampling and expectation
+    values follow the `QuantumStateVector` qubit indexing regardless of the permutation
+    """
+
+    MAX_STATE_VECTOR_QUBITS: int = 30
+    "Max number of qubits of the states converted to `QuantumStateVector`"
+
+    __PAULI: dict = {
+        (0, 0): np.eye(2),
+        (1, 0): np.array([[0, 1], [1, 0]]),
+        (1, 1): np.array([[0, -1j], [1j, 0]]),
+        (0, 1): np.array([[1, 0], [0, -1]]),
+    }
+    "Pauli matrix of the `(x_bit, z_bit)` of `Observable` masks"
+
+    __SWAP: np.ndarray = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+    "SWAP gate matrix"
+
+    tensors: List[np.ndarray]
+    "Site tensors of shape `(left_bond, 2, right_bond)`"
+
+    max_bond_dimension: int
+    "Max bond dimension kept by truncation"
+
+    truncation_threshold: float
+    "Singular values below `truncation_threshold` times the largest one are discarded"
+
+    truncation_error: float
+    "Accumulated discarded weight (sum of squared discarded normalized singular values) of all truncations"
+
+    _center: int
+    "Orthogonality center site"
+
+    _site_of: List[int]
+    "Site of every qubit"
+
+    _qubit_at: List[int]
+    "Qubit of every site"
+
+    def __init__(self, num_qubits: int = 1, max_bond_dimension: int = 64, truncation_threshold: float = 1e-12, dtype: type = np.complex128):
+        if not isinstance(num_qubits, int):
+            raise TypeError("Number of qubits must be an integer.")
+        if num_qubits < 1:
+            raise ValueError("Number of qubits must be not less than one.")
+        if max_bond_dimension < 1:
+            raise ValueError("max_bond_dimension must be not less than one")
+        if truncation_threshold < 0:
+            raise ValueError("truncation_threshold must be non-negative")
+        if np.dtype(dtype) not in QuantumStateVector.SUPPORTED_DTYPES:
+            raise TypeError(f"Unsupported dtype {dtype}. Should be one of {QuantumStateVector.SUPPORTED_DTYPES}")
+        self.max_bond_dimension = max_bond_dimension
+        self.truncation_threshold = truncation_threshold
+        self.truncation_error = 0.0
+        # |0...0⟩ product state
+        self.tensors = [np.array([1, 0], dtype=dtype).reshape((1, 2, 1)) for _ in range(num_qubits)]
+        self._center = 0
+        self._site_of = list(range(num_qubits))
+        self._qubit_at = list(range(num_qubits))
+
+    @property
+    def num_qubits(self) -> int:
+        """Returns number of qubits"""
+        return len(self.tensors)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Returns tensors dtype"""
+        return self.tensors[0].dtype
+
+    @property
+    def qubit_at(self) -> List[int]:
+        """Returns qubit of every site"""
+        return list(self._qubit_at)
+
+    @property
+    def bond_dimensions(self) -> List[int]:
+        """Returns dimensions of the `num_qubits - 1` bonds between sites"""
+        return [tensor.shape[2] for tensor in self.tensors[:-1]]
+
+    @property
+    def nbytes(self) -> int:
+        """Returns size of the site tensors in bytes"""
+        return sum(tensor.nbytes for tensor in self.tensors)
+
+    def copy(self) -> "MatrixProductState":
+        """Returns a deep copy of the state"""
+        return deepcopy(self)
+
+    @classmethod
+    def from_state_vector(cls, state_vector: QuantumStateVector, max_bond_dimension: int = 64, truncation_threshold: float = 1e-12) -> "MatrixProductState":
+        """Returns matrix product state of the state vector built by successive SVDs (truncated as 2-qubit gates splits)"""
+        n = state_vector.num_qubits
+        state = cls(n, max_bond_dimension, truncation_threshold, state_vector.dtype)
+        # tensor axes ordered from qubit 0, the lowest bit of the amplitude index
+        remainder = np.transpose(np.asarray(state_vector.vector).reshape((2,) * n)).reshape(1, -1)
+        for site in range(n - 1):
+            left_bond = remainder.shape[0]
+            u, rest = state._split(remainder.reshape(left_bond * 2, -1))
+            state.tensors[site] = u.reshape(left_bond, 2, -1)
+            remainder = rest
+        state.tensors[n - 1] = remainder.reshape(remainder.shape[0], 2, 1)
+        state._center = n - 1
+        return state
+
+    def to_state_vector(self) -> QuantumStateVector:
+        """Converts the state to `QuantumStateVector`. Raises `ValueError` for states wider than `MAX_STATE_VECTOR_QUBITS`"""
+        if self.num_qubits > self.MAX_STATE_VECTOR_QUBITS:
+            raise ValueError(f"State of {self.num_qubits} qubits is too wide for a state vector (max {self.MAX_STATE_VECTOR_QUBITS})")
+        amplitudes = np.ones((1, 1), dtype=self.dtype)
+        for tensor in self.tensors:
+            amplitudes = (amplitudes @ tensor.reshape(tensor.shape[0], -1)).reshape(-1, tensor.shape[2])
+        # amplitudes axes are ordered by sites, the state vector index is ordered from the last qubit
+        vector = np.transpose(amplitudes.reshape((2,) * self.num_qubits), [self._site_of[qubit] for qubit in reversed(range(self.num_qubits))]).ravel()
+        return QuantumStateVector(np.ascontiguousarray(vector, dtype=self.dtype), dtype=self.dtype)
+
+    def apply_gate(self, matrix: np.ndarray, target_qubits: List[int]) -> None:
+        """
+        Applies 1- or 2-qubit gate `matrix` on `target_qubits` in place
+
+        Bit `i` of the matrix row/column index corresponds to `target_qubits[i]`
+        """
+        if any(qubit < 0 or qubit >= self.num_qubits for qubit in target_qubits):
+            raise ValueError("Target qubits are out of the state range")
+        if len(target_qubits) == 1:
+            site = self._site_of[target_qubits[0]]
+            self.tensors[site] = np.einsum("ab,lbr->lar", matrix, self.tensors[site]).astype(self.dtype, copy=False)
+        elif len(target_qubits) == 2:
+            first, second = target_qubits
+            if first == second:
+                raise ValueError("Target qubits must be distinct")
+            # route the first qubit next to the second one
+            step = 1 if self._site_of[first] < self._site_of[second] else -1
+            while self._site_of[first] + step != self._site_of[second]:
+                site = self._site_of[first]
+                self._apply_adjacent(self.__SWAP, site, site + step)
+                moved = self._qubit_at[site + step]
+                self._qubit_at[site], self._qubit_at[site + step] = moved, first
+                self._site_of[moved], self._site_of[first] = site, site + step
+            self._apply_adjacent(matrix, self._site_of[first], self._site_of[second])
+        else:
+            raise ValueError("Only 1- and 2-qubit gates are supported")
+
+    def _apply_adjacent(self, matrix: np.ndarray, first: int, second: int) -> None:
+        """Applies 2-qubit gate `matrix` on adjacent sites `first` and `second` (bit 0 of the matrix index is `first`)"""
+        site = min(first, second)
+        self._move_center(site)
+        left, right = self.tensors[site], self.tensors[site + 1]
+        theta = np.einsum("lar,rbs->labs", left, right)
+        gate = np.asarray(matrix).reshape(2, 2, 2, 2)
+        if first == site:
+            # gate axes (out_second, out_first, in_second, in_first)
+            theta = np.einsum("abcd,ldcs->lbas", gate, theta)
+        else:
+            theta = np.einsum("abcd,lcds->labs", gate, theta)
+        u, rest = self._split(theta.reshape(left.shape[0] * 2, -1))
+        self.tensors[site] = u.reshape(left.shape[0], 2, -1).astype(self.dtype, copy=False)
+        self.tensors[site + 1] = rest.reshape(-1, 2, right.shape[2]).astype(self.dtype, copy=False)
+        self._center = site + 1
+
+    def _split(self, theta: np.ndarray) -> tuple:
+        """Returns `(u, s @ vh)` truncated SVD factors of the matrix `theta`. Kept singular values are renormalized"""
+        u, singular_values, vh = np.linalg.svd(theta, full_matrices=False)
+        norm = np.sqrt(np.sum(singular_values**2))
+        keep = int(np.count_nonzero(singular_values > self.truncation_threshold * singular_values[0])) if norm > 0 else 1
+        keep = max(1, min(keep, self.max_bond_dimension))
+        kept = singular_values[:keep]
+        if norm > 0:
+            self.truncation_error += max(float(1 - np.sum(kept**2) / norm**2), 0.0)
+            kept = kept * (norm / np.sqrt(np.sum(kept**2)))
+        return u[:, :keep], kept[:, None] * vh[:keep]
+
+    def _move_center(self, site: int) -> None:
+        """Moves the orthogonality center to `site` by QR decompositions"""
+        while self._center < site:
+            tensor = self.tensors[self._center]
+            q, r = np.linalg.qr(tensor.reshape(-1, tensor.shape[2]))
+            self.tensors[self._center] = q.reshape(tensor.shape[0], 2, -1)
+            self.tensors[self._center + 1] = np.einsum("ab,bsr->asr", r, self.tensors[self._center + 1])
+            self._center += 1
+        while self._center > site:
+            tensor = self.tensors[self._center]
+            q, r = np.linalg.qr(tensor.reshape(tensor.shape[0], -1).T)
+            self.tensors[self._center] = q.T.reshape(-1, 2, tensor.shape[2])
+            self.tensors[self._center - 1] = np.einsum("lsa,ab->lsb", self.tensors[self._center - 1], r.T)
+            self._center -= 1
+
+    def norm(self) -> float:
+        """Returns the state norm"""
+        return float(np.linalg.norm(self.tensors[self._center]))
+
+    def sample_counts(self, n_shots: int, seed: int = None) -> Dict[str, int]:
+        """
+        Samples `n_shots` measurements of all qubits. Returns `{bitstring: count}` of the measured |ket⟩ notation bitstrings
+
+        Qubits are sampled one by one from the right-orthonormal form (center at site 0), all shots at once
+        """
+        if n_shots < 1:
+            raise ValueError("Number of shots must be not less than one.")
+        rng = np.random.default_rng(seed)
+        self._move_center(0)
+        # per-shot left environments and measured bits
+        environments = np.ones((n_shots, 1), dtype=self.dtype)
+        bits = np.empty((n_shots, self.num_qubits), dtype=np.uint8)
+        for site, tensor in enumerate(self.tensors):
+            branches = np.einsum("nl,lsr->nsr", environments, tensor)
+            weights = np.sum(branches.real**2 + branches.imag**2, axis=2)
+            ones = rng.random(n_shots) * weights.sum(axis=1) < weights[:, 1]
+            bits[:, site] = ones
+            environments = branches[np.arange(n_shots), ones.astype(np.intp)]
+            environments /= np.linalg.norm(environments, axis=1, keepdims=True)
+
+        # columns reordered from sites to qubits
+        bits = np.ascontiguousarray(bits[:, self._site_of]) + ord("0")
+        bitstrings, counts = np.unique(bits.view(f"S{self.num_qubits}").ravel(), return_counts=True)
+        return dict(zip(bitstrings.astype(f"U{self.num_qubits}").tolist(), counts.tolist()))
+
+    def expectation_value(self, observable: Observable) -> Union[float, complex]:
+        """Returns ⟨ψ|H|ψ⟩ of the state and `observable` H, contracting every Pauli string term up to its last non-identity site"""
+        if observable.num_qubits != self.num_qubits:
+            raise ValueError("State and observable size mismatch")
+        self._move_center(0)
+        value = 0j
+        for x_mask, z_mask, coefficient in zip(observable.x_masks.tolist(), observable.z_masks.tolist(), observable.coefficients.tolist()):
+            support = [self._site_of[qubit] for qubit in range(self.num_qubits) if ((x_mask | z_mask) >> qubit) & 1]
+            # sites right of the last non-identity one are right-orthonormal and contract to the identity
+            environment = np.ones((1, 1), dtype=self.dtype)
+            for site in range(max(support, default=0) + 1):
+                qubit = self._qubit_at[site]
+                tensor = self.tensors[site]
+                ket = np.einsum("st,btq->bsq", self.__PAULI[((x_mask >> qubit) & 1, (z_mask >> qubit) & 1)], tensor)
+                environment = np.einsum("ab,asr,bsq->rq", environment, tensor.conj(), ket, optimize=True)
+            # Pauli strings are Hermitian, so their expectation values are real
+            value += coefficient * np.trace(environment).real
+        return value if value.imag else value.real
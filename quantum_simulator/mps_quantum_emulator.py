@@ -0,0 +1,101 @@
+"""Matrix product state quantum emulator module"""
+
+# TODO: typing.Dict is deprecated since Python 3.9. Use dict after version update
+from typing import Dict, Union
+
+import numpy as np
+
+from quantum_simulator.abstract_quantum_emulator import AbstractQuantumEmulator
+from quantum_simulator.matrix_product_state import MatrixProductState
+from quantum_simulator.observable import Observable
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_operation import QuantumOperation
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+class MPSQuantumEmulator(AbstractQuantumEmulator):
+    """
+    Matrix product state quantum emulator class
+
+    Circuits are simulated on `MatrixProductState` with bond dimensions bounded by `max_bond_dimension`, so memory grows
+    linearly with the circuit width. Results are exact while the entanglement fits into the bonds (shallow circuits and
+    low `weight_2q`), otherwise the truncated weight is reported by `MatrixProductState.truncation_error`.
+
+    `execute_shots` and `expectation_value` never build a state vector and handle wide circuits. `apply_gate`,
+    `apply_circuit` and `execute` convert states from and to `QuantumStateVector`, so they are limited to
+    `MatrixProductState.MAX_STATE_VECTOR_QUBITS` qubits; use `execute_mps` and `apply_circuit_mps` for wider states
+    """
+
+    max_bond_dimension: int
+    "Max bond dimension kept by truncation"
+
+    truncation_threshold: float
+    "Singular values below `truncation_threshold` times the largest one are discarded"
+
+    dtype: np.dtype
+    "Tensors dtype of the executed circuits states - `complex128` or `complex64`"
+
+    def __init__(self, max_bond_dimension: int = 64, truncation_threshold: float = 1e-12, dtype: type = np.complex128):
+        # validates the truncation settings and dtype
+        MatrixProductState(1, max_bond_dimension, truncation_threshold, dtype)
+        self.max_bond_dimension = max_bond_dimension
+        self.truncation_threshold = truncation_threshold
+        self.dtype = np.dtype(dtype)
+
+    def apply_gate(self, operation: QuantumOperation, state_vector: QuantumStateVector) -> QuantumStateVector:
+        """Applies quantum operation to a given state vector"""
+        state = self._from_state_vector(state_vector)
+        if self.instrumentation is None:
+            state.apply_gate(operation.matrix, operation.target_qubits)
+        else:
+            with self.instrumentation.span(f"mps_{len(operation.target_qubits)}q", target_qubits=list(operation.target_qubits)):
+                state.apply_gate(operation.matrix, operation.target_qubits)
+        return state.to_state_vector()
+
+    def apply_circuit(self, circuit: QuantumCircuit, state_vector: QuantumStateVector) -> QuantumStateVector:
+        """Applies quantum circuit to a given state vector"""
+        if circuit.width != state_vector.num_qubits:
+            raise ValueError("state_vector and circuit size mismatch")
+        return self.apply_circuit_mps(circuit, self._from_state_vector(state_vector)).to_state_vector()
+
+    def apply_circuit_mps(self, circuit: QuantumCircuit, state: MatrixProductState) -> MatrixProductState:
+        """Applies quantum circuit to a given matrix product state in place. Returns the same state"""
+        if circuit.width != state.num_qubits:
+            raise ValueError("state and circuit size mismatch")
+        with self._circuit_span("apply_circuit", width=circuit.width, gates=circuit.gates_count):
+            for layer_gates in circuit.iter_layers():
+                for gate in layer_gates:
+                    state.apply_gate(gate.matrix, gate.target_qubits)
+        return state
+
+    def execute(self, circuit: QuantumCircuit) -> QuantumStateVector:
+        """Executes given circuit on |0...0⟩ state. Returns final state vector"""
+        return self.execute_mps(circuit).to_state_vector()
+
+    def execute_mps(self, circuit: QuantumCircuit) -> MatrixProductState:
+        """Executes given circuit on |0...0⟩ state. Returns final matrix product state"""
+        state = MatrixProductState(circuit.width, self.max_bond_dimension, self.truncation_threshold, self.dtype)
+        return self.apply_circuit_mps(circuit, state)
+
+    def execute_shots(self, circuit: QuantumCircuit, n_shots: int, seed: int = None) -> Dict[str, int]:
+        """
+        Executes shots using given circuit. Returns `{bitstring: count}` of the measured bitstrings
+
+        The circuit is simulated once and all shots are sampled from the final matrix product state. Clifford-only circuits
+        are simulated on a stabilizer tableau (see `route_clifford`)
+        """
+        tableau = self._clifford_tableau(circuit)
+        if tableau is not None:
+            return tableau.sample_counts(n_shots, seed)
+        return self.execute_mps(circuit).sample_counts(n_shots, seed)
+
+    def expectation_value(self, circuit: QuantumCircuit, observable: Observable) -> Union[float, complex]:
+        """Executes given circuit on |0...0⟩ state. Returns ⟨ψ|H|ψ⟩ of the final matrix product state and `observable` H"""
+        tableau = self._clifford_tableau(circuit)
+        if tableau is not None:
+            return tableau.expectation_value(observable)
+        return self.execute_mps(circuit).expectation_value(observable)
+
+    def _from_state_vector(self, state_vector: QuantumStateVector) -> MatrixProductState:
+        """Returns matrix product state of the state vector with the emulator truncation settings"""
+        return MatrixProductState.from_state_vector(state_vector, self.max_bond_dimension, self.truncation_threshold)
@@ -0,0 +1,128 @@
+"""Quantum noise model module"""
+
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Dict, List
+
+import numpy as np
+
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+class NoiseModel:
+    """
+    Quantum noise model class
+
+    Single-qubit channels act on every target qubit of a gate right after it. A channel is attached to gate kinds
+    (`"1q"` and `"2q"` gates, as in `RandomGenerator.rand_unitary` modes) and qubits, `None` meaning all of them.
+    Readout errors flip measured bits of the attached qubits. Channels are unravelled into quantum trajectories by
+    `TrajectorySimulator`: each channel application consumes one uniform random number
+    """
+
+    DEPOLARIZING: str = "depolarizing"
+    "Depolarizing channel `ρ -> (1 - p) ρ + p / 3 (XρX + YρY + ZρZ)`"
+
+    AMPLITUDE_DAMPING: str = "amplitude_damping"
+    "Amplitude damping channel with Kraus operators `[[1, 0], [0, sqrt(1 - γ)]]` and `[[0, sqrt(γ)], [0, 0]]`"
+
+    GATE_KINDS: tuple = ("1q", "2q")
+    "Gate kinds channels are attached to - gates of 1 and 2 target qubits"
+
+    __PAULIS: np.ndarray = np.array([[[0, 1], [1, 0]], [[0, -1j], [1j, 0]], [[1, 0], [0, -1]]])
+    "Pauli X, Y and Z matrices"
+
+    channels: List[tuple]
+    "Channels in order of addition - `[(channel, parameter, gate_kinds, qubits)]`, `None` kinds or qubits for all of them"
+
+    readout_errors: Dict[int, tuple]
+    "Readout errors - `{qubit: (p01, p10)}` probabilities of reading 1 for 0 and 0 for 1, `None` key for all qubits"
+
+    def __init__(self):
+        self.channels = []
+        self.readout_errors = {}
+
+    def add_depolarizing(self, probability: float, gate_kinds: List[str] = None, qubits: List[int] = None) -> "NoiseModel":
+        """Attaches depolarizing channel with error `probability` to `gate_kinds` gates on `qubits`. Returns self"""
+        return self._add_channel(self.DEPOLARIZING, probability, gate_kinds, qubits)
+
+    def add_amplitude_damping(self, gamma: float, gate_kinds: List[str] = None, qubits: List[int] = None) -> "NoiseModel":
+        """Attaches amplitude damping channel with decay probability `gamma` to `gate_kinds` gates on `qubits`. Returns self"""
+        return self._add_channel(self.AMPLITUDE_DAMPING, gamma, gate_kinds, qubits)
+
+    def add_readout_error(self, p01: float, p10: float = None, qubits: List[int] = None) -> "NoiseModel":
+        """Attaches readout error to `qubits` measurements, symmetric if `p10` is `None`. Returns self"""
+        p10 = p01 if p10 is None else p10
+        self._check_probability(p01)
+        self._check_probability(p10)
+        for qubit in [None] if qubits is None else qubits:
+            self.readout_errors[qubit] = (float(p01), float(p10))
+        return self
+
+    @property
+    def is_noiseless(self) -> bool:
+        """Returns whether the model has neither channels nor readout errors"""
+        return not self.channels and not self.readout_errors
+
+    def locations(self, target_qubits: List[int]) -> List[tuple]:
+        """Returns `[(channel_index, qubit)]` channel applications after a gate with `target_qubits`, in application order"""
+        kind = f"{len(target_qubits)}q"
+        return [
+            (index, qubit)
+            for index, (_, _, gate_kinds, qubits) in enumerate(self.channels)
+            if gate_kinds is None or kind in gate_kinds
+            for qubit in target_qubits
+            if qubits is None or qubit in qubits
+        ]
+
+    def apply_channel(self, index: int, state_vector: QuantumStateVector, qubit: int, uniform: float):
+        """
+        Applies a trajectory branch of channel `index` to `qubit` of `state_vector` in place, chosen by `uniform` in `[0, 1)`
+
+        Returns the Pauli matrix of a depolarizing error, so it is applied by the emulator, `None` otherwise
+        """
+        channel, parameter, _, _ = self.channels[index]
+        if channel == self.DEPOLARIZING:
+            # X, Y and Z errors are equally likely
+            return self.__PAULIS[int(uniform * 3 / parameter)] if uniform < parameter else None
+
+        # (..., qubit, lower qubits) view of the amplitudes
+        amplitudes = np.asarray(state_vector.vector).reshape(-1, 2, 2**qubit)
+        probability_1 = float(np.real(np.vdot(amplitudes[:, 1], amplitudes[:, 1]))) / float(np.real(np.vdot(amplitudes, amplitudes)))
+        decay_probability = parameter * probability_1
+        if uniform < decay_probability:
+            amplitudes[:, 0] = amplitudes[:, 1] / np.sqrt(probability_1)
+            amplitudes[:, 1] = 0
+        elif decay_probability > 0:
+            amplitudes[:, 1] *= np.sqrt(1 - parameter)
+            amplitudes /= np.sqrt(1 - decay_probability)
+        return None
+
+    def apply_readout_errors(self, indices: np.ndarray, num_qubits: int, rng: np.random.Generator) -> np.ndarray:
+        """Returns measured basis state `indices` with bits flipped by readout errors"""
+        indices = np.asarray(indices, dtype=np.int64)
+        flips = np.zeros_like(indices)
+        for qubit in range(num_qubits):
+            errors = self.readout_errors.get(qubit, self.readout_errors.get(None))
+            if errors is None:
+                continue
+            bits = (indices >> qubit) & 1
+            flip_probabilities = np.where(bits == 1, errors[1], errors[0])
+            flips |= (rng.random(len(indices)) < flip_probabilities).astype(np.int64) << qubit
+        return indices ^ flips
+
+    def _add_channel(self, channel: str, parameter: float, gate_kinds: List[str], qubits: List[int]) -> "NoiseModel":
+        """Appends channel to `channels`. Returns self"""
+        self._check_probability(parameter)
+        if gate_kinds is not None:
+            unknown = [kind for kind in gate_kinds if kind not in self.GATE_KINDS]
+            if unknown:
+                raise ValueError(f"Unknown gate kinds {unknown}. Should be from {list(self.GATE_KINDS)}")
+            gate_kinds = frozenset(gate_kinds)
+        qubits = None if qubits is None else frozenset(int(qubit) for qubit in qubits)
+        self.channels.append((channel, float(parameter), gate_kinds, qubits))
+        return self
+
+    @staticmethod
+    def _check_probability(probability: float) -> None:
+        """Raises `ValueError` if `probability` is out of `[0, 1]`"""
+        if not 0 <= probability <= 1:
+            raise ValueError(f"Probability should be in [0, 1], got {probability}")
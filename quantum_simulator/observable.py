@@ -0,0 +1,161 @@
+"""Pauli strings observable module"""
+
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Dict, List, Union
+
+import numpy as np
+from qiskit.quantum_info import SparsePauliOp as QiskitSparsePauliOp
+
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+class Observable:
+    """
+    Observable class - sum of Pauli strings with coefficients (sparse Hamiltonian)
+
+    Pauli string labels follow the `QuantumStateVector` |ket⟩ notation: the first character acts on the first qubit.
+    "XIZ" is X on qubit 0 and Z on qubit 2.
+
+    Pauli strings are stored as bit masks: qubit `k` of `x_masks[t]` is set for X and Y, of `z_masks[t]` for Z and Y.
+    Term `P = i^popcount(x & z) X^x Z^z` maps basis state |j⟩ to `i^popcount(x & z) (-1)^popcount(j & z) |j ^ x⟩`, so
+    ⟨ψ|P|ψ⟩ is computed from `conj(ψ[j ^ x]) ψ[j]` products and bit parities directly on the state buffer.
+    """
+
+    __PAULI_BITS: dict = {"I": (0, 0), "X": (1, 0), "Y": (1, 1), "Z": (0, 1)}
+    "Pauli label character - `(x_bit, z_bit)`"
+
+    _num_qubits: int
+    "Number of qubits observable acts on"
+
+    _x_masks: np.ndarray
+    "X bit masks of the terms - int64 array (object array of integers for more than 62 qubits)"
+
+    _z_masks: np.ndarray
+    "Z bit masks of the terms - int64 array (object array of integers for more than 62 qubits)"
+
+    _coefficients: np.ndarray
+    "Coefficients of the terms - complex array"
+
+    def __init__(self, terms: Union[Dict[str, complex], List[tuple]]):
+        if isinstance(terms, dict):
+            terms = list(terms.items())
+        if not isinstance(terms, list):
+            raise TypeError("Observable terms should be a dict or a list of (label, coefficient) pairs")
+        if not terms:
+            raise ValueError("Observable should have at least one term")
+
+        labels = [label.upper() for label, _ in terms]
+        num_qubits = len(labels[0])
+        if num_qubits < 1 or any(len(label) != num_qubits for label in labels):
+            raise ValueError("Pauli labels should have the same non-zero length")
+        if any(char not in self.__PAULI_BITS for label in labels for char in label):
+            raise ValueError("Pauli labels should consist of I, X, Y and Z characters")
+
+        self._num_qubits = num_qubits
+        # masks of more than 62 qubits do not fit into int64 and are kept as Python integers
+        mask_dtype = np.int64 if num_qubits <= 62 else object
+        self._x_masks = np.array([sum(self.__PAULI_BITS[char][0] << qubit for qubit, char in enumerate(label)) for label in labels], dtype=mask_dtype)
+        self._z_masks = np.array([sum(self.__PAULI_BITS[char][1] << qubit for qubit, char in enumerate(label)) for label in labels], dtype=mask_dtype)
+        self._coefficients = np.array([coefficient for _, coefficient in terms], dtype=complex)
+
+    def __len__(self) -> int:
+        return len(self._coefficients)
+
+    @property
+    def num_qubits(self) -> int:
+        """Number of qubits read-only property"""
+        return self._num_qubits
+
+    @property
+    def x_masks(self) -> np.ndarray:
+        """X bit masks of the terms read-only property"""
+        return self._x_masks
+
+    @property
+    def z_masks(self) -> np.ndarray:
+        """Z bit masks of the terms read-only property"""
+        return self._z_masks
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """Coefficients of the terms read-only property"""
+        return self._coefficients
+
+    @property
+    def labels(self) -> List[str]:
+        """Returns Pauli labels of the terms"""
+        chars = {bits: char for char, bits in self.__PAULI_BITS.items()}
+        return [
+            "".join(chars[((x >> qubit) & 1, (z >> qubit) & 1)] for qubit in range(self._num_qubits))
+            for x, z in zip(self._x_masks.tolist(), self._z_masks.tolist())
+        ]
+
+    @staticmethod
+    def from_qiskit(qiskit_operator: QiskitSparsePauliOp) -> "Observable":
+        """Returns observable equal to Qiskit `SparsePauliOp` (Qiskit labels are reversed: the last character is qubit 0)"""
+        return Observable([(label[::-1], coefficient) for label, coefficient in qiskit_operator.to_list()])
+
+    def to_qiskit(self) -> QiskitSparsePauliOp:
+        """Converts observable to Qiskit `SparsePauliOp`"""
+        return QiskitSparsePauliOp([label[::-1] for label in self.labels], self._coefficients)
+
+    def expectation_value(self, state_vector: QuantumStateVector) -> Union[float, complex]:
+        """Returns ⟨ψ|H|ψ⟩ of the state vector. Result is real for real coefficients (Hermitian observable)"""
+        value = complex(self._coefficients @ self.term_expectation_values(state_vector))
+        return value if value.imag else value.real
+
+    def term_expectation_values(self, state_vector: QuantumStateVector) -> np.ndarray:
+        """
+        Returns ⟨ψ|P|ψ⟩ of each Pauli string term (without coefficients)
+
+        Terms are grouped by X mask. For each group `v[j] = conj(ψ[j ^ x]) ψ[j]` is computed once (bit flips are axis flips
+        of the state tensor view). Sums `Σ v[j] (-1)^popcount(j & z)` of a few terms reduce `v` over the qubits outside of `z`,
+        while groups of more than `num_qubits` terms get all sums at once by an in-place Walsh-Hadamard transform of `v`
+        """
+        if state_vector.num_qubits != self._num_qubits:
+            raise ValueError("state_vector and observable size mismatch")
+
+        n = self._num_qubits
+        tensor = state_vector.vector.reshape((2,) * n)
+        values = np.empty(len(self), dtype=np.float64)
+        for x_mask in np.unique(self._x_masks).tolist():
+            terms = np.flatnonzero(self._x_masks == x_mask)
+            if x_mask == 0:
+                products = tensor.real**2 + tensor.imag**2
+            else:
+                flip_axes = [n - 1 - qubit for qubit in range(n) if (x_mask >> qubit) & 1]
+                products = np.conj(np.flip(tensor, axis=flip_axes)) * tensor
+
+            z_masks = self._z_masks[terms].tolist()
+            if len(terms) > n:
+                sums = self._walsh_hadamard(products).ravel()[z_masks]
+            else:
+                sums = np.array([self._parity_sum(products, z_mask) for z_mask in z_masks])
+
+            # i^popcount(x & z) phase of the Y factors
+            phases = 1j ** np.array([bin(x_mask & z_mask).count("1") % 4 for z_mask in z_masks])
+            values[terms] = (phases * sums).real
+        return values
+
+    @staticmethod
+    def _parity_sum(products: np.ndarray, z_mask: int) -> complex:
+        """Returns `Σ products[j] (-1)^popcount(j & z_mask)` of the `(2,) * n` tensor `products`"""
+        n = products.ndim
+        z_axes = [n - 1 - qubit for qubit in reversed(range(n)) if (z_mask >> qubit) & 1]
+        # sum over qubits outside of the mask, then signed sum of 2^popcount(z_mask) entries
+        reduced = products.sum(axis=tuple(axis for axis in range(n) if axis not in z_axes)).ravel()
+        signs = np.ones(1)
+        for _ in z_axes:
+            signs = np.kron(signs, [1, -1])
+        return reduced @ signs
+
+    @staticmethod
+    def _walsh_hadamard(products: np.ndarray) -> np.ndarray:
+        """Returns Walsh-Hadamard transform `w[k] = Σ products[j] (-1)^popcount(j & k)` of the `(2,) * n` tensor, overwriting it"""
+        for axis in range(products.ndim):
+            amp0 = products[(slice(None),) * axis + (slice(0, 1),)]
+            amp1 = products[(slice(None),) * axis + (slice(1, 2),)]
+            difference = amp0 - amp1
+            amp0 += amp1
+            amp1[...] = difference
+        return products
@@ -1,15 +1,26 @@
 """Qiskit quantum emulator module"""
 
-from qiskit.circuit.library import UnitaryGate as QiskitUnitaryGate
+# TODO: typing.Dict is deprecated since Python 3.9. Use dict after version update
+from typing import Dict, Union
 
 from quantum_simulator.abstract_quantum_emulator import AbstractQuantumEmulator
+from quantum_simulator.observable import Observable
 from quantum_simulator.quantum_circuit import QuantumCircuit
 from quantum_simulator.quantum_operation import QuantumOperation
 from quantum_simulator.quantum_state_vector import QuantumStateVector
 
 
 class QiskitQuantumEmulator(AbstractQuantumEmulator):
-    """Qiskit quantum emulator class"""
+    """
+    Qiskit quantum emulator class
+
+    Gates and circuits are translated by cached `QuantumOperation.to_qiskit()` and `QuantumCircuit.to_qiskit()`, and a whole
+    circuit is applied by a single `Statevector.evolve()` call, so the measured time is Qiskit simulation time.
+    Qiskit kernels are opaque to `instrumentation`: it records `qiskit_<n>q` spans of `apply_gate` and `apply_circuit` circuit spans
+    """
+
+    route_clifford: bool = False
+    "Qiskit emulator is the independent reference, so Clifford-only circuits are routed to `StabilizerTableau` only if set"
 
     def __init__(self):
         pass
@@ -17,9 +28,12 @@ class QiskitQuantumEmulator(AbstractQuantumEmulator):
     def apply_gate(self, operation: QuantumOperation, state_vector: QuantumStateVector) -> QuantumStateVector:
         """Applies quantum operation to a given state vector"""
         qiskit_state_vector = state_vector.to_qiskit()
-        qiskit_gate = QiskitUnitaryGate(operation.matrix)
-        qiskit_evolved = qiskit_state_vector.evolve(qiskit_gate, qargs=operation.target_qubits)
-        output = QuantumStateVector(qiskit_evolved.data.tolist())
+        if self.instrumentation is None:
+            qiskit_evolved = qiskit_state_vector.evolve(operation.to_qiskit(), qargs=operation.target_qubits)
+        else:
+            with self.instrumentation.span(f"qiskit_{len(operation.target_qubits)}q", target_qubits=list(operation.target_qubits)):
+                qiskit_evolved = qiskit_state_vector.evolve(operation.to_qiskit(), qargs=operation.target_qubits)
+        output = QuantumStateVector(dtype=state_vector.dtype).from_qiskit(qiskit_evolved)
         return output
 
     def apply_circuit(self, circuit: QuantumCircuit, state_vector: QuantumStateVector) -> QuantumStateVector:
@@ -27,16 +41,32 @@ class QiskitQuantumEmulator(AbstractQuantumEmulator):
         if circuit.width != state_vector.num_qubits:
             raise ValueError("state_vector and circuit size mismatch")
 
-        qiskit_circuit = circuit.to_qiskit()
-        qiskit_state_vector = state_vector.to_qiskit()
-        qiskit_modified = qiskit_state_vector.evolve(qiskit_circuit)
-        output = QuantumStateVector(qiskit_modified.data.tolist())
+        # evolution copies the state once and applies circuit instructions to that copy
+        with self._circuit_span("apply_circuit", width=circuit.width, gates=circuit.gates_count):
+            qiskit_evolved = state_vector.to_qiskit().evolve(circuit.to_qiskit())
+        output = QuantumStateVector(dtype=state_vector.dtype).from_qiskit(qiskit_evolved)
         return output
 
-    # TODO clarify function arguments
-    def execute(self, circuit: QuantumCircuit):
-        """Executes given circuit"""
+    def execute(self, circuit: QuantumCircuit) -> QuantumStateVector:
+        """Executes given circuit on |0...0⟩ state. Returns final state vector"""
+        return self.apply_circuit(circuit, QuantumStateVector(circuit.width))
+
+    def execute_shots(self, circuit: QuantumCircuit, n_shots: int, seed: int = None) -> Dict[str, int]:
+        """
+        Executes shots using given circuit. Returns `{bitstring: count}` of the measured bitstrings
+
+        The circuit is simulated once and all shots are sampled from the final state. Clifford-only circuits are simulated
+        on a stabilizer tableau if `route_clifford` is set
+        """
+        tableau = self._clifford_tableau(circuit)
+        if tableau is not None:
+            return tableau.sample_counts(n_shots, seed)
+        return self.execute(circuit).sample_counts(n_shots, seed)
 
-    # TODO clarify function arguments
-    def execute_shots(self, circuit: QuantumCircuit, n_shots: int):
-        """Executes shots using given circuit"""
+    def expectation_value(self, circuit: QuantumCircuit, observable: Observable) -> Union[float, complex]:
+        """Executes given circuit on |0...0⟩ state. Returns ⟨ψ|H|ψ⟩ of the final state and `observable` H computed by Qiskit"""
+        tableau = self._clifford_tableau(circuit)
+        if tableau is not None:
+            return tableau.expectation_value(observable)
+        value = complex(self.execute(circuit).to_qiskit().expectation_value(observable.to_qiskit()))
+        return value if value.imag else value.real
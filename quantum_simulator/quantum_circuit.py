@@ -1,11 +1,44 @@
 """Quantum circuit module"""
 
-from quantum_simulator.quantum_operation import OneQubitOperation, TwoQubitsOperation
+# TODO: typing.List is deprecated since Python 3.9. Use list after version update
+from typing import BinaryIO, Iterator, List, Union
+
+import numpy as np
+from qiskit import QuantumCircuit as QiskitQuantumCircuit
+from qiskit.circuit.library import UnitaryGate as QiskitUnitaryGate
+
+from quantum_simulator.quantum_operation import QuantumOperation
 from quantum_simulator.random_generator import RandomGenerator
 
 
+class GateView:
+    """Lightweight read-only view of a gate stored in `QuantumCircuit` packed arrays. Provides `QuantumOperation` getters"""
+
+    __slots__ = ("_matrix", "_target_qubits")
+
+    def __init__(self, matrix: np.ndarray, target_qubits: List[int]):
+        self._matrix = matrix
+        self._target_qubits = target_qubits
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Returns matrix corresponding to quantum operation (view into the circuit packed matrices)"""
+        return self._matrix
+
+    @property
+    def target_qubits(self) -> List[int]:
+        """Returns list of targeted qubits"""
+        return self._target_qubits
+
+
 class QuantumCircuit:
-    """Quantum circuit class"""
+    """
+    Quantum circuit class
+
+    Gates are stored as structure of arrays in the order they were added: flat packed matrices buffer with per-gate offsets,
+    `(n_gates, 2)` int32 targets array (`-1` for the absent second target of 1-qubit gates) and int32 layer index of each gate.
+    `GateView` objects and `gate_layers` are built lazily on access
+    """
 
     _width: int
     "Number of qubits in circuit"
@@ -22,8 +55,41 @@ class QuantumCircuit:
     random_generator: RandomGenerator = None
     "Random unitary gates generator"
 
-    gate_layers: list = None
-    "Circuit gate layers - `[(list_of_layer_gates, set_of_targeted_qubits)]`"
+    _gates_count: int
+    "Number of stored gates"
+
+    _gate_matrices: np.ndarray
+    "Packed gate matrices - flat complex buffer, matrix of gate `i` is `_gate_matrices[_gate_offsets[i]:_gate_offsets[i + 1]]`"
+
+    _gate_offsets: np.ndarray
+    "Gate matrices offsets in `_gate_matrices`"
+
+    _gate_targets: np.ndarray
+    "Gate target qubits - `(n_gates, 2)` int32 array, `-1` for 1-qubit gates second target"
+
+    _gate_layer: np.ndarray
+    "Gate layer indices - int32 array"
+
+    _layers_count: int
+    "Number of gate layers"
+
+    _qubit_layers: List[int]
+    "Index of the first layer after the last layer targeting each qubit"
+
+    _layer_index: tuple = None
+    "Cached `(layer_order, layer_offsets)`"
+
+    _gate_layers: list = None
+    "Cached `gate_layers` compatibility view"
+
+    _qiskit_circuit: QiskitQuantumCircuit = None
+    "Cached `to_qiskit()` translation"
+
+    __SWAP: np.ndarray = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+    "SWAP matrix, reverses 2-qubit operation matrix bits order"
+
+    __INITIAL_CAPACITY: int = 16
+    "Initial number of gates arrays are allocated for"
 
     def __init__(self, width: int, depth: int, weight_2q: float, seed: int = 27):
         self._width = width
@@ -31,7 +97,15 @@ class QuantumCircuit:
         self.weight_2q = weight_2q
         self.seed = seed
         self.random_generator = RandomGenerator(seed=self.seed)
-        self.gate_layers = []
+
+        capacity = self.__INITIAL_CAPACITY
+        self._gates_count = 0
+        self._gate_matrices = np.empty(16 * capacity, dtype=complex)
+        self._gate_offsets = np.zeros(capacity + 1, dtype=np.int64)
+        self._gate_targets = np.full((capacity, 2), -1, dtype=np.int32)
+        self._gate_layer = np.empty(capacity, dtype=np.int32)
+        self._layers_count = 0
+        self._qubit_layers = [0] * width
 
     @property
     def depth(self):
@@ -43,35 +117,281 @@ class QuantumCircuit:
         """Number of qubits in circuit read-only property"""
         return self._width
 
+    @property
+    def gates_count(self) -> int:
+        """Number of gates in circuit read-only property"""
+        return self._gates_count
+
+    @property
+    def layers_count(self) -> int:
+        """Number of gate layers in circuit read-only property"""
+        return self._layers_count
+
+    @property
+    def gate_matrices(self) -> np.ndarray:
+        """Packed gate matrices read-only view - flat complex array, see `gate_offsets`"""
+        return self._readonly(self._gate_matrices[: self._gate_offsets[self._gates_count]])
+
+    @property
+    def gate_offsets(self) -> np.ndarray:
+        """Gate matrices offsets read-only view - matrix of gate `i` is `gate_matrices[gate_offsets[i]:gate_offsets[i + 1]]`"""
+        return self._readonly(self._gate_offsets[: self._gates_count + 1])
+
+    @property
+    def gate_targets(self) -> np.ndarray:
+        """Gate target qubits read-only view - `(gates_count, 2)` int32 array, `-1` for 1-qubit gates second target"""
+        return self._readonly(self._gate_targets[: self._gates_count])
+
+    @property
+    def gate_layer(self) -> np.ndarray:
+        """Gate layer indices read-only view - `(gates_count,)` int32 array"""
+        return self._readonly(self._gate_layer[: self._gates_count])
+
+    @property
+    def layer_order(self) -> np.ndarray:
+        """Gate indices sorted by layer. Gates of layer `k` are `layer_order[layer_offsets[k]:layer_offsets[k + 1]]`"""
+        return self._layers_index()[0]
+
+    @property
+    def layer_offsets(self) -> np.ndarray:
+        """Layer offsets in `layer_order`"""
+        return self._layers_index()[1]
+
+    @property
+    def gate_layers(self) -> list:
+        """
+        Circuit gate layers - `[(list_of_layer_gates, set_of_targeted_qubits)]`
+
+        Compatibility view built on first access and cached until the circuit is modified. Gates are `GateView` objects
+        """
+        if self._gate_layers is None:
+            self._gate_layers = [(gates, {qubit for gate in gates for qubit in gate.target_qubits}) for gates in self.iter_layers()]
+        return self._gate_layers
+
+    def gate(self, index: int) -> GateView:
+        """Returns view of the gate with `index` (in order of addition)"""
+        if not 0 <= index < self._gates_count:
+            raise IndexError(f"Gate index {index} is out of range")
+        return self._gate_view(self._readonly(self._gate_matrices), self._gate_offsets[index : index + 2].tolist(), self._gate_targets[index].tolist())
+
+    def iter_layers(self) -> Iterator[List[GateView]]:
+        """Yields lists of gate views of each layer, without materializing the whole `gate_layers`"""
+        order, offsets = self._layers_index()
+        matrices = self._readonly(self._gate_matrices)
+        gate_offsets = self._gate_offsets[: self._gates_count + 1].tolist()
+        gate_targets = self._gate_targets[: self._gates_count].tolist()
+        for layer in range(self.layers_count):
+            yield [
+                self._gate_view(matrices, gate_offsets[index : index + 2], gate_targets[index]) for index in order[offsets[layer] : offsets[layer + 1]].tolist()
+            ]
+
+    @staticmethod
+    def _gate_view(matrices: np.ndarray, offsets: List[int], targets: List[int]) -> GateView:
+        """Returns gate view from packed `matrices`, gate matrix `[start, end]` offsets and gate `targets` row"""
+        start, end = offsets
+        size = 2 if end - start == 4 else 4
+        q1, q2 = targets
+        return GateView(matrices[start:end].reshape(size, size), [q1] if q2 < 0 else [q1, q2])
+
     def generate_gates_and_unite(self) -> None:
         """
         Generates random gates.
 
-        Also compresses the layer, so that each layer has as many simultaneous operations as possible
+        Also compresses the layer, so that each layer has as many simultaneous operations as possible.
+
+        Random unitaries are not built gate by gate: generator state before each unitary coefficients is recorded and the
+        coefficients are skipped, then all unitaries are built at once by `RandomGenerator.unitaries_from_states`
         """
+        # gates - `(mode, target_qubits, index of generator state in `states[mode]`)`
+        gates = []
+        states = {"1q": [], "2q": []}
         for _ in range(self.depth):
             rand_num = self.random_generator.rand()
             if rand_num >= self.weight_2q or self.width == 1:
                 q = self.random_generator.rand_int() % self.width
-                U = self.random_generator.rand_unitary(mode="1q")
-                gate = OneQubitOperation(U, [q])
-                q1, q2 = q, q
+                mode, target_qubits = "1q", [q]
             else:
                 q1 = self.random_generator.rand_int() % self.width
                 q2 = self.random_generator.rand_int() % self.width
                 while q2 == q1:
                     q2 = self.random_generator.rand_int() % self.width
-                U = self.random_generator.rand_unitary(mode="2q")
-                gate = TwoQubitsOperation(U, [q1, q2])
-
-            # compress gate layers if possible
-            idx = len(self.gate_layers) - 1
-            while idx >= 0 and q1 not in self.gate_layers[idx][1] and q2 not in self.gate_layers[idx][1]:
-                idx -= 1
-            idx += 1
-            if idx == len(self.gate_layers):
-                self.gate_layers.append(([gate], {q1, q2}))
-            else:
-                self.gate_layers[idx][0].append(gate)
-                self.gate_layers[idx][1].add(q1)
-                self.gate_layers[idx][1].add(q2)
+                mode, target_qubits = "2q", [q1, q2]
+            gates.append((mode, target_qubits, len(states[mode])))
+            states[mode].append(self.random_generator.state)
+            self.random_generator.skip(4 if mode == "1q" else 16)
+
+        unitaries = {mode: self.random_generator.unitaries_from_states(mode_states, mode) for mode, mode_states in states.items()}
+        for mode, target_qubits, index in gates:
+            self._unite_gate(unitaries[mode][index], target_qubits)
+
+    def append_gate(self, operation: QuantumOperation) -> int:
+        """
+        Appends gate to the circuit and returns its layer index.
+
+        Gate is placed into the lowest layer after the last layer targeting any of its qubits (as `generate_gates_and_unite`
+        does), so circuits can be built gate by gate. `operation` is any object with `matrix` and `target_qubits`
+        (`QuantumOperation`, `GateView`). Appended gates are not limited by `depth`
+        """
+        matrix = np.asarray(operation.matrix)
+        target_qubits = [int(qubit) for qubit in operation.target_qubits]
+        if len(target_qubits) not in (1, 2) or matrix.shape != (2 ** len(target_qubits),) * 2:
+            raise ValueError(f"Expected 1-qubit or 2-qubit gate, got matrix of shape {matrix.shape} and {len(target_qubits)} target qubits")
+        if len(set(target_qubits)) != len(target_qubits):
+            raise ValueError(f"Target qubits should be different, got {target_qubits}")
+        if not all(0 <= qubit < self.width for qubit in target_qubits):
+            raise ValueError(f"Target qubits {target_qubits} are out of circuit width {self.width}")
+        return self._unite_gate(matrix, target_qubits)
+
+    def _unite_gate(self, matrix: np.ndarray, target_qubits: List[int]) -> int:
+        """Adds gate to the lowest layer after the last layer targeting any of its qubits. Returns gate layer index"""
+        # compress gate layers: per-qubit next free layer makes placement O(1) instead of scanning layers backwards
+        idx = max(self._qubit_layers[qubit] for qubit in target_qubits)
+        for qubit in target_qubits:
+            self._qubit_layers[qubit] = idx + 1
+        self._layers_count = max(self._layers_count, idx + 1)
+
+        index = self._gates_count
+        size = matrix.size
+        self._reserve(index + 1, self._gate_offsets[index] + size)
+        offset = self._gate_offsets[index]
+        self._gate_matrices[offset : offset + size] = matrix.ravel()
+        self._gate_offsets[index + 1] = offset + size
+        self._gate_targets[index, : len(target_qubits)] = target_qubits
+        self._gate_layer[index] = idx
+        self._gates_count += 1
+        self._layer_index = self._gate_layers = self._qiskit_circuit = None
+        return idx
+
+    def _reserve(self, n_gates: int, n_entries: int) -> None:
+        """Grows packed arrays (doubling their capacity) to hold `n_gates` gates with `n_entries` matrix entries"""
+        capacity = len(self._gate_layer)
+        if n_gates > capacity:
+            capacity = max(n_gates, 2 * capacity)
+            self._gate_offsets = self._grown(self._gate_offsets, capacity + 1)
+            self._gate_targets = self._grown(self._gate_targets, capacity, fill_value=-1)
+            self._gate_layer = self._grown(self._gate_layer, capacity)
+        if n_entries > len(self._gate_matrices):
+            self._gate_matrices = self._grown(self._gate_matrices, max(n_entries, 2 * len(self._gate_matrices)))
+
+    @staticmethod
+    def _grown(array: np.ndarray, length: int, fill_value=0) -> np.ndarray:
+        """Returns copy of `array` extended along the first axis to `length`"""
+        grown = np.full((length,) + array.shape[1:], fill_value, dtype=array.dtype)
+        grown[: len(array)] = array
+        return grown
+
+    def _layers_index(self) -> tuple:
+        """Returns cached `(layer_order, layer_offsets)`"""
+        if self._layer_index is None:
+            layers = self._gate_layer[: self._gates_count]
+            order = np.argsort(layers, kind="stable")
+            offsets = np.searchsorted(layers[order], np.arange(self.layers_count + 1))
+            self._layer_index = (self._readonly(order), self._readonly(offsets))
+        return self._layer_index
+
+    def to_qiskit(self) -> QiskitQuantumCircuit:
+        """
+        Converts QuantumCircuit to Qiskit circuit of `UnitaryGate` gates in layers order
+
+        Qubit `k` is Qiskit qubit `k`, gate target qubits are its `qargs`. Translation is built on first call and cached
+        until the circuit is modified, so it must not be modified by the caller
+        """
+        if self._qiskit_circuit is None:
+            qiskit_circuit = QiskitQuantumCircuit(self.width)
+            qubits = qiskit_circuit.qubits
+            for layer_gates in self.iter_layers():
+                for gate in layer_gates:
+                    # gate matrices are unitary by construction, skip Qiskit unitarity check
+                    qiskit_gate = QiskitUnitaryGate(gate.matrix, check_input=False)
+                    qiskit_circuit.append(qiskit_gate, [qubits[qubit] for qubit in gate.target_qubits], copy=False)
+            self._qiskit_circuit = qiskit_circuit
+        return self._qiskit_circuit
+
+    def save(self, file: Union[str, BinaryIO]) -> None:
+        """Saves circuit parameters, generator state and packed gates arrays to `file` in uncompressed NumPy `.npz` format"""
+        np.savez(
+            file,
+            params=np.array([self.width, self.depth, self.seed, self.random_generator.state], dtype=np.int64),
+            weight_2q=np.float64(self.weight_2q),
+            gate_matrices=self.gate_matrices,
+            gate_offsets=self.gate_offsets,
+            gate_targets=self.gate_targets,
+            gate_layer=self.gate_layer,
+        )
+
+    @classmethod
+    def load(cls, file: Union[str, BinaryIO]) -> "QuantumCircuit":
+        """Loads circuit saved by `save()`. Gates keep their layers and further gates are layered as in the saved circuit"""
+        with np.load(file, allow_pickle=False) as data:
+            width, depth, seed, generator_state = np.asarray(data["params"]).tolist()
+            circuit = cls(width=width, depth=depth, weight_2q=float(data["weight_2q"]), seed=seed)
+            circuit.random_generator.generate_initial_num(generator_state, n0=0)
+            circuit._set_gates(data["gate_matrices"], data["gate_offsets"], data["gate_targets"], data["gate_layer"])
+        return circuit
+
+    def _set_gates(self, matrices: np.ndarray, offsets: np.ndarray, targets: np.ndarray, layers: np.ndarray) -> None:
+        """Replaces gates by packed arrays (as returned by `gate_matrices`, `gate_offsets`, `gate_targets` and `gate_layer`)"""
+        self._gate_matrices = np.array(matrices, dtype=complex)
+        self._gate_offsets = np.array(offsets, dtype=np.int64)
+        self._gate_targets = np.array(targets, dtype=np.int32).reshape(-1, 2)
+        self._gate_layer = np.array(layers, dtype=np.int32)
+        self._gates_count = len(self._gate_layer)
+        self._layers_count = int(self._gate_layer.max()) + 1 if self._gates_count else 0
+
+        # first layer after the last layer targeting each qubit, `-1` targets go to the extra last slot
+        qubit_layers = np.zeros(self.width + 1, dtype=np.int64)
+        np.maximum.at(qubit_layers, self._gate_targets.ravel(), np.repeat(self._gate_layer + 1, 2))
+        self._qubit_layers = qubit_layers[: self.width].tolist()
+        self._layer_index = self._gate_layers = self._qiskit_circuit = None
+
+    @staticmethod
+    def _readonly(array: np.ndarray) -> np.ndarray:
+        """Returns read-only view of `array`"""
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def fuse_gates(self) -> "QuantumCircuit":
+        """
+        Gate fusion optimization pass. Returns new circuit with the same action and fewer gates.
+
+        Consecutive 1-qubit operations on the same qubit are multiplied into a single 2x2 matrix. 1-qubit operations adjacent to
+        a 2-qubit operation on the same wire, as well as consecutive 2-qubit operations on the same pair of qubits,
+        are absorbed into the 4x4 matrix of that 2-qubit operation
+        """
+        # fused gates - `[matrix, target_qubits]`
+        fused = []
+        # 1-qubit matrices not absorbed into any 2-qubit operation yet - `{qubit: matrix}`
+        pending = {}
+        # index in `fused` of the 2-qubit operation being the last operation on qubit - `{qubit: index}`
+        last_2q = {}
+
+        for layer_gates in self.iter_layers():
+            for gate in layer_gates:
+                if len(gate.target_qubits) == 1:
+                    q = gate.target_qubits[0]
+                    if q in last_2q:
+                        matrix, (q1, _) = fused[last_2q[q]]
+                        expanded = np.kron(np.eye(2), gate.matrix) if q == q1 else np.kron(gate.matrix, np.eye(2))
+                        fused[last_2q[q]][0] = expanded @ matrix
+                    else:
+                        pending[q] = gate.matrix @ pending[q] if q in pending else gate.matrix
+                    continue
+
+                q1, q2 = gate.target_qubits
+                if q1 in last_2q and last_2q[q1] == last_2q.get(q2):
+                    matrix, (p1, _) = fused[last_2q[q1]]
+                    gate_matrix = gate.matrix if p1 == q1 else self.__SWAP @ gate.matrix @ self.__SWAP
+                    fused[last_2q[q1]][0] = gate_matrix @ matrix
+                    continue
+
+                before = np.kron(pending.pop(q2, np.eye(2)), pending.pop(q1, np.eye(2)))
+                fused.append([gate.matrix @ before, [q1, q2]])
+                last_2q[q1] = last_2q[q2] = len(fused) - 1
+
+        fused.extend([matrix, [q]] for q, matrix in pending.items())
+
+        circuit = QuantumCircuit(width=self.width, depth=len(fused), weight_2q=self.weight_2q, seed=self.seed)
+        for matrix, target_qubits in fused:
+            circuit.append_gate(GateView(matrix, target_qubits))
+        return circuit
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 
 import numpy as np
+from qiskit.circuit.library import UnitaryGate as QiskitUnitaryGate
 
 
 class QuantumOperation(ABC):
@@ -11,6 +12,27 @@ class QuantumOperation(ABC):
     _matrix: np.ndarray
     _target_qubits: list
 
+    DIAGONAL: str = "diagonal"
+    "Kind of operations with diagonal matrix (phases only)"
+
+    PERMUTATION: str = "permutation"
+    "Kind of operations with a single non-zero entry in each row and column of matrix (permutation with phases)"
+
+    GENERIC: str = "generic"
+    "Kind of operations with any other matrix"
+
+    _kind: str
+    "Matrix kind - `DIAGONAL`, `PERMUTATION` or `GENERIC`"
+
+    _permutation: np.ndarray = None
+    "Column of the non-zero entry of each matrix row, `None` for generic operations"
+
+    _phases: np.ndarray = None
+    "Non-zero entry of each matrix row, `None` for generic operations"
+
+    _qiskit_gate: QiskitUnitaryGate = None
+    "Cached `to_qiskit()` translation"
+
     __I: np.ndarray
     "Pauli I operation matrix"
 
@@ -29,6 +51,7 @@ class QuantumOperation(ABC):
             )
         self._matrix = matrix
         self._target_qubits = target_qubits
+        self._kind, self._permutation, self._phases = self.classify(matrix)
 
     @property
     def matrix(self) -> np.ndarray:
@@ -40,6 +63,44 @@ class QuantumOperation(ABC):
         """Returns list of targeted qubits"""
         return self._target_qubits
 
+    @property
+    def kind(self) -> str:
+        """Returns matrix kind - `DIAGONAL`, `PERMUTATION` or `GENERIC`"""
+        return self._kind
+
+    @property
+    def permutation(self) -> np.ndarray:
+        """Returns column of the non-zero entry of each matrix row (`None` for generic operations)"""
+        return self._permutation
+
+    @property
+    def phases(self) -> np.ndarray:
+        """Returns non-zero entry of each matrix row (`None` for generic operations)"""
+        return self._phases
+
+    def to_qiskit(self) -> QiskitUnitaryGate:
+        """Converts operation to Qiskit `UnitaryGate`. Gate is built on first call and cached"""
+        if self._qiskit_gate is None:
+            self._qiskit_gate = QiskitUnitaryGate(self._matrix)
+        return self._qiskit_gate
+
+    @staticmethod
+    def classify(matrix: np.ndarray) -> tuple:
+        """
+        Classifies square `matrix`. Returns `(kind, permutation, phases)`
+
+        Matrix with a single non-zero entry in each row and column acts as `new[i] = phases[i] * old[permutation[i]]`.
+        It is `DIAGONAL` if `permutation` is the identity and `PERMUTATION` otherwise. Other matrices are `GENERIC`
+        with `permutation` and `phases` being `None`. Entries are compared with exact zero
+        """
+        nonzero = matrix != 0
+        if np.count_nonzero(nonzero) != len(matrix) or not (nonzero.any(axis=0).all() and nonzero.any(axis=1).all()):
+            return QuantumOperation.GENERIC, None, None
+        permutation = nonzero.argmax(axis=1)
+        phases = matrix[np.arange(len(matrix)), permutation]
+        kind = QuantumOperation.DIAGONAL if (permutation == np.arange(len(matrix))).all() else QuantumOperation.PERMUTATION
+        return kind, permutation, phases
+
     @staticmethod
     @abstractmethod
     def target_matrix_size() -> int:
@@ -135,6 +196,9 @@ class TwoQubitsOperation(QuantumOperation):
     __CZ: np.ndarray = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, -1]])
     "CZ operation matrix"
 
+    __SWAP: np.ndarray = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+    "SWAP operation matrix"
+
     def __init__(self, matrix, target_qubits):
         super().__init__(matrix, target_qubits)
 
@@ -155,3 +219,10 @@ class TwoQubitsOperation(QuantumOperation):
         if target_qubits is None:
             target_qubits = [0, 1]
         return TwoQubitsOperation(TwoQubitsOperation.__CZ, target_qubits)
+
+    @staticmethod
+    def SWAP(target_qubits: list = None):
+        """SWAP operation"""
+        if target_qubits is None:
+            target_qubits = [0, 1]
+        return TwoQubitsOperation(TwoQubitsOperation.__SWAP, target_qubits)
@@ -1,9 +1,13 @@
 "Quantum state vector holder module"
 
 import math
+import weakref
+from multiprocessing import shared_memory
 
-# TODO: typing.List is deprecated since Python 3.9. Use list after version update
-from typing import Union, List
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Dict, Union, List
+
+import numpy as np
 from qiskit.quantum_info import Statevector as QiskitStateVector
 
 
@@ -18,58 +22,113 @@ class QuantumStateVector:
         and 0b1010 (10 in decimal) respectively
 
         |0000⟩ is indexed by 0.
+
+        Measured bitstrings follow the |ket⟩ notation: index 0b1000 of a 4-qubit state is measured as "0001".
+
+    Storage:
+        Amplitudes are stored in a contiguous NumPy buffer of `complex128` (default) or `complex64` dtype.
+        Initialization from a NumPy array of the same dtype, `from_qiskit()` and `to_qiskit()` share memory instead of copying.
+        `from_file()` keeps amplitudes in a memory-mapped file for states not fitting in RAM.
+        `from_shared_memory()` keeps amplitudes in a `multiprocessing.shared_memory` block attached by other processes.
     """
 
-    _vector: List[complex] = None
+    SUPPORTED_DTYPES = (np.complex64, np.complex128)
+    "Supported amplitudes dtypes"
+
+    _vector: np.ndarray = None
     "State complex vector"
 
     _num_qubits: int = None
     "Number of targeted qubits"
 
-    def __init__(self, initializer: Union[list, int] = 1):
-        if isinstance(initializer, list):
-            # Initialize from the list
+    _dtype: np.dtype = None
+    "Amplitudes dtype"
+
+    _filename: str = None
+    "Path of the file amplitudes are memory-mapped to, `None` for in-memory states"
+
+    _shared_memory: shared_memory.SharedMemory = None
+    "Shared memory block holding the amplitudes, `None` for other states"
+
+    _shared_memory_release: weakref.finalize = None
+    "Finalizer unlinking the shared memory block created by the state, `None` for attached blocks"
+
+    def __init__(self, initializer: Union[list, np.ndarray, int] = 1, dtype: type = np.complex128):
+        dtype = np.dtype(dtype)
+        if dtype not in self.SUPPORTED_DTYPES:
+            raise TypeError(f"Unsupported dtype {dtype}. Should be one of {self.SUPPORTED_DTYPES}")
+        self._dtype = dtype
+
+        if isinstance(initializer, (list, np.ndarray)):
+            # Initialize from the list or array
             self.from_list(initializer)
-        elif isinstance(initializer, int):
+        elif isinstance(initializer, (int, np.integer)):
             # Initialize from num_qubits
-            self.from_num_qubits(initializer)
+            self.from_num_qubits(int(initializer))
         else:
             raise TypeError("Wrong initializer type. You must provide either list of amplitudes or number of qubits.")
 
     @property
-    def vector(self) -> List[complex]:
+    def vector(self) -> np.ndarray:
         """QuantumStateVector._vector getter"""
         return self._vector
 
     @vector.setter
-    def vector(self, new_vector: List[complex]) -> None:
+    def vector(self, new_vector: Union[List[complex], np.ndarray]) -> None:
         """QuantumStateVector._vector setter"""
         if len(new_vector) != self.length:
             raise ValueError(f"The new vector length ({len(new_vector)}) does not match the expected length ({self.length}).")
-        self._vector = new_vector
+        if self._shared_memory is not None:
+            # amplitudes stay in the block attached by other processes
+            self._vector[...] = new_vector
+        else:
+            self._vector = np.asarray(new_vector, dtype=self._dtype)
 
     @property
     def num_qubits(self) -> int:
         """QuantumStateVector._num_qubits getter"""
         return self._num_qubits
 
+    @property
+    def dtype(self) -> np.dtype:
+        """QuantumStateVector._dtype getter"""
+        return self._dtype
+
+    @property
+    def filename(self) -> str:
+        """Returns path of the file amplitudes are memory-mapped to, `None` for in-memory states"""
+        return self._filename
+
+    @property
+    def shared_memory_name(self) -> str:
+        """Returns name of the shared memory block holding the amplitudes, `None` for other states"""
+        return None if self._shared_memory is None else self._shared_memory.name
+
     @property
     def length(self) -> int:
         """Returns vector length"""
         return 2**self._num_qubits
 
+    @property
+    def nbytes(self) -> int:
+        """Returns amplitudes buffer size in bytes"""
+        return self._vector.nbytes
+
     def __getitem__(self, key: int) -> complex:
-        if not isinstance(key, int):
+        if not isinstance(key, (int, np.integer)):
             raise TypeError("Indexing key must be an integer.")
         return self._vector[key]
 
     def __setitem__(self, key: int, value: complex) -> None:
-        if not isinstance(key, int):
+        if not isinstance(key, (int, np.integer)):
             raise TypeError("Indexing key must be an integer.")
         self._vector[key] = value
 
-    def from_list(self, new_vector: List[complex]):
-        """Returns state vector from vector with complex amplitudes"""
+    def from_list(self, new_vector: Union[List[complex], np.ndarray]):
+        """Returns state vector from vector with complex amplitudes. NumPy arrays of the state dtype are not copied"""
+        new_vector = np.asarray(new_vector, dtype=self._dtype)
+        if new_vector.ndim != 1:
+            raise ValueError("New vector must be one-dimensional.")
         length = len(new_vector)
 
         # Check if the length is a power of 2
@@ -80,6 +139,8 @@ class QuantumStateVector:
         self._num_qubits = round(math.log2(length))
         # Set new vector
         self._vector = new_vector
+        self._filename = None
+        self._set_shared_memory(None, None)
         return self
 
     def from_num_qubits(self, num_qubits: int):
@@ -90,14 +151,144 @@ class QuantumStateVector:
             raise ValueError("Number of qubits must be not less than one.")
 
         state_vector_length = 2**num_qubits
-        vector = [0] * state_vector_length
+        vector = np.zeros(state_vector_length, dtype=self._dtype)
         # Initialize in the |0⟩ state
         vector[0] = 1
         self._num_qubits = num_qubits
         self._vector = vector
+        self._filename = None
+        self._set_shared_memory(None, None)
+        return self
+
+    def from_file(self, filename: str, num_qubits: int = None):
+        """
+        Returns state vector memory-mapped to `filename` file
+
+        With `num_qubits` the file is created (or overwritten) and initialized to |0> state, otherwise existing file
+        of the state dtype amplitudes is opened. Changes of amplitudes are written to the file, see `flush()`
+        """
+        if num_qubits is None:
+            vector = np.memmap(filename, dtype=self._dtype, mode="r+")
+        else:
+            if not isinstance(num_qubits, int):
+                raise TypeError("Number of qubits must be an integer.")
+            if num_qubits < 1:
+                raise ValueError("Number of qubits must be not less than one.")
+            # new file is zero-filled
+            vector = np.memmap(filename, dtype=self._dtype, mode="w+", shape=(2**num_qubits,))
+            vector[0] = 1
+
+        length = len(vector)
+        if not (length > 1 and (length & (length - 1)) == 0):
+            raise ValueError("Length of the file vector must be a power of 2.")
+        self._num_qubits = round(math.log2(length))
+        self._vector = vector
+        self._filename = str(filename)
+        self._set_shared_memory(None, None)
+        return self
+
+    def from_shared_memory(self, name: str = None, num_qubits: int = None):
+        """
+        Returns state vector with amplitudes in a `multiprocessing.shared_memory` block, attached by other processes by name
+
+        With `num_qubits` a new block (named `name` or a generated name) is created and initialized to |0> state. The block
+        is unlinked when the state is garbage collected or reinitialized. Otherwise existing block `name` of the state dtype
+        amplitudes is attached. Blocks are unmapped when the state and all views of its amplitudes are deleted
+        """
+        if num_qubits is None:
+            if name is None:
+                raise ValueError("Name of the shared memory block to attach is required.")
+            memory = shared_memory.SharedMemory(name=name)
+            length = memory.size // self._dtype.itemsize
+        else:
+            if not isinstance(num_qubits, int):
+                raise TypeError("Number of qubits must be an integer.")
+            if num_qubits < 1:
+                raise ValueError("Number of qubits must be not less than one.")
+            memory = shared_memory.SharedMemory(name=name, create=True, size=2**num_qubits * self._dtype.itemsize)
+            length = 2**num_qubits
+        release = None if num_qubits is None else weakref.finalize(self, memory.unlink)
+        if not (length > 1 and (length & (length - 1)) == 0):
+            raise ValueError("Length of the shared memory vector must be a power of 2.")
+
+        vector = np.asarray(_SharedMemoryBuffer(memory, self._dtype, length))
+        if num_qubits is not None:
+            # new block is zero-filled
+            vector[0] = 1
+        self._num_qubits = round(math.log2(length))
+        self._vector = vector
+        self._filename = None
+        self._set_shared_memory(memory, release)
         return self
 
+    def _set_shared_memory(self, memory: shared_memory.SharedMemory, release: weakref.finalize) -> None:
+        """Replaces shared memory block of the state, releasing the previous one. Called after the amplitudes are replaced"""
+        if self._shared_memory_release is not None:
+            self._shared_memory_release()
+        self._shared_memory = memory
+        self._shared_memory_release = release
+
+    def flush(self) -> None:
+        """Writes changes of memory-mapped amplitudes to the file. Does nothing for in-memory states"""
+        if isinstance(self._vector, np.memmap):
+            self._vector.flush()
+
+    def from_qiskit(self, qiskit_state_vector: QiskitStateVector):
+        """Returns state vector sharing memory with QiskitStateVector (copies only if state dtype differs from complex128)"""
+        return self.from_list(qiskit_state_vector.data)
+
     def to_qiskit(self) -> QiskitStateVector:
-        """Converts QuantumStateVector to QiskitStateVector"""
+        """Converts QuantumStateVector to QiskitStateVector. Shares memory for `complex128` states"""
         qiskit_state_vector = QiskitStateVector(self.vector)
         return qiskit_state_vector
+
+    def copy(self):
+        """Returns a deep copy of the state vector. Copy of a memory-mapped or shared memory state is kept in memory"""
+        return QuantumStateVector(np.array(self._vector, dtype=self._dtype), dtype=self._dtype)
+
+    def probabilities(self) -> np.ndarray:
+        """Returns measurement probabilities of the basis states"""
+        return self._vector.real**2 + self._vector.imag**2
+
+    def sample(self, n_shots: int, seed: int = None) -> np.ndarray:
+        """
+        Samples `n_shots` basis state indices (in ascending order) from measurement probabilities distribution.
+
+        All shots are drawn at once: sorted uniform numbers are built from normalized cumulative sums of exponential
+        variates and located in the cumulative probability distribution by a single `searchsorted` call
+        """
+        if n_shots < 1:
+            raise ValueError("Number of shots must be not less than one.")
+        rng = np.random.default_rng(seed)
+        # double precision sums keep `complex64` states distribution unbiased
+        cumulative = np.cumsum(self.probabilities(), dtype=np.float64)
+        spacings = np.cumsum(rng.standard_exponential(n_shots + 1))
+        uniforms = spacings[:-1] * (cumulative[-1] / spacings[-1])
+        indices = np.searchsorted(cumulative, uniforms, side="right")
+        return np.minimum(indices, self.length - 1)
+
+    def sample_counts(self, n_shots: int, seed: int = None) -> Dict[str, int]:
+        """Samples `n_shots` measurements of all qubits. Returns `{bitstring: count}` of the measured bitstrings"""
+        counts = np.bincount(self.sample(n_shots, seed), minlength=self.length)
+        indices = np.flatnonzero(counts)
+        return dict(zip(self.bitstrings(indices, self._num_qubits), counts[indices].tolist()))
+
+    @staticmethod
+    def bitstrings(indices: np.ndarray, num_qubits: int) -> List[str]:
+        """Returns |ket⟩ notation bitstrings of the basis state `indices` (first qubit is leftmost)"""
+        indices = np.asarray(indices, dtype=np.int64)
+        chars = ((indices[:, None] >> np.arange(num_qubits)) & 1).astype(np.uint8) + ord("0")
+        return chars.view(f"S{num_qubits}").ravel().astype(f"U{num_qubits}").tolist()
+
+
+class _SharedMemoryBuffer:  # pylint: disable=too-few-public-methods
+    """
+    Amplitudes buffer of a shared memory block, the base of NumPy arrays of the block amplitudes
+
+    NumPy arrays created from `SharedMemory.buf` do not keep the block mapped, so closing the block would leave them dangling.
+    Arrays created by `np.asarray` of this buffer reference it, and so the block, which is closed when they all are deleted
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, dtype: np.dtype, length: int):
+        self.memory = memory
+        self.__array_interface__ = np.ndarray((length,), dtype=dtype, buffer=memory.buf).__array_interface__  # pylint: disable=no-member
@@ -7,8 +7,15 @@ import scipy as sc
 class RandomGenerator:
     """
     Random generator class
+
+    Linear congruential generator `x[k + 1] = (a * x[k] + c) % m`. Jump-ahead coefficients `x[k + n] = (A_n * x[k] + C_n) % m`
+    are used for O(log n) `skip(n)` and for bulk draws (`rand_ints(n)`, `rands(n, L)`) producing the same sequence as
+    repeated `rand_int()` and `rand(L)` calls
     """
 
+    SEQUENTIAL_MAX: int = 64
+    "Bulk draws of up to `SEQUENTIAL_MAX` values are generated by a plain loop, which is faster for small arrays"
+
     _m: int
     "m value - divisor for remainder operation"
 
@@ -24,6 +31,18 @@ class RandomGenerator:
     _state: int
     "current generator value"
 
+    _jumps: dict
+    "Cached jump-ahead coefficients - `{n: (A_n, C_n)}`"
+
+    JUMPS_CACHE_SIZE: int = 256
+    "Max number of cached jump-ahead coefficients"
+
+    __HERMITIAN_1Q: tuple = ([0, 3], [(0, 1, 1)])
+    "1-qubit generator layout: diagonal coefficient indices, upper triangle `(row, column, real_part_coefficient_index)`"
+
+    __HERMITIAN_2Q: tuple = ([0, 7, 12, 15], [(0, 1, 1), (0, 2, 3), (0, 3, 5), (1, 2, 8), (1, 3, 10), (2, 3, 13)])
+    "2-qubit generator layout: diagonal coefficient indices, upper triangle `(row, column, real_part_coefficient_index)`"
+
     def __init__(self, m: int = 65537, a: int = 75, c: int = 74, seed: int = 27):
         """
         RandomGenerator initializer
@@ -32,6 +51,7 @@ class RandomGenerator:
         self._a = a
         self._c = c
         self._seed = seed
+        self._jumps = {}
         self._state = self.generate_initial_num(seed, n0=99)
 
     def rand_int(self):
@@ -49,10 +69,60 @@ class RandomGenerator:
     def generate_initial_num(self, seed: int, n0: int):
         """Skips `n0` random numbers"""
         self._state = seed
-        for _ in range(n0):
-            self._state = self.rand_int()
+        self.skip(n0)
         return self._state
 
+    def jump_coefficients(self, n: int) -> tuple:
+        """Returns `(A_n, C_n)` such that `n` generator steps map state `x` to `(A_n * x + C_n) % m`"""
+        if n < 0:
+            raise ValueError("Number of steps must be non-negative")
+        if n in self._jumps:
+            return self._jumps[n]
+        steps = n
+        # (A, C) - accumulated map, (a, c) - map of 2^i steps
+        A, C = 1, 0
+        a, c = self.a % self.m, self.c % self.m
+        while n:
+            if n & 1:
+                A, C = (a * A) % self.m, (a * C + c) % self.m
+            a, c = (a * a) % self.m, (a * c + c) % self.m
+            n >>= 1
+        if len(self._jumps) < self.JUMPS_CACHE_SIZE:
+            self._jumps[steps] = (A, C)
+        return A, C
+
+    def skip(self, n: int):
+        """Skips `n` random numbers in O(log n). Updates self"""
+        A, C = self.jump_coefficients(n)
+        self._state = (A * self._state + C) % self.m
+        return self
+
+    def rand_ints(self, n: int) -> np.ndarray:
+        """Returns array of `n` next `rand_int()` values. Updates self"""
+        if n < 0:
+            raise ValueError("Number of values must be non-negative")
+        # int64 products of two values below 2^31 do not overflow
+        dtype = np.int64 if self.m <= 2**31 else object
+        if n <= self.SEQUENTIAL_MAX:
+            return np.array([self.rand_int() for _ in range(n)], dtype=dtype)
+
+        values = np.empty(n, dtype=dtype)
+        values[0] = (self.a * self._state + self.c) % self.m
+        filled = 1
+        while filled < n:
+            # values[filled:2 * filled] are `filled` steps ahead of values[:filled]
+            block = min(filled, n - filled)
+            A, C = self.jump_coefficients(filled)
+            values[filled : filled + block] = (A * values[:block] + C) % self.m
+            filled += block
+        self._state = int(values[-1])
+        return values
+
+    def rands(self, n: int, L: int = None) -> np.ndarray:
+        """Returns array of `n` next `rand(L)` values. Updates self"""
+        values = self.rand_ints(n) / self.m
+        return values if L is None else (values - 0.5) * 2 * L
+
     @property
     def m(self):
         """RandomGenerator._m readonly getter"""
@@ -82,10 +152,10 @@ class RandomGenerator:
         """Builds and returns random unitary matrix using random generator"""
         assert mode in ["1q", "2q"], f"'{mode}' mode is not supported, should be '1q' or '2q'"
         if mode == "1q":
-            c = [self.rand(L=100) for _ in range(4)]
+            c = self.rands(4, L=100).tolist()
             U = 1j * np.array([[c[0], c[1] + 1j * c[2]], [c[1] - 1j * c[2], c[3]]])
         else:
-            c = [self.rand(L=100) for _ in range(16)]
+            c = self.rands(16, L=100).tolist()
             U = 1j * np.array(
                 [
                     [c[0], c[1] + 1j * c[2], c[3] + 1j * c[4], c[5] + 1j * c[6]],
@@ -95,3 +165,44 @@ class RandomGenerator:
                 ]
             )
         return sc.linalg.expm(U)
+
+    def sequences(self, states: np.ndarray, n: int) -> np.ndarray:
+        """Returns `(len(states), n)` array of `n` values `rand_int()` would return after each of the generator `states`"""
+        states = np.asarray(states, dtype=np.int64 if self.m <= 2**31 else object)
+        coefficients = np.array([self.jump_coefficients(i) for i in range(1, n + 1)], dtype=states.dtype).reshape(n, 2)
+        return (coefficients[:, 0] * states[:, None] + coefficients[:, 1]) % self.m
+
+    def rand_unitaries(self, mode: str, n: int) -> np.ndarray:
+        """Returns `(n, d, d)` array of `n` unitaries built by consecutive `rand_unitary(mode)` calls. Updates self"""
+        assert mode in ["1q", "2q"], f"'{mode}' mode is not supported, should be '1q' or '2q'"
+        n_coefficients = 4 if mode == "1q" else 16
+        coefficients = self.rands(n * n_coefficients, L=100).reshape(n, n_coefficients)
+        return self.unitaries_from_coefficients(coefficients, mode)
+
+    def unitaries_from_states(self, states: np.ndarray, mode: str) -> np.ndarray:
+        """Returns `(len(states), d, d)` array of unitaries `rand_unitary(mode)` would return after each of the generator `states`"""
+        assert mode in ["1q", "2q"], f"'{mode}' mode is not supported, should be '1q' or '2q'"
+        n_coefficients = 4 if mode == "1q" else 16
+        coefficients = (self.sequences(states, n_coefficients) / self.m - 0.5) * 2 * 100
+        return self.unitaries_from_coefficients(coefficients.astype(float), mode)
+
+    @staticmethod
+    def unitaries_from_coefficients(coefficients: np.ndarray, mode: str) -> np.ndarray:
+        """
+        Builds `(N, d, d)` array of unitaries `expm(iH)` from `(N, d * d)` Hermitian generators `H` coefficients (see `rand_unitary`).
+
+        All generators are exponentiated at once by a stacked eigendecomposition `H = V diag(w) V^†`, `expm(iH) = V diag(exp(iw)) V^†`
+        """
+        assert mode in ["1q", "2q"], f"'{mode}' mode is not supported, should be '1q' or '2q'"
+        diagonal, upper = RandomGenerator.__HERMITIAN_1Q if mode == "1q" else RandomGenerator.__HERMITIAN_2Q
+        size = len(diagonal)
+        coefficients = np.asarray(coefficients, dtype=float)
+
+        H = np.zeros((len(coefficients), size, size), dtype=complex)
+        H[:, range(size), range(size)] = coefficients[:, diagonal]
+        for row, column, index in upper:
+            H[:, row, column] = coefficients[:, index] + 1j * coefficients[:, index + 1]
+            H[:, column, row] = coefficients[:, index] - 1j * coefficients[:, index + 1]
+
+        w, V = np.linalg.eigh(H)
+        return (V * np.exp(1j * w)[:, None, :]) @ V.conj().transpose(0, 2, 1)
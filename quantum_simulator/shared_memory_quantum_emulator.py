@@ -0,0 +1,192 @@
+"""Shared memory quantum emulator module"""
+
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+
+# TODO: typing.List is deprecated since Python 3.9. Use list after version update
+from typing import Iterable, List
+
+import numpy as np
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+class SharedMemoryQuantumEmulator(CustomQuantumEmulator):
+    """
+    Shared memory quantum emulator class
+
+    Circuits are applied to states of at least `PARALLEL_MIN_QUBITS` qubits by `n_workers` worker processes, so a single
+    large simulation is not limited by the GIL of one process. Such states live in `multiprocessing.shared_memory` blocks
+    (see `QuantumStateVector.from_shared_memory`): `execute` creates its |0...0⟩ state there and `apply_circuit` its output
+    state, and each worker attaches the block and applies the gates to its own chunks of the state without copies.
+
+    Layer blocks of the circuit (see `CustomQuantumEmulator.apply_circuit`) are grouped: consecutive blocks leaving at least
+    `log2(n_workers)` untargeted qubits form a group, and the state is split into disjoint chunks by fixing the highest of
+    these qubits (see `CustomQuantumEmulator._split_state`). Worker `i` applies all group blocks to chunks `i::n_workers`
+    and waits for the other workers at a `multiprocessing.Barrier`, since the next group splits the state by other qubits.
+    Usually every layer of `circuit.gate_layers` makes a single group.
+
+    Circuit blocks are sent to the workers once per circuit. The workers are started by the first parallel circuit and
+    kept until `close`. `apply_circuit_inplace` of states not in shared memory, single gates, batches and smaller states
+    are processed by the calling process and its worker threads as by `CustomQuantumEmulator`. `instrumentation` records
+    circuit spans only
+    """
+
+    n_workers: int
+    "Number of worker processes applying gates to disjoint state chunks"
+
+    _workers: list = None
+    "Started worker processes - list of `(process, connection)`"
+
+    _barrier: multiprocessing.Barrier = None
+    "Barrier the workers wait at after every group of blocks"
+
+    def __init__(self, layer_block_qubits: int = 5, n_workers: int = None, chunk_qubits: int = 20, dtype: type = np.complex128, remap_qubits: bool = False):
+        super().__init__(layer_block_qubits, 1, chunk_qubits, dtype, remap_qubits)
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers < 1:
+            raise ValueError("n_workers must be not less than one")
+        self.n_workers = n_workers
+
+    def apply_circuit(self, circuit: QuantumCircuit, state_vector: QuantumStateVector) -> QuantumStateVector:
+        """
+        Applies quantum circuit to a given state vector
+
+        The output state of a parallel circuit is created in a shared memory block and processed there by the worker processes
+        """
+        if circuit.width != state_vector.num_qubits:
+            raise ValueError("state_vector and circuit size mismatch")
+        if not self._parallel(circuit.width):
+            return super().apply_circuit(circuit, state_vector)
+        output = QuantumStateVector(dtype=state_vector.dtype).from_shared_memory(num_qubits=state_vector.num_qubits)
+        output.vector[...] = state_vector.vector
+        return self.apply_circuit_inplace(circuit, output)
+
+    def apply_circuit_inplace(self, circuit: QuantumCircuit, state_vector: QuantumStateVector) -> QuantumStateVector:
+        """
+        Applies quantum circuit to a given state vector in place. Returns the same state vector
+
+        States in shared memory blocks are processed by the worker processes, other states by the calling process
+        """
+        if state_vector.shared_memory_name is None or not self._parallel(state_vector.num_qubits):
+            return super().apply_circuit_inplace(circuit, state_vector)
+        if circuit.width != state_vector.num_qubits:
+            raise ValueError("state_vector and circuit size mismatch")
+
+        groups = self._group_blocks(self._circuit_blocks(state_vector.vector, circuit), circuit.width, self.n_workers)
+        job = {"name": state_vector.shared_memory_name, "shape": (2,) * circuit.width, "dtype": state_vector.dtype.str, "groups": groups}
+        with self._circuit_span("apply_circuit", width=circuit.width, gates=circuit.gates_count, workers=self.n_workers):
+            self._run_workers(job)
+        return state_vector
+
+    def execute(self, circuit: QuantumCircuit) -> QuantumStateVector:
+        """Executes given circuit on |0...0⟩ state. Returns final state vector, in a shared memory block for parallel circuits"""
+        if not self._parallel(circuit.width):
+            return super().execute(circuit)
+        return self.apply_circuit_inplace(circuit, QuantumStateVector(dtype=self.dtype).from_shared_memory(num_qubits=circuit.width))
+
+    def close(self) -> None:
+        """Stops the worker processes and threads. They are started again by the next parallel circuit or split gate"""
+        super().close()
+        if self._workers is None:
+            return
+        for _, connection in self._workers:
+            connection.send(None)
+            connection.close()
+        for process, _ in self._workers:
+            process.join()
+        self._workers = None
+        self._barrier = None
+
+    def _parallel(self, num_qubits: int) -> bool:
+        """Returns whether circuits on states of `num_qubits` qubits are applied by the worker processes"""
+        return self.n_workers > 1 and num_qubits >= self.PARALLEL_MIN_QUBITS
+
+    def _run_workers(self, job: dict) -> None:
+        """Sends `job` to every worker process and waits for all of them to finish it"""
+        if self._workers is None:
+            self._barrier = multiprocessing.Barrier(self.n_workers)
+            self._workers = []
+            for index in range(self.n_workers):
+                connection, worker_connection = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=run_worker, args=(worker_connection, self._barrier, index, self.n_workers), daemon=True)
+                process.start()
+                worker_connection.close()
+                self._workers.append((process, connection))
+
+        for _, connection in self._workers:
+            connection.send(job)
+        errors = [error for error in (connection.recv() for _, connection in self._workers) if error is not None]
+        if errors:
+            self._barrier.reset()
+            raise RuntimeError(f"Worker process failed: {errors[0]}")
+
+    @staticmethod
+    def _group_blocks(blocks: Iterable[tuple], width: int, n_workers: int) -> list:
+        """
+        Groups `(matrix, target_qubits, structure)` blocks to apply between barriers of `n_workers` workers.
+
+        Returns list of `(fixed_qubits, chunk_blocks)`. Chunks of the state with fixed values of `fixed_qubits` are processed
+        independently, and target qubits of `chunk_blocks` are renumbered to the chunk qubits
+        """
+        n_fixed = (n_workers - 1).bit_length()
+        groups, group_blocks, used = [], [], set()
+        for block in blocks:
+            if group_blocks and width - len(used.union(block[1])) < n_fixed:
+                groups.append(SharedMemoryQuantumEmulator._chunk_group(group_blocks, used, width, n_fixed))
+                group_blocks, used = [], set()
+            group_blocks.append(block)
+            used.update(block[1])
+        if group_blocks:
+            groups.append(SharedMemoryQuantumEmulator._chunk_group(group_blocks, used, width, n_fixed))
+        return groups
+
+    @staticmethod
+    def _chunk_group(blocks: List[tuple], used_qubits: set, width: int, n_fixed: int) -> tuple:
+        """Returns `(fixed_qubits, chunk_blocks)` of `blocks` fixing up to `n_fixed` highest qubits not in `used_qubits`"""
+        fixed_qubits = [qubit for qubit in reversed(range(width)) if qubit not in used_qubits][:n_fixed]
+        chunk_blocks = [
+            (matrix, [qubit - sum(fixed < qubit for fixed in fixed_qubits) for qubit in target_qubits], structure)
+            for matrix, target_qubits, structure in blocks
+        ]
+        return fixed_qubits, chunk_blocks
+
+
+def run_worker(connection, barrier, index: int, n_workers: int) -> None:
+    """
+    Worker process loop of `SharedMemoryQuantumEmulator`. Runs received jobs until `None` is received.
+
+    Job is a `dict` with shared memory block `name`, state tensor `shape` and `dtype`, and `groups` of blocks as returned by
+    `SharedMemoryQuantumEmulator._group_blocks`. Replies `None` when the job is done or error message on failure
+    """
+    for job in iter(connection.recv, None):
+        memory = None
+        try:
+            memory = shared_memory.SharedMemory(name=job["name"])
+            _apply_groups(memory, job, barrier, index, n_workers)
+            reply = None
+        except BrokenBarrierError:
+            # another worker failed and reports the error
+            reply = None
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            barrier.abort()
+            reply = f"{type(error).__name__}: {error}"
+        if memory is not None:
+            memory.close()
+        connection.send(reply)
+
+
+def _apply_groups(memory: shared_memory.SharedMemory, job: dict, barrier, index: int, n_workers: int) -> None:
+    """Applies job groups of blocks to chunks `index::n_workers` of the shared state, waiting at `barrier` after every group"""
+    # pylint: disable=protected-access
+    state = np.ndarray(job["shape"], dtype=np.dtype(job["dtype"]), buffer=memory.buf)
+    for fixed_qubits, blocks in job["groups"]:
+        for chunk in CustomQuantumEmulator._chunk_views(state, fixed_qubits)[index::n_workers]:
+            for matrix, target_qubits, structure in blocks:
+                CustomQuantumEmulator._apply_matrix(chunk, matrix, target_qubits, structure)
+        barrier.wait()
@@ -0,0 +1,92 @@
+"""Stabilizer quantum emulator module"""
+
+# TODO: typing.Dict is deprecated since Python 3.9. Use dict after version update
+from typing import Dict, Union
+
+import numpy as np
+
+from quantum_simulator.abstract_quantum_emulator import AbstractQuantumEmulator
+from quantum_simulator.observable import Observable
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_operation import QuantumOperation
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+from quantum_simulator.stabilizer_tableau import StabilizerTableau
+
+
+class StabilizerQuantumEmulator(AbstractQuantumEmulator):
+    """
+    Stabilizer quantum emulator class
+
+    Clifford-only circuits (see `StabilizerTableau.clifford_gate`) are simulated on `StabilizerTableau` in polynomial time
+    and memory, so `execute_shots` and `expectation_value` handle thousands of qubits. Circuits with other gates raise
+    `ValueError`. `apply_gate` and `apply_circuit` accept computational basis input states only (a general state vector
+    does not give its tableau cheaply, if it is a stabilizer state at all) and raise `ValueError` for other states. State
+    vectors are returned up to a global phase and are limited to `StabilizerTableau.MAX_STATE_VECTOR_QUBITS` qubits
+    """
+
+    def __init__(self):
+        pass
+
+    def apply_gate(self, operation: QuantumOperation, state_vector: QuantumStateVector) -> QuantumStateVector:
+        """
+        Applies Clifford operation to a computational basis state vector. Returns state vector up to a global phase
+
+        Raises `ValueError` for other input states and non-Clifford operations
+        """
+        tableau = self._basis_tableau(state_vector)
+        tableau.apply_gate(operation.matrix, operation.target_qubits)
+        return tableau.to_state_vector()
+
+    def apply_circuit(self, circuit: QuantumCircuit, state_vector: QuantumStateVector) -> QuantumStateVector:
+        """
+        Applies Clifford circuit to a computational basis state vector. Returns state vector up to a global phase
+
+        Raises `ValueError` for other input states and circuits with non-Clifford gates
+        """
+        if circuit.width != state_vector.num_qubits:
+            raise ValueError("state_vector and circuit size mismatch")
+        gates = StabilizerTableau.clifford_gates(circuit)
+        if gates is None:
+            raise ValueError("Circuit has non-Clifford gates")
+        tableau = self._basis_tableau(state_vector)
+        with self._circuit_span("apply_circuit", width=circuit.width, gates=circuit.gates_count):
+            for name, target_qubits in gates:
+                tableau.apply_clifford_gate(name, target_qubits)
+        return tableau.to_state_vector()
+
+    def execute(self, circuit: QuantumCircuit) -> QuantumStateVector:
+        """Executes given circuit on |0...0⟩ state. Returns final state vector up to a global phase"""
+        return self.execute_tableau(circuit).to_state_vector()
+
+    def execute_tableau(self, circuit: QuantumCircuit) -> StabilizerTableau:
+        """Executes given Clifford circuit on |0...0⟩ state. Returns final stabilizer tableau"""
+        with self._circuit_span("execute_tableau", width=circuit.width, gates=circuit.gates_count):
+            tableau = StabilizerTableau.from_circuit(circuit)
+        if tableau is None:
+            raise ValueError("Circuit has non-Clifford gates")
+        return tableau
+
+    def execute_shots(self, circuit: QuantumCircuit, n_shots: int, seed: int = None) -> Dict[str, int]:
+        """
+        Executes shots using given circuit. Returns `{bitstring: count}` of the measured bitstrings
+
+        The circuit is simulated once and all shots are sampled from the final stabilizer tableau
+        """
+        return self.execute_tableau(circuit).sample_counts(n_shots, seed)
+
+    def expectation_value(self, circuit: QuantumCircuit, observable: Observable) -> Union[float, complex]:
+        """Executes given circuit on |0...0⟩ state. Returns ⟨ψ|H|ψ⟩ of the final stabilizer state and `observable` H"""
+        return self.execute_tableau(circuit).expectation_value(observable)
+
+    @staticmethod
+    def _basis_tableau(state_vector: QuantumStateVector) -> StabilizerTableau:
+        """Returns tableau of computational basis state `state_vector` (up to a global phase). Raises `ValueError` for other states"""
+        probabilities = state_vector.probabilities()
+        index = int(np.argmax(probabilities))
+        if not np.isclose(probabilities[index], 1):
+            raise ValueError("Stabilizer emulator supports computational basis input states only")
+        tableau = StabilizerTableau(state_vector.num_qubits)
+        for qubit in range(state_vector.num_qubits):
+            if index >> qubit & 1:
+                tableau.apply_clifford_gate("x", [qubit])
+        return tableau
@@ -0,0 +1,381 @@
+"""Stabilizer tableau module"""
+
+from copy import deepcopy
+
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Dict, List, Union
+
+import numpy as np
+
+from quantum_simulator.observable import Observable
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+class StabilizerTableau:
+    """
+    Stabilizer tableau class
+
+    Aaronson-Gottesman tableau of a stabilizer state: rows `0..n-1` are destabilizers and rows `n..2n-1` are stabilizers
+    generators. A row is the Pauli string `(-1)^r i^{x·z} X^x Z^z`, so `(x, z)` bits `(1, 1)` are Y as in `Observable`
+    masks. X and Z bits are packed into bytes (qubit `q` is bit `q % 8` of byte `q // 8`), so Clifford gates update
+    a byte column in `O(n)`, and memory is `O(n**2 / 4)` bytes instead of `O(2**n)` amplitudes.
+
+    Gates are recognized by matrix up to a global phase (see `clifford_gate`), which the tableau does not track
+    """
+
+    MAX_STATE_VECTOR_QUBITS: int = 30
+    "Max number of qubits of the states converted to `QuantumStateVector`"
+
+    SAMPLING_BLOCK: int = 8
+    "Number of support generators combined by a single table lookup per shot in `sample`"
+
+    __POPCOUNT: np.ndarray = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+    "Number of set bits of every byte"
+
+    __GATES_1Q: dict = {
+        "i": np.eye(2),
+        "x": np.array([[0, 1], [1, 0]]),
+        "y": np.array([[0, -1j], [1j, 0]]),
+        "z": np.array([[1, 0], [0, -1]]),
+        "h": np.array([[1, 1], [1, -1]]) / np.sqrt(2),
+        "s": np.array([[1, 0], [0, 1j]]),
+        "sdg": np.array([[1, 0], [0, -1j]]),
+    }
+    "Clifford 1-qubit gate matrices"
+
+    __GATES_2Q: dict = {
+        # matrix index bit `i` is `target_qubits[i]`, so `TwoQubitsOperation.CX([t, c])` has control `c`
+        "cx_reversed": np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]]),
+        "cx": np.array([[1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0]]),
+        "cz": np.diag([1, 1, 1, -1]),
+        "swap": np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]]),
+    }
+    "Clifford 2-qubit gate matrices. `cx` control is the first target qubit"
+
+    x: np.ndarray
+    "Packed X bits - `(2n, ceil(n / 8))` uint8 array"
+
+    z: np.ndarray
+    "Packed Z bits - `(2n, ceil(n / 8))` uint8 array"
+
+    r: np.ndarray
+    "Sign bits - `(2n,)` uint8 array"
+
+    _num_qubits: int
+    "Number of qubits"
+
+    def __init__(self, num_qubits: int = 1):
+        if not isinstance(num_qubits, int):
+            raise TypeError("Number of qubits must be an integer.")
+        if num_qubits < 1:
+            raise ValueError("Number of qubits must be not less than one.")
+        self._num_qubits = num_qubits
+        n_bytes = (num_qubits + 7) // 8
+        # |0...0⟩ state: destabilizers X_q, stabilizers Z_q
+        diagonal = np.packbits(np.eye(num_qubits, dtype=np.uint8), axis=1, bitorder="little")
+        self.x = np.zeros((2 * num_qubits, n_bytes), dtype=np.uint8)
+        self.z = np.zeros((2 * num_qubits, n_bytes), dtype=np.uint8)
+        self.x[:num_qubits] = diagonal
+        self.z[num_qubits:] = diagonal
+        self.r = np.zeros(2 * num_qubits, dtype=np.uint8)
+
+    @property
+    def num_qubits(self) -> int:
+        """Returns number of qubits"""
+        return self._num_qubits
+
+    @property
+    def nbytes(self) -> int:
+        """Returns size of the tableau in bytes"""
+        return self.x.nbytes + self.z.nbytes + self.r.nbytes
+
+    def copy(self) -> "StabilizerTableau":
+        """Returns a deep copy of the tableau"""
+        return deepcopy(self)
+
+    @staticmethod
+    def clifford_gate(matrix: np.ndarray) -> str:
+        """Returns name of the Clifford gate equal to `matrix` up to a global phase, `None` for other matrices"""
+        matrix = np.asarray(matrix)
+        gates = StabilizerTableau.__GATES_1Q if matrix.shape == (2, 2) else StabilizerTableau.__GATES_2Q if matrix.shape == (4, 4) else {}
+        for name, gate in gates.items():
+            # the first row of every gate has a non-zero entry
+            column = int(np.argmax(np.abs(gate[0])))
+            phase = matrix[0, column] / gate[0, column]
+            if abs(abs(phase) - 1) < 1e-8 and np.abs(matrix - phase * gate).max() < 1e-8:
+                return name
+        return None
+
+    @staticmethod
+    def clifford_gates(circuit: QuantumCircuit) -> List[tuple]:
+        """Returns `[(gate_name, target_qubits)]` of the circuit gates in layers order, `None` if any gate is not Clifford"""
+        gates = []
+        # Clifford circuits repeat a few gate matrices, so they are classified once
+        names = {}
+        for layer_gates in circuit.iter_layers():
+            for gate in layer_gates:
+                key = gate.matrix.tobytes()
+                if key not in names:
+                    names[key] = StabilizerTableau.clifford_gate(gate.matrix)
+                if names[key] is None:
+                    return None
+                gates.append((names[key], gate.target_qubits))
+        return gates
+
+    @staticmethod
+    def from_circuit(circuit: QuantumCircuit) -> "StabilizerTableau":
+        """Returns tableau of the circuit applied to |0...0⟩ state, `None` if the circuit is not Clifford-only"""
+        gates = StabilizerTableau.clifford_gates(circuit)
+        if gates is None:
+            return None
+        tableau = StabilizerTableau(circuit.width)
+        for name, target_qubits in gates:
+            tableau.apply_clifford_gate(name, target_qubits)
+        return tableau
+
+    def apply_gate(self, matrix: np.ndarray, target_qubits: List[int]) -> None:
+        """Applies Clifford gate `matrix` to `target_qubits` in place. Raises `ValueError` for non-Clifford gates"""
+        name = self.clifford_gate(matrix)
+        if name is None:
+            raise ValueError("Gate is not a Clifford gate supported by stabilizer tableau")
+        self.apply_clifford_gate(name, target_qubits)
+
+    def apply_clifford_gate(self, name: str, target_qubits: List[int]) -> None:
+        """Applies `clifford_gate` named gate to `target_qubits` in place"""
+        if any(not 0 <= qubit < self._num_qubits for qubit in target_qubits):
+            raise ValueError(f"Target qubits {target_qubits} are out of {self._num_qubits} qubits")
+        if name == "cx_reversed":
+            name, target_qubits = "cx", target_qubits[::-1]
+        if name != "i":
+            getattr(self, f"_{name}")(*target_qubits)
+
+    @staticmethod
+    def _column(bits: np.ndarray, qubit: int) -> np.ndarray:
+        """Returns `qubit` bits of all rows of packed `bits`"""
+        return (bits[:, qubit >> 3] >> (qubit & 7)) & 1
+
+    @staticmethod
+    def _set_column(bits: np.ndarray, qubit: int, values: np.ndarray) -> None:
+        """Sets `qubit` bits of all rows of packed `bits` to `values`"""
+        byte, shift = qubit >> 3, qubit & 7
+        bits[:, byte] = (bits[:, byte] & ~np.uint8(1 << shift)) | (values << shift)
+
+    def _x(self, qubit: int) -> None:
+        """Applies X gate"""
+        self.r ^= self._column(self.z, qubit)
+
+    def _y(self, qubit: int) -> None:
+        """Applies Y gate"""
+        self.r ^= self._column(self.x, qubit) ^ self._column(self.z, qubit)
+
+    def _z(self, qubit: int) -> None:
+        """Applies Z gate"""
+        self.r ^= self._column(self.x, qubit)
+
+    def _h(self, qubit: int) -> None:
+        """Applies Hadamard gate"""
+        x, z = self._column(self.x, qubit), self._column(self.z, qubit)
+        self.r ^= x & z
+        self._set_column(self.x, qubit, z)
+        self._set_column(self.z, qubit, x)
+
+    def _s(self, qubit: int) -> None:
+        """Applies S gate"""
+        x, z = self._column(self.x, qubit), self._column(self.z, qubit)
+        self.r ^= x & z
+        self._set_column(self.z, qubit, z ^ x)
+
+    def _sdg(self, qubit: int) -> None:
+        """Applies S† gate"""
+        x, z = self._column(self.x, qubit), self._column(self.z, qubit)
+        self.r ^= x & (z ^ 1)
+        self._set_column(self.z, qubit, z ^ x)
+
+    def _cx(self, control: int, target: int) -> None:
+        """Applies CX gate"""
+        x_control, z_control = self._column(self.x, control), self._column(self.z, control)
+        x_target, z_target = self._column(self.x, target), self._column(self.z, target)
+        self.r ^= x_control & z_target & (x_target ^ z_control ^ 1)
+        self._set_column(self.x, target, x_target ^ x_control)
+        self._set_column(self.z, control, z_control ^ z_target)
+
+    def _cz(self, first: int, second: int) -> None:
+        """Applies CZ gate"""
+        x_first, z_first = self._column(self.x, first), self._column(self.z, first)
+        x_second, z_second = self._column(self.x, second), self._column(self.z, second)
+        self.r ^= x_first & x_second & (z_first ^ z_second)
+        self._set_column(self.z, first, z_first ^ x_second)
+        self._set_column(self.z, second, z_second ^ x_first)
+
+    def _swap(self, first: int, second: int) -> None:
+        """Applies SWAP gate"""
+        for bits in (self.x, self.z):
+            first_bits, second_bits = self._column(bits, first), self._column(bits, second)
+            self._set_column(bits, first, second_bits)
+            self._set_column(bits, second, first_bits)
+
+    @classmethod
+    def _product_signs(cls, x: np.ndarray, z: np.ndarray, r: np.ndarray, pivot: tuple) -> np.ndarray:
+        """
+        Returns sign bits of the products of rows `(x, z, r)` (on the left) and `pivot` row `(x, z, r)` (on the right)
+
+        `i` exponents of the X, Y, Z products are counted by popcounts: XY, YZ, ZX give `+1` and YX, ZY, XZ give `-1`
+        """
+        pivot_x, pivot_z, pivot_r = pivot
+        paulis = [(x & ~z, x & z, ~x & z), (pivot_x & ~pivot_z, pivot_x & pivot_z, ~pivot_x & pivot_z)]
+        (left_x, left_y, left_z), (right_x, right_y, right_z) = paulis
+        plus = (left_x & right_y) | (left_y & right_z) | (left_z & right_x)
+        minus = (left_y & right_x) | (left_z & right_y) | (left_x & right_z)
+        exponent = cls.__POPCOUNT[plus].sum(axis=-1, dtype=np.int64) - cls.__POPCOUNT[minus].sum(axis=-1, dtype=np.int64)
+        return (((2 * (r.astype(np.int64) + pivot_r) + exponent) % 4) // 2).astype(np.uint8)
+
+    def _echelon_stabilizers(self) -> tuple:
+        """
+        Returns `(x, z, r, rank)` of stabilizers generators in row echelon form of X bits
+
+        The first `rank` rows have independent X bits and the other rows are Z-only
+        """
+        n = self._num_qubits
+        x, z, r = self.x[n:].copy(), self.z[n:].copy(), self.r[n:].copy()
+        rank = 0
+        for qubit in range(n):
+            rows = rank + np.flatnonzero((x[rank:, qubit >> 3] >> (qubit & 7)) & 1)
+            if rows.size == 0:
+                continue
+            pivot = rows[0]
+            for bits in (x, z, r):
+                bits[[rank, pivot]] = bits[[pivot, rank]]
+            # the other rows with the bit set, pivot row is at `rank` after the swap
+            rows = rows[1:]
+            if len(rows):
+                r[rows] = self._product_signs(x[rows], z[rows], r[rows], (x[rank], z[rank], r[rank]))
+                x[rows] ^= x[rank]
+                z[rows] ^= z[rank]
+            rank += 1
+        return x, z, r, rank
+
+    def _support(self) -> tuple:
+        """
+        Returns `(basis_bits, generators)` of the measurement outcomes, uniformly distributed over `basis_bits ^ span(generators)`
+
+        Generators are X bits of the stabilizers with independent X bits. Z-only stabilizers `(-1)^r Z^z` fix the outcomes
+        parities `z·x = r`, and `basis_bits` is a solution of these equations found by Gauss-Jordan elimination
+        """
+        n = self._num_qubits
+        x, z, r, rank = self._echelon_stabilizers()
+        equations, parities = z[rank:], r[rank:]
+        basis_bits = np.zeros(n, dtype=np.uint8)
+        pivots = []
+        row = 0
+        for qubit in range(n):
+            if row == len(equations):
+                break
+            rows = np.flatnonzero((equations[:, qubit >> 3] >> (qubit & 7)) & 1)
+            rows = rows[rows >= row]
+            if rows.size == 0:
+                continue
+            for bits in (equations, parities):
+                bits[[row, rows[0]]] = bits[[rows[0], row]]
+            others = np.flatnonzero((equations[:, qubit >> 3] >> (qubit & 7)) & 1)
+            others = others[others != row]
+            equations[others] ^= equations[row]
+            parities[others] ^= parities[row]
+            pivots.append(qubit)
+            row += 1
+        # free variables are zero, so pivot variables are the reduced equations parities
+        basis_bits[pivots] = parities[: len(pivots)]
+        generators = np.unpackbits(x[:rank], axis=1, count=n, bitorder="little")
+        return basis_bits, generators
+
+    def sample(self, n_shots: int, seed: int = None) -> np.ndarray:
+        """Samples `n_shots` measurements of all qubits. Returns `(n_shots, num_qubits)` array of the measured bits"""
+        return np.unpackbits(self._sample_packed(n_shots, seed), axis=1, count=self._num_qubits, bitorder="little")
+
+    def sample_counts(self, n_shots: int, seed: int = None) -> Dict[str, int]:
+        """Samples `n_shots` measurements of all qubits. Returns `{bitstring: count}` of the measured bitstrings (first qubit is leftmost)"""
+        outcomes, counts = np.unique(self._sample_packed(n_shots, seed), axis=0, return_counts=True)
+        chars = np.unpackbits(outcomes, axis=1, count=self._num_qubits, bitorder="little") + ord("0")
+        return dict(zip(chars.view(f"S{self._num_qubits}").ravel().astype(f"U{self._num_qubits}").tolist(), counts.tolist()))
+
+    def _sample_packed(self, n_shots: int, seed: int = None) -> np.ndarray:
+        """
+        Samples `n_shots` measurements of all qubits. Returns `(n_shots, ceil(num_qubits / 8))` array of packed measured bits
+
+        Random combinations of the support generators are built by blocks of `SAMPLING_BLOCK` generators: all XOR
+        combinations of a block are tabulated once and every shot picks one of them by a random index
+        """
+        if n_shots < 1:
+            raise ValueError("Number of shots must be not less than one.")
+        rng = np.random.default_rng(seed)
+        basis_bits, generators = self._support()
+        shots = np.tile(np.packbits(basis_bits, bitorder="little"), (n_shots, 1))
+        generators = np.packbits(generators, axis=1, bitorder="little")
+        for start in range(0, len(generators), self.SAMPLING_BLOCK):
+            block = generators[start : start + self.SAMPLING_BLOCK]
+            combinations = np.zeros((2 ** len(block), shots.shape[1]), dtype=np.uint8)
+            for index, generator in enumerate(block):
+                combinations[1 << index : 2 << index] = combinations[: 1 << index] ^ generator
+            shots ^= combinations[rng.integers(0, len(combinations), size=n_shots)]
+        return shots
+
+    @property
+    def stabilizers(self) -> List[str]:
+        """Returns signed Pauli labels of the stabilizers generators, e.g. `"-XZ"` (first qubit is leftmost)"""
+        n = self._num_qubits
+        x = np.unpackbits(self.x[n:], axis=1, count=n, bitorder="little")
+        z = np.unpackbits(self.z[n:], axis=1, count=n, bitorder="little")
+        chars = np.array(list("IXZY"))[x + 2 * z]
+        return [("-" if sign else "+") + "".join(row) for sign, row in zip(self.r[n:].tolist(), chars)]
+
+    def expectation_value(self, observable: Observable) -> Union[float, complex]:
+        """
+        Returns ⟨ψ|H|ψ⟩ of the state and `observable` H
+
+        A Pauli string anticommuting with a stabilizer has zero expectation value. Otherwise it is, up to the sign, the product
+        of the stabilizers whose destabilizers anticommute with it, and the sign of the product is its expectation value
+        """
+        n = self._num_qubits
+        if observable.num_qubits != n:
+            raise ValueError("State and observable size mismatch")
+        n_bytes = self.x.shape[1]
+        value = 0j
+        for x_mask, z_mask, coefficient in zip(observable.x_masks.tolist(), observable.z_masks.tolist(), observable.coefficients.tolist()):
+            x = np.frombuffer(int(x_mask).to_bytes(n_bytes, "little"), dtype=np.uint8)
+            z = np.frombuffer(int(z_mask).to_bytes(n_bytes, "little"), dtype=np.uint8)
+            anticommuting = self.__POPCOUNT[(self.x & z) ^ (self.z & x)].sum(axis=1, dtype=np.int64) & 1
+            if anticommuting[n:].any():
+                continue
+            product = (np.zeros(n_bytes, dtype=np.uint8), np.zeros(n_bytes, dtype=np.uint8), np.uint8(0))
+            for row in n + np.flatnonzero(anticommuting[:n]):
+                sign = self._product_signs(product[0], product[1], product[2], (self.x[row], self.z[row], self.r[row]))
+                product = (product[0] ^ self.x[row], product[1] ^ self.z[row], sign)
+            value += -coefficient if product[2] else coefficient
+        return value if value.imag else value.real
+
+    def to_state_vector(self) -> QuantumStateVector:
+        """
+        Converts the state to `QuantumStateVector`. Raises `ValueError` for states wider than `MAX_STATE_VECTOR_QUBITS`
+
+        The state is the projection `Π (I + S) / 2` of a basis state of its support, so the global phase makes that basis
+        state amplitude real positive
+        """
+        n = self._num_qubits
+        if n > self.MAX_STATE_VECTOR_QUBITS:
+            raise ValueError(f"State of {n} qubits is too wide for a state vector (max {self.MAX_STATE_VECTOR_QUBITS})")
+        basis_bits, _ = self._support()
+        indices = np.arange(2**n, dtype=np.int64)
+        vector = np.zeros(2**n, dtype=complex)
+        vector[int(basis_bits @ (1 << np.arange(n, dtype=np.int64)))] = 1
+        for row in range(n, 2 * n):
+            x_mask = int.from_bytes(self.x[row].tobytes(), "little")
+            z_mask = int.from_bytes(self.z[row].tobytes(), "little")
+            parities = indices & z_mask
+            for shift in (32, 16, 8, 4, 2, 1):
+                parities ^= parities >> shift
+            # (-1)^r i^{x·z} X^x Z^z |k⟩ = (-1)^{r + z·k} i^{x·z} |k ^ x⟩
+            phase = (-1) ** int(self.r[row]) * 1j ** bin(x_mask & z_mask).count("1")
+            stabilized = np.empty_like(vector)
+            stabilized[indices ^ x_mask] = phase * (1 - 2 * (parities & 1)) * vector
+            vector = (vector + stabilized) / 2
+        return QuantumStateVector(vector / np.linalg.norm(vector))
@@ -0,0 +1,221 @@
+"""Random circuits ensembles sweep runner module"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Dict, List
+
+from quantum_simulator.abstract_quantum_emulator import AbstractQuantumEmulator
+from quantum_simulator.circuit_cache import CircuitCache
+from quantum_simulator.emulator_benchmark import EMULATORS, EmulatorBenchmark
+from quantum_simulator.quantum_circuit import QuantumCircuit
+
+_worker_emulators: Dict[str, AbstractQuantumEmulator] = {}
+"Emulators created by the worker process - `{name: emulator}`, reused by its jobs"
+
+
+class SweepRunner:
+    """
+    Multiprocess sweep runner class
+
+    Runs `(emulator, width, depth, weight_2q, seed)` jobs of a parameters grid on a process pool. Jobs carry only the
+    parameters: workers generate circuits from seeds themselves (or load them from a shared `CircuitCache` directory), so
+    no gate matrices are pickled. Result records are appended to a JSON Lines file as jobs complete, and jobs with
+    records already in the file are skipped, so an interrupted sweep is resumed by running it again
+    """
+
+    KEY_FIELDS = ("emulator", "width", "depth", "weight_2q", "seed")
+    "Job parameters fields identifying result records"
+
+    FIELDS = KEY_FIELDS + ("gates", "layers", "wall_time_s", "gates_per_s", "peak_rss_mb", "worker")
+    "Result record fields"
+
+    path: str
+    "JSON Lines results file"
+
+    emulators: List[str]
+    "Names of the `EMULATORS` run on every circuit"
+
+    n_workers: int
+    "Number of worker processes. Jobs are run by the calling process if it is one"
+
+    repeats: int
+    "Number of timed runs per job. Min wall time is recorded"
+
+    cache_dir: str
+    "Generated circuits cache directory shared by the workers, `None` to generate circuits in every job"
+
+    def __init__(self, path: str, emulators: List[str], n_workers: int = None, repeats: int = 1, cache_dir: str = None):
+        if not emulators:
+            raise ValueError("At least one emulator should be run")
+        unknown = [name for name in emulators if name not in EMULATORS]
+        if unknown:
+            raise ValueError(f"Unknown emulators {unknown}. Should be from {list(EMULATORS)}")
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers < 1:
+            raise ValueError("n_workers must be not less than one")
+        if repeats < 1:
+            raise ValueError("repeats must be not less than one")
+        self.path = str(path)
+        self.emulators = list(emulators)
+        self.n_workers = n_workers
+        self.repeats = repeats
+        self.cache_dir = cache_dir
+
+    def jobs(self, widths: List[int], depths: List[int], weights_2q: List[float], seeds: List[int]) -> List[dict]:
+        """Returns jobs of the parameters grid, grouped by circuit"""
+        return [
+            {"emulator": emulator, "width": width, "depth": depth, "weight_2q": weight_2q, "seed": seed}
+            for width, depth, weight_2q, seed in product(widths, depths, weights_2q, seeds)
+            for emulator in self.emulators
+        ]
+
+    def run(self, widths: List[int], depths: List[int], weights_2q: List[float], seeds: List[int], callback=None) -> List[dict]:
+        """
+        Runs grid jobs without records in `path` and appends their records to it as they complete. Returns new records
+
+        `callback` is called with every new record. Failed jobs do not stop the others: records of all completed jobs are
+        written, and then `RuntimeError` is raised from the first failure. Failed jobs have no records, so they are run
+        again by the next run
+        """
+        done = {self.key(record) for record in self.load(self.path, repair=True)}
+        pending = [job for job in self.jobs(widths, depths, weights_2q, seeds) if self.key(job) not in done]
+
+        records = []
+        with open(self.path, "a", encoding="utf-8") as file:
+
+            def write(record):
+                file.write(json.dumps(record) + "\n")
+                # every completed record survives a crash of the runner
+                file.flush()
+                records.append(record)
+                if callback is not None:
+                    callback(record)
+
+            failures = []
+            if self.n_workers == 1 or len(pending) <= 1:
+                for job in pending:
+                    try:
+                        write(run_job(job, self.repeats, self.cache_dir))
+                    except Exception as error:  # pylint: disable=broad-exception-caught
+                        failures.append((job, error))
+            else:
+                with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+                    futures = {executor.submit(run_job, job, self.repeats, self.cache_dir): job for job in pending}
+                    for future in as_completed(futures):
+                        try:
+                            write(future.result())
+                        except Exception as error:  # pylint: disable=broad-exception-caught
+                            failures.append((futures[future], error))
+        if failures:
+            job, error = failures[0]
+            raise RuntimeError(f"{len(failures)} of {len(pending)} jobs failed, first job {self.key(job)}: {type(error).__name__}: {error}") from error
+        return records
+
+    @staticmethod
+    def key(record: dict) -> tuple:
+        """Returns job parameters of a job or a result record"""
+        return (record["emulator"], int(record["width"]), int(record["depth"]), float(record["weight_2q"]), int(record["seed"]))
+
+    @staticmethod
+    def load(path: str, repair: bool = False) -> List[dict]:
+        """
+        Loads result records from JSON Lines file, `[]` if it does not exist
+
+        A partially written last line (the runner crashed while writing it) is ignored. With `repair` it is also cut off the
+        file, so that appended records start on a new line. Other damaged lines raise `ValueError`
+        """
+        if not os.path.exists(path):
+            return []
+        with open(path, "rb") as file:
+            data = file.read()
+
+        records = []
+        valid_size = 0
+        lines = data.splitlines(keepends=True)
+        for index, line in enumerate(lines):
+            if not line.endswith(b"\n"):
+                break
+            try:
+                records.append(json.loads(line))
+            except ValueError as error:
+                if index < len(lines) - 1:
+                    raise ValueError(f"Damaged line {index + 1} of results file {path}") from error
+                break
+            valid_size += len(line)
+
+        if repair and valid_size < len(data):
+            with open(path, "r+b") as file:
+                file.truncate(valid_size)
+        return records
+
+
+def run_job(job: dict, repeats: int = 1, cache_dir: str = None) -> dict:
+    """Generates the job circuit, applies it to |0...0⟩ state by the job emulator and returns the result record"""
+    name = job["emulator"]
+    if name not in _worker_emulators:
+        _worker_emulators[name] = EMULATORS[name]()
+    emulator = _worker_emulators[name]
+
+    width, depth, weight_2q, seed = job["width"], job["depth"], job["weight_2q"], job["seed"]
+    if cache_dir is not None:
+        circuit = CircuitCache(cache_dir).generate(width, depth, weight_2q, seed)
+    else:
+        circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q, seed=seed)
+        circuit.generate_gates_and_unite()
+
+    wall_time = float("inf")
+    rss_reset = EmulatorBenchmark.reset_peak_rss()
+    for _ in range(repeats):
+        start = time.perf_counter()
+        emulator.execute(circuit)
+        wall_time = min(wall_time, time.perf_counter() - start)
+
+    gates = circuit.gates_count
+    return {
+        **{field: job[field] for field in SweepRunner.KEY_FIELDS},
+        "gates": gates,
+        "layers": circuit.layers_count,
+        "wall_time_s": wall_time,
+        "gates_per_s": gates / wall_time if wall_time > 0 else None,
+        "peak_rss_mb": EmulatorBenchmark.peak_rss_mb() if rss_reset else None,
+        "worker": os.getpid(),
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    """Sweep runner command line entry point"""
+    parser = argparse.ArgumentParser(description="Runs quantum emulators on random circuits ensembles in parallel, resuming interrupted sweeps")
+    parser.add_argument("output", help="JSON Lines results path, appended to and skipped jobs read from")
+    parser.add_argument("--emulators", nargs="+", default=["custom"], choices=list(EMULATORS))
+    parser.add_argument("--widths", type=int, nargs="+", default=[4, 8, 12])
+    parser.add_argument("--depths", type=int, nargs="+", default=[50])
+    parser.add_argument("--weights-2q", type=float, nargs="+", default=[0.1, 0.5])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[27])
+    parser.add_argument("--n-seeds", type=int, help="run seeds range starting at the first --seeds value instead of --seeds list")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, CPU count by default")
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--cache-dir", help="generated circuits cache directory shared by the workers")
+    args = parser.parse_args(argv)
+
+    seeds = list(range(args.seeds[0], args.seeds[0] + args.n_seeds)) if args.n_seeds else args.seeds
+    runner = SweepRunner(args.output, args.emulators, n_workers=args.workers, repeats=args.repeats, cache_dir=args.cache_dir)
+    runner.run(
+        args.widths,
+        args.depths,
+        args.weights_2q,
+        seeds,
+        callback=lambda record: print(" ".join(f"{field}={record[field]}" for field in SweepRunner.FIELDS), flush=True),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Circuit cache tests module"""
+
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+import pytest
+
+from quantum_simulator.circuit_cache import CircuitCache
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+
+
+@pytest.mark.circuit_cache
+class TestCircuitCache(TestCase):
+    """CircuitCache tests class"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.directory.cleanup)
+
+    def test_circuit_cache_generate(self):
+        """Tests generated circuits are loaded from the cache on warm runs"""
+        cache = CircuitCache(self.directory.name)
+        circuit = cache.generate(width=5, depth=60, weight_2q=0.4, seed=3)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        expected_circuit = QuantumCircuit(width=5, depth=60, weight_2q=0.4, seed=3)
+        expected_circuit.generate_gates_and_unite()
+        for cached_circuit in [circuit, CircuitCache(self.directory.name).generate(width=5, depth=60, weight_2q=0.4, seed=3)]:
+            self.assertTrue((cached_circuit.gate_matrices == expected_circuit.gate_matrices).all())
+            self.assertTrue((cached_circuit.gate_targets == expected_circuit.gate_targets).all())
+            self.assertTrue((cached_circuit.gate_layer == expected_circuit.gate_layer).all())
+            self.assertEqual(cached_circuit.seed, 3)
+
+        warm_cache = CircuitCache(self.directory.name)
+        warm_cache.generate(width=5, depth=60, weight_2q=0.4, seed=3)
+        self.assertEqual((warm_cache.hits, warm_cache.misses), (1, 0))
+
+        # any parameter change is a different circuit
+        warm_cache.generate(width=5, depth=60, weight_2q=0.4, seed=4)
+        warm_cache.generate(width=5, depth=60, weight_2q=0.4, seed=3, fuse=True)
+        self.assertEqual((warm_cache.hits, warm_cache.misses), (1, 2))
+        self.assertEqual(len(os.listdir(self.directory.name)), 3)
+
+    def test_circuit_cache_fuse(self):
+        """Tests fused circuits are cached by the hash of the gates data"""
+        circuit = QuantumCircuit(width=4, depth=80, weight_2q=0.3, seed=1)
+        circuit.generate_gates_and_unite()
+        cache = CircuitCache(self.directory.name)
+        fused = cache.fuse(circuit)
+        cached_fused = cache.fuse(circuit)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cached_fused.gates_count, fused.gates_count)
+        self.assertTrue(np.allclose(CustomQuantumEmulator().execute(cached_fused).vector, CustomQuantumEmulator().execute(circuit).vector))
+
+        other = QuantumCircuit(width=4, depth=80, weight_2q=0.3, seed=2)
+        other.generate_gates_and_unite()
+        self.assertNotEqual(CircuitCache.content_key(other), CircuitCache.content_key(circuit))
+        self.assertNotEqual(CircuitCache.content_key(circuit, "fused"), CircuitCache.content_key(circuit))
+
+    def test_circuit_cache_eviction(self):
+        """Tests least recently used circuits eviction"""
+        cache = CircuitCache(self.directory.name)
+        keys = [CircuitCache.params_key(3, 20, 0.5, seed) for seed in range(3)]
+        for seed in range(3):
+            cache.generate(width=3, depth=20, weight_2q=0.5, seed=seed)
+        file_size = cache.size // 3
+        for age, key in enumerate(keys):
+            os.utime(os.path.join(self.directory.name, f"{key}.npz"), (1000 + age, 1000 + age))
+
+        # hit makes the oldest circuit the most recently used
+        self.assertIsNotNone(cache.get(keys[0]))
+        cache.max_bytes = 2 * file_size + file_size // 2
+        cache.evict()
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+        self.assertLessEqual(cache.size, cache.max_bytes)
+
+        # damaged file is a miss
+        with open(os.path.join(self.directory.name, f"{keys[2]}.npz"), "wb") as file:
+            file.write(b"damaged")
+        self.assertIsNone(cache.get(keys[2]))
+
+        with self.assertRaises(ValueError):
+            CircuitCache(self.directory.name, max_bytes=-1)
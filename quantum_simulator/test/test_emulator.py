@@ -6,12 +6,16 @@ import numpy as np
 import pytest
 
 from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.mps_quantum_emulator import MPSQuantumEmulator
+from quantum_simulator.observable import Observable
 from quantum_simulator.qiskit_quantum_emulator import QiskitQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
 from quantum_simulator.quantum_operation import OneQubitOperation, TwoQubitsOperation
 from quantum_simulator.quantum_state_vector import QuantumStateVector
+from quantum_simulator.random_generator import RandomGenerator
 
 
-@pytest.mark.parametrize("emulator", [CustomQuantumEmulator(), QiskitQuantumEmulator()])
+@pytest.mark.parametrize("emulator", [CustomQuantumEmulator(), QiskitQuantumEmulator(), MPSQuantumEmulator()])
 class TestQuantumEmulator(ABC):
     """Abstract QuantumEmulator class. Holds testing fixtures. Tests all supported emulators"""
 
@@ -211,3 +215,361 @@ class TestTwoQubitOperationTwoQubits(TestQuantumEmulator):
         result = emulator.apply_gate(cz_gate, two_qubit_input_state)
         expected_result = [0, 0, 0, -1]
         assert np.allclose(result.vector, expected_result)
+
+
+def reference_apply(matrix: np.ndarray, target_qubits: list, vector: list) -> np.ndarray:
+    """Applies `matrix` to `vector` by explicit summation over basis states. Used as a reference for emulators"""
+    length = len(vector)
+    target_mask = sum(1 << qubit for qubit in target_qubits)
+
+    def sub_index(index):
+        return sum(((index >> qubit) & 1) << i for i, qubit in enumerate(target_qubits))
+
+    output = np.zeros(length, dtype=complex)
+    for i in range(length):
+        for j in range(length):
+            if i & ~target_mask == j & ~target_mask:
+                output[i] += matrix[sub_index(i), sub_index(j)] * vector[j]
+    return output
+
+
+class TestRandomOperations(TestQuantumEmulator):
+    """Tests random unitary operations on random multi-qubit states against reference summation"""
+
+    @pytest.fixture()
+    def random_state(self):
+        """Random normalized 4-qubit `QuantumStateVector`"""
+        rand_gen = RandomGenerator(seed=5)
+        vector = np.array([rand_gen.rand(L=1) + 1j * rand_gen.rand(L=1) for _ in range(16)])
+        return QuantumStateVector((vector / np.linalg.norm(vector)).tolist())
+
+    @pytest.mark.parametrize("target_qubit", [0, 1, 2, 3])
+    def test_random_one_qubit_operation(self, emulator, random_state, target_qubit):
+        """Tests random 1-qubit unitary on each qubit of a 4-qubit state"""
+        operation = OneQubitOperation(RandomGenerator(seed=target_qubit).rand_unitary("1q"), [target_qubit])
+        result = emulator.apply_gate(operation, random_state)
+        assert np.allclose(result.vector, reference_apply(operation.matrix, [target_qubit], random_state.vector))
+
+    @pytest.mark.parametrize("target_qubits", [[0, 1], [1, 0], [0, 3], [3, 1], [2, 3]])
+    def test_random_two_qubits_operation(self, emulator, random_state, target_qubits):
+        """Tests random 2-qubit unitary on different qubit pairs of a 4-qubit state"""
+        operation = TwoQubitsOperation(RandomGenerator(seed=sum(target_qubits)).rand_unitary("2q"), target_qubits)
+        result = emulator.apply_gate(operation, random_state)
+        assert np.allclose(result.vector, reference_apply(operation.matrix, target_qubits, random_state.vector))
+
+    @pytest.mark.parametrize("target_qubits", [[0, 1], [1, 0], [3, 1], [2, 3]])
+    def test_structured_operations(self, emulator, random_state, target_qubits):
+        """Tests diagonal and permutation operations (with phases) against reference summation"""
+        phases = np.exp(2j * np.pi * RandomGenerator(seed=sum(target_qubits)).rands(4))
+        operations = [
+            OneQubitOperation.Y([target_qubits[0]]),
+            OneQubitOperation.T([target_qubits[1]]),
+            TwoQubitsOperation.CX(target_qubits),
+            TwoQubitsOperation.CZ(target_qubits),
+            TwoQubitsOperation(np.diag(phases), target_qubits),
+            TwoQubitsOperation(np.diag(phases)[[1, 2, 0, 3]], target_qubits),
+            TwoQubitsOperation(np.eye(4)[[3, 2, 1, 0]], target_qubits),
+        ]
+        for operation in operations:
+            assert operation.kind != operation.GENERIC
+            result = emulator.apply_gate(operation, random_state)
+            assert np.allclose(result.vector, reference_apply(operation.matrix, operation.target_qubits, random_state.vector))
+
+
+class TestQuantumCircuitExecution(TestQuantumEmulator):
+    """Tests random quantum circuits execution against gate-by-gate reference summation"""
+
+    @pytest.mark.parametrize(["width", "depth", "weight_2q"], [(1, 10, 0.5), (2, 20, 0.5), (3, 30, 0.3), (5, 40, 0.2), (6, 30, 0.7)])
+    def test_apply_random_circuit(self, emulator, width, depth, weight_2q):
+        """Tests random circuit application to |0...0> state"""
+        circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q, seed=width)
+        circuit.generate_gates_and_unite()
+        state_vector = QuantumStateVector(width)
+
+        expected_result = state_vector.vector
+        for layer_gates, _ in circuit.gate_layers:
+            for gate in layer_gates:
+                expected_result = reference_apply(gate.matrix, gate.target_qubits, expected_result)
+
+        result = emulator.apply_circuit(circuit, state_vector)
+        assert np.allclose(result.vector, expected_result)
+        # input state is left unchanged
+        assert np.allclose(state_vector.vector, QuantumStateVector(width).vector)
+
+    @pytest.mark.parametrize("width", [2, 3, 6])
+    def test_apply_structured_circuit(self, emulator, width):
+        """Tests application of circuit of diagonal and permutation gates mixed with random gates"""
+        circuit = QuantumCircuit(width=width, depth=0, weight_2q=0)
+        rand_gen = RandomGenerator(seed=width)
+        for index in range(40):
+            q1, q2 = index % width, (3 * index + 1) % width
+            q2 = q2 if q2 != q1 else (q1 + 1) % width
+            gates = [OneQubitOperation.X([q1]), OneQubitOperation.T([q1]), TwoQubitsOperation.CX([q1, q2]), TwoQubitsOperation.CZ([q2, q1])]
+            circuit.append_gate(gates[index % 4] if index % 5 else OneQubitOperation(rand_gen.rand_unitary("1q"), [q2]))
+
+        expected_result = QuantumStateVector(width).vector
+        for layer_gates, _ in circuit.gate_layers:
+            for gate in layer_gates:
+                expected_result = reference_apply(gate.matrix, gate.target_qubits, expected_result)
+        assert np.allclose(emulator.execute(circuit).vector, expected_result)
+
+    def test_circuit_size_mismatch(self, emulator):
+        """Tests circuit application to a state of different size"""
+        circuit = QuantumCircuit(width=3, depth=5, weight_2q=0.5)
+        circuit.generate_gates_and_unite()
+        with pytest.raises(ValueError):
+            emulator.apply_circuit(circuit, QuantumStateVector(2))
+
+
+class TestQuantumCircuitShots(TestQuantumEmulator):
+    """Tests random quantum circuits execution and shots sampling"""
+
+    @pytest.mark.parametrize(["width", "depth", "weight_2q"], [(1, 10, 0), (3, 30, 0.3), (5, 40, 0.5)])
+    def test_execute(self, emulator, width, depth, weight_2q):
+        """Tests circuit execution on |0...0> state"""
+        circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q)
+        circuit.generate_gates_and_unite()
+        expected_result = CustomQuantumEmulator().apply_circuit(circuit, QuantumStateVector(width))
+        assert np.allclose(emulator.execute(circuit).vector, expected_result.vector)
+
+    @pytest.mark.parametrize(["width", "depth", "weight_2q"], [(1, 10, 0), (3, 30, 0.3), (5, 40, 0.5)])
+    def test_execute_shots(self, emulator, width, depth, weight_2q):
+        """Tests circuit shots frequencies follow final state probabilities"""
+        circuit = QuantumCircuit(width=width, depth=depth, weight_2q=weight_2q)
+        circuit.generate_gates_and_unite()
+        n_shots = 100000
+        counts = emulator.execute_shots(circuit, n_shots, seed=1)
+        assert sum(counts.values()) == n_shots
+        assert counts == emulator.execute_shots(circuit, n_shots, seed=1)
+
+        probabilities = emulator.execute(circuit).probabilities()
+        bitstrings = QuantumStateVector.bitstrings(np.arange(2**width), width)
+        frequencies = np.array([counts.get(bitstring, 0) / n_shots for bitstring in bitstrings])
+        assert np.allclose(frequencies, probabilities, atol=0.01)
+
+
+class TestQuantumCircuitBatch(TestQuantumEmulator):
+    """Tests quantum circuit application to a batch of state vectors"""
+
+    @pytest.mark.parametrize(["width", "batch_size"], [(1, 3), (4, 10), (6, 2)])
+    def test_apply_circuit_batch(self, emulator, width, batch_size):
+        """Tests batch application matches application to each state vector"""
+        circuit = QuantumCircuit(width=width, depth=30, weight_2q=0.4, seed=width)
+        circuit.generate_gates_and_unite()
+        rand_gen = RandomGenerator(seed=batch_size)
+        state_vectors = []
+        for _ in range(batch_size):
+            vector = np.array([rand_gen.rand(L=1) + 1j * rand_gen.rand(L=1) for _ in range(2**width)])
+            state_vectors.append(QuantumStateVector(vector / np.linalg.norm(vector)))
+        inputs = [state_vector.copy() for state_vector in state_vectors]
+
+        results = emulator.apply_circuit_batch(circuit, state_vectors)
+        assert len(results) == batch_size
+        for state_vector, input_state, result in zip(state_vectors, inputs, results):
+            assert np.allclose(result.vector, emulator.apply_circuit(circuit, input_state).vector)
+            assert np.allclose(state_vector.vector, input_state.vector)
+
+        assert not emulator.apply_circuit_batch(circuit, [])
+        with pytest.raises(ValueError):
+            emulator.apply_circuit_batch(circuit, [QuantumStateVector(width + 1)])
+
+
+class TestExpectationValue(TestQuantumEmulator):
+    """Tests observables expectation values of executed circuits"""
+
+    @pytest.mark.parametrize(["width", "n_terms"], [(1, 3), (3, 20), (5, 200)])
+    def test_expectation_value(self, emulator, width, n_terms):
+        """Tests expectation value of random Pauli strings sum matches reference dense matrix expectation value"""
+        circuit = QuantumCircuit(width=width, depth=10 * width, weight_2q=0.5, seed=width)
+        circuit.generate_gates_and_unite()
+        rand_gen = RandomGenerator(seed=n_terms)
+        labels = ["".join("IXYZ"[rand_gen.rand_int() % 4] for _ in range(width)) for _ in range(n_terms)]
+        observable = Observable([(label, rand_gen.rand(L=1)) for label in labels])
+
+        vector = CustomQuantumEmulator().execute(circuit).vector
+        expected_result = np.vdot(vector, observable.to_qiskit().to_matrix() @ vector).real
+        result = emulator.expectation_value(circuit, observable)
+        assert isinstance(result, float)
+        assert np.isclose(result, expected_result)
+
+
+class TestCustomQuantumEmulator:
+    """Tests `CustomQuantumEmulator` specific options"""
+
+    @pytest.mark.parametrize("layer_block_qubits", [1, 2, 3, 8])
+    def test_layer_blocks(self, layer_block_qubits):
+        """Tests circuit application does not depend on layer block size"""
+        circuit = QuantumCircuit(width=8, depth=60, weight_2q=0.3, seed=3)
+        circuit.generate_gates_and_unite()
+        state_vector = QuantumStateVector(8)
+
+        expected_result = CustomQuantumEmulator(layer_block_qubits=1).apply_circuit(circuit, state_vector)
+        result = CustomQuantumEmulator(layer_block_qubits=layer_block_qubits).apply_circuit(circuit, state_vector)
+        assert np.allclose(result.vector, expected_result.vector)
+
+    def test_layer_blocks_error(self):
+        """Tests wrong layer block size"""
+        with pytest.raises(ValueError):
+            CustomQuantumEmulator(layer_block_qubits=0)
+
+    @pytest.mark.parametrize("n_workers", [2, 3, 4, 16])
+    def test_parallel_workers(self, n_workers):
+        """Tests multithreaded circuit application matches single-threaded one"""
+        circuit = QuantumCircuit(width=7, depth=80, weight_2q=0.4, seed=n_workers)
+        circuit.generate_gates_and_unite()
+        state_vector = QuantumStateVector(7)
+
+        emulator = CustomQuantumEmulator(n_workers=n_workers)
+        emulator.PARALLEL_MIN_QUBITS = 1
+        expected_result = CustomQuantumEmulator().apply_circuit(circuit, state_vector)
+        assert np.allclose(emulator.apply_circuit(circuit, state_vector).vector, expected_result.vector)
+
+        gate = TwoQubitsOperation(RandomGenerator().rand_unitary("2q"), [6, 2])
+        expected_result = CustomQuantumEmulator().apply_gate(gate, state_vector)
+        assert np.allclose(emulator.apply_gate(gate, state_vector).vector, expected_result.vector)
+
+        # closed thread pool is started again by the next split gate
+        emulator.close()
+        assert np.allclose(emulator.apply_gate(gate, state_vector).vector, expected_result.vector)
+        emulator.close()
+        emulator.close()
+
+    def test_split_state(self):
+        """Tests state tensor split into disjoint chunks"""
+        # pylint: disable=protected-access
+        state = np.arange(2**5).reshape((2,) * 5)
+        chunks = CustomQuantumEmulator._split_state(state, [4, 1], 4)
+        assert len(chunks) == 4
+        # qubits 3 and 2 are fixed, qubits 4 and 1 are renumbered to 2 and 1
+        assert all(chunk.shape == (2, 2, 2) and target_qubits == [2, 1] for chunk, target_qubits in chunks)
+        assert sorted(np.concatenate([chunk.ravel() for chunk, _ in chunks]).tolist()) == list(range(2**5))
+        assert all(np.shares_memory(chunk, state) for chunk, _ in chunks)
+
+        # batch of 2 states is split by the batch axis first, larger batches are not split
+        batch = np.arange(2**5).reshape((2,) * 5)
+        assert [chunk[(0,) * 4] for chunk, _ in CustomQuantumEmulator._split_state(batch, [0], 2)] == [0, 2**4]
+        batch = np.arange(3 * 2**4).reshape((3,) + (2,) * 4)
+        assert all(chunk.shape == (3, 2, 2, 2) for chunk, _ in CustomQuantumEmulator._split_state(batch, [0], 2))
+
+        with pytest.raises(ValueError):
+            CustomQuantumEmulator(n_workers=0)
+
+    def test_parallel_batch(self):
+        """Tests multithreaded batch application matches single-threaded one"""
+        circuit = QuantumCircuit(width=5, depth=40, weight_2q=0.4)
+        circuit.generate_gates_and_unite()
+        emulator = CustomQuantumEmulator(n_workers=4)
+        emulator.PARALLEL_MIN_QUBITS = 1
+        expected_result = CustomQuantumEmulator().apply_circuit(circuit, QuantumStateVector(5))
+        # batch of 2 states is also split by the batch axis
+        for batch_size in [7, 2]:
+            for result in emulator.apply_circuit_batch(circuit, [QuantumStateVector(5) for _ in range(batch_size)]):
+                assert np.allclose(result.vector, expected_result.vector)
+
+    def test_structured_kernels(self):
+        """Tests diagonal and permutation kernels match dense kernel on a batch of states"""
+        # pylint: disable=protected-access
+        rand_gen = RandomGenerator(seed=3)
+        state = rand_gen.rands(4 * 2**5).reshape((4,) + (2,) * 5) + 0j
+        phases = np.exp(2j * np.pi * rand_gen.rands(8))
+        for permutation in [np.arange(8), [1, 0, 3, 2, 5, 4, 7, 6], [7, 0, 1, 2, 3, 4, 5, 6], [0, 2, 1, 3, 6, 5, 4, 7]]:
+            matrix = np.diag(phases)[permutation]
+            structure = OneQubitOperation.classify(matrix)
+            assert structure[0] == (OneQubitOperation.DIAGONAL if list(permutation) == list(range(8)) else OneQubitOperation.PERMUTATION)
+            expected_result = state.copy()
+            CustomQuantumEmulator._applyNQ(expected_result, matrix, [4, 0, 2])
+            result = state.copy()
+            CustomQuantumEmulator._apply_matrix(result, matrix, [4, 0, 2], structure)
+            assert np.allclose(result, expected_result)
+
+    @pytest.mark.parametrize("chunk_qubits", [2, 3, 5, 16])
+    def test_memmap_state(self, tmp_path, chunk_qubits):
+        """Tests chunked in-place circuit application to a memory-mapped state matches in-memory application"""
+        circuit = QuantumCircuit(width=7, depth=120, weight_2q=0.5, seed=chunk_qubits)
+        circuit.generate_gates_and_unite()
+        circuit.append_gate(TwoQubitsOperation.CX([6, 0]))
+        circuit.append_gate(OneQubitOperation.T([5]))
+        expected_result = CustomQuantumEmulator().execute(circuit)
+
+        emulator = CustomQuantumEmulator(chunk_qubits=chunk_qubits)
+        state_vector = QuantumStateVector().from_file(tmp_path / "state.bin", 7)
+        assert emulator.apply_circuit_inplace(circuit, state_vector) is state_vector
+        assert np.allclose(state_vector.vector, expected_result.vector)
+        # amplitudes are written to the file
+        assert np.allclose(QuantumStateVector().from_file(tmp_path / "state.bin").vector, expected_result.vector)
+
+        with pytest.raises(ValueError):
+            CustomQuantumEmulator(chunk_qubits=1)
+
+    @pytest.mark.parametrize(["width", "chunk_qubits"], [(6, 2), (8, 4), (8, 8), (10, 6)])
+    def test_schedule_passes(self, width, chunk_qubits):
+        """Tests gates scheduling into passes over the state chunks"""
+        # pylint: disable=protected-access
+        circuit = QuantumCircuit(width=width, depth=200, weight_2q=0.3, seed=width)
+        circuit.generate_gates_and_unite()
+        gates = [gate for layer_gates in circuit.iter_layers() for gate in layer_gates]
+        passes = CustomQuantumEmulator._schedule_passes(gates, width, chunk_qubits)
+
+        assert sum(len(pass_gates) for _, pass_gates in passes) == len(gates)
+        for resident_qubits, pass_gates in passes:
+            assert len(resident_qubits) == min(chunk_qubits, width)
+            assert all(set(gate.target_qubits) <= set(resident_qubits) for gate in pass_gates)
+        if chunk_qubits >= width:
+            assert len(passes) == 1
+        # low-order gates are grouped, so there are much fewer passes than gates
+        assert len(passes) < len(gates) / 3
+
+    def test_single_precision(self):
+        """Tests complex64 simulation keeps single precision and stays close to double precision result"""
+        circuit = QuantumCircuit(width=8, depth=400, weight_2q=0.4)
+        circuit.generate_gates_and_unite()
+        circuit.append_gate(TwoQubitsOperation.CX([0, 7]))
+        circuit.append_gate(OneQubitOperation.T([3]))
+        expected_result = QiskitQuantumEmulator().execute(circuit)
+
+        emulator = CustomQuantumEmulator(dtype=np.complex64)
+        result = emulator.execute(circuit)
+        assert result.dtype == np.complex64 and result.vector.dtype == np.complex64
+        assert result.nbytes == expected_result.nbytes // 2
+        assert abs(np.vdot(expected_result.vector, result.vector)) ** 2 > 1 - 1e-5
+        assert sum(emulator.execute_shots(circuit, 1000, seed=1).values()) == 1000
+
+        state_vector = QuantumStateVector(3, dtype=np.complex64)
+        for gate in [OneQubitOperation.H([1]), OneQubitOperation.X([0]), OneQubitOperation.T([1]), TwoQubitsOperation.CX([1, 2])]:
+            state_vector = CustomQuantumEmulator().apply_gate(gate, state_vector)
+            assert state_vector.vector.dtype == np.complex64
+
+        with pytest.raises(TypeError):
+            CustomQuantumEmulator(dtype=np.float32)
+
+    @pytest.mark.parametrize("layer_block_qubits", [1, 5])
+    def test_remap_qubits(self, layer_block_qubits):
+        """Tests circuit application on remapped qubits matches application on the original qubits"""
+        circuit = QuantumCircuit(width=7, depth=150, weight_2q=0.4, seed=layer_block_qubits)
+        circuit.generate_gates_and_unite()
+        for qubit in [1, 2, 3, 1, 2, 3]:
+            circuit.append_gate(OneQubitOperation.H([qubit]))
+            circuit.append_gate(TwoQubitsOperation.CX([qubit, 0]))
+        state_vector = QuantumStateVector(7)
+        state_vector.vector[:] = RandomGenerator(seed=5).rands(2**7)
+        expected_result = CustomQuantumEmulator(layer_block_qubits=layer_block_qubits).apply_circuit(circuit, state_vector)
+
+        emulator = CustomQuantumEmulator(layer_block_qubits=layer_block_qubits, remap_qubits=True)
+        emulator.REMAP_MIN_QUBITS = 1
+        assert np.allclose(emulator.apply_circuit(circuit, state_vector).vector, expected_result.vector)
+        for result in emulator.apply_circuit_batch(circuit, [state_vector, state_vector]):
+            assert np.allclose(result.vector, expected_result.vector)
+
+    def test_remap_blocks(self):
+        """Tests blocks on slow qubits are moved to fast qubits and the identity mapping is restored"""
+        # pylint: disable=protected-access
+        h_gate = OneQubitOperation.H()
+        blocks = [(h_gate.matrix, [qubit], (h_gate.kind, None, None)) for qubit in [2, 5, 2, 2, 1]]
+        scheduled = list(CustomQuantumEmulator._remap_blocks(blocks, 6, lookahead=4))
+
+        swaps = [target_qubits for matrix, target_qubits, _ in scheduled if matrix is not h_gate.matrix]
+        gates = [target_qubits for matrix, target_qubits, _ in scheduled if matrix is h_gate.matrix]
+        # qubit 2 is used again and swapped with unused qubit 0, qubit 1 is not used again and stays in place
+        assert swaps == [[2, 0], [0, 2]]
+        assert gates == [[0], [5], [0], [0], [1]]
+        assert list(CustomQuantumEmulator._remap_blocks(blocks[:2], 6, lookahead=4)) == blocks[:2]
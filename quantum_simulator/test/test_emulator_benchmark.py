@@ -0,0 +1,90 @@
+"""Emulator benchmark tests module"""
+
+import csv
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+import pytest
+
+from quantum_simulator.circuit_cache import CircuitCache
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.emulator_benchmark import EmulatorBenchmark, main
+from quantum_simulator.qiskit_quantum_emulator import QiskitQuantumEmulator
+
+
+@pytest.mark.benchmark
+class TestEmulatorBenchmark(TestCase):
+    """EmulatorBenchmark tests class"""
+
+    def test_emulator_benchmark_init(self):
+        """Tests EmulatorBenchmark init errors"""
+        with self.assertRaises(ValueError):
+            EmulatorBenchmark({})
+        with self.assertRaises(ValueError):
+            EmulatorBenchmark({"custom": CustomQuantumEmulator()}, reference="qiskit")
+        with self.assertRaises(ValueError):
+            EmulatorBenchmark({"custom": CustomQuantumEmulator()}, repeats=0)
+
+    def test_emulator_benchmark_run(self):
+        """Tests EmulatorBenchmark records for each emulator and circuit"""
+        benchmark = EmulatorBenchmark({"custom": CustomQuantumEmulator(), "qiskit": QiskitQuantumEmulator()}, reference="qiskit")
+        records = benchmark.run(widths=[2, 4], depths=[10], weights_2q=[0.2, 0.6], seeds=[1])
+        self.assertEqual(len(records), 2 * 2 * 2)
+        self.assertEqual(benchmark.results, records)
+        for record in records:
+            self.assertEqual(set(record), set(EmulatorBenchmark.FIELDS))
+            self.assertAlmostEqual(record["fidelity"], 1)
+            self.assertEqual(record["gates"], 10)
+            self.assertGreater(record["wall_time_s"], 0)
+            self.assertGreater(record["peak_alloc_mb"], 0)
+
+    def test_peak_rss_per_run(self):
+        """Tests peak resident set size is recorded per run, not the peak of earlier allocations"""
+        if not EmulatorBenchmark.reset_peak_rss():
+            self.skipTest("Peak resident set size reset is not supported")
+        self.assertGreater(np.ones(2**25).sum(), 0)
+        allocation_peak = EmulatorBenchmark.peak_rss_mb()
+        records = EmulatorBenchmark({"custom": CustomQuantumEmulator()}, trace_memory=False).run(widths=[2], depths=[5], weights_2q=[0.5], seeds=[1])
+        self.assertLess(records[0]["peak_rss_mb"], allocation_peak - 128)
+
+    def test_emulator_benchmark_output(self):
+        """Tests EmulatorBenchmark JSON and CSV output"""
+        benchmark = EmulatorBenchmark({"custom": CustomQuantumEmulator()}, trace_memory=False)
+        benchmark.run(widths=[3], depths=[5], weights_2q=[0.5], seeds=[1, 2])
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "results.json")
+            csv_path = os.path.join(directory, "results.csv")
+            benchmark.to_json(json_path)
+            benchmark.to_csv(csv_path)
+
+            self.assertEqual(EmulatorBenchmark.load_json(json_path), benchmark.results)
+            with open(csv_path, "r", encoding="utf-8") as file:
+                rows = list(csv.DictReader(file))
+            self.assertEqual([int(row["seed"]) for row in rows], [1, 2])
+
+            # the same run compared against itself has no fidelity regressions
+            self.assertEqual(
+                main(["--emulators", "custom", "--widths", "3", "--depths", "5", "--seeds", "1", "--max-slowdown", "1e6", "--baseline", json_path]), 0
+            )
+
+            # circuits are generated once and reused by the later runs
+            cache_dir = os.path.join(directory, "cache")
+            argv = ["--emulators", "custom", "--widths", "3", "--depths", "5", "--seeds", "1", "2", "--no-trace-memory", "--cache-dir", cache_dir]
+            self.assertEqual(main(argv), 0)
+            self.assertEqual(len(os.listdir(cache_dir)), 2 * 2)
+            cache = CircuitCache(cache_dir)
+            records = EmulatorBenchmark({"custom": CustomQuantumEmulator()}, trace_memory=False, cache=cache).run([3], [5], [0.5], [1, 2])
+            self.assertEqual((cache.hits, cache.misses), (2, 0))
+            self.assertEqual([record["seed"] for record in records], [1, 2])
+
+    def test_emulator_benchmark_compare(self):
+        """Tests EmulatorBenchmark regressions detection"""
+        baseline = [{"emulator": "custom", "width": 2, "depth": 5, "weight_2q": 0.5, "seed": 1, "wall_time_s": 1.0, "fidelity": 1.0}]
+        self.assertEqual(EmulatorBenchmark.compare(baseline, baseline), [])
+        slower = [dict(baseline[0], wall_time_s=1.5)]
+        self.assertEqual(len(EmulatorBenchmark.compare(baseline, slower)), 1)
+        self.assertEqual(EmulatorBenchmark.compare(baseline, slower, max_slowdown=2), [])
+        wrong = [dict(baseline[0], fidelity=0.5)]
+        self.assertEqual(len(EmulatorBenchmark.compare([], wrong)), 1)
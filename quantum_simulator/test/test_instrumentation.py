@@ -0,0 +1,160 @@
+"""Instrumentation tests module"""
+
+import json
+import os
+import tempfile
+import tracemalloc
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.instrumentation import Instrumentation
+from quantum_simulator.qiskit_quantum_emulator import QiskitQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_operation import OneQubitOperation, TwoQubitsOperation
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+@pytest.mark.instrumentation
+class TestInstrumentation(TestCase):
+    """Instrumentation tests class"""
+
+    def test_gate_counters(self):
+        """Tests per-gate-kind counters and bytes touched by the custom emulator kernels"""
+        emulator = CustomQuantumEmulator()
+        emulator.instrumentation = Instrumentation()
+        state_vector = QuantumStateVector(4)
+        for operation in [OneQubitOperation.H([0]), OneQubitOperation.X([1]), TwoQubitsOperation.CZ([0, 2]), OneQubitOperation.T([3])]:
+            state_vector = emulator.apply_gate(operation, state_vector)
+
+        instrumentation = emulator.instrumentation
+        self.assertEqual(instrumentation.counters, {"generic_1q": 1, "permutation_1q": 1, "diagonal_2q": 1, "diagonal_1q": 1})
+        # generic gates read and write all amplitudes, CZ and T only change a quarter and a half of them
+        nbytes = state_vector.vector.nbytes
+        self.assertEqual(
+            instrumentation.bytes_touched, {"generic_1q": 2 * nbytes, "permutation_1q": 2 * nbytes, "diagonal_2q": nbytes // 2, "diagonal_1q": nbytes}
+        )
+        self.assertTrue(all(time >= 0 for time in instrumentation.kernel_time.values()))
+        self.assertEqual(instrumentation.allocations, {})
+        self.assertEqual(set(instrumentation.summary()), set(instrumentation.counters))
+
+        instrumentation.reset()
+        self.assertEqual((instrumentation.counters, instrumentation.events), ({}, []))
+
+    def test_circuit_spans(self):
+        """Tests circuit spans enclose recorded gate spans and the results do not change"""
+        circuit = QuantumCircuit(width=5, depth=30, weight_2q=0.4)
+        circuit.generate_gates_and_unite()
+        expected = CustomQuantumEmulator().execute(circuit)
+
+        events = []
+        emulator = CustomQuantumEmulator(layer_block_qubits=1)
+        emulator.instrumentation = Instrumentation(callback=events.append)
+        state_vector = emulator.execute(circuit)
+        self.assertTrue(np.allclose(state_vector.vector, expected.vector))
+
+        instrumentation = emulator.instrumentation
+        self.assertEqual(events, instrumentation.events)
+        self.assertEqual(sum(instrumentation.counters.values()), circuit.gates_count)
+        circuit_event = events[-1]
+        self.assertEqual((circuit_event["name"], circuit_event["gates"], circuit_event["width"]), ("apply_circuit", circuit.gates_count, 5))
+        for event in events[:-1]:
+            self.assertGreaterEqual(event["start"], circuit_event["start"])
+            self.assertLessEqual(event["start"] + event["duration"], circuit_event["start"] + circuit_event["duration"])
+
+    def test_trace_allocations(self):
+        """Tests kernels allocations are measured by tracemalloc"""
+        emulator = CustomQuantumEmulator()
+        emulator.instrumentation = Instrumentation(trace_allocations=True, record_events=False)
+        state_vector = QuantumStateVector(18)
+        emulator.apply_gate(OneQubitOperation.H([3]), state_vector)
+        emulator.apply_gate(OneQubitOperation.Z([3]), state_vector)
+
+        allocations = emulator.instrumentation.allocations
+        # generic 1-qubit kernel builds new |0> amplitudes of half of the state
+        self.assertGreaterEqual(allocations["generic_1q"], state_vector.vector.nbytes // 2)
+        # diagonal kernel works in place, allocating only bounded ufunc buffers
+        self.assertLess(allocations["diagonal_1q"], state_vector.vector.nbytes // 8)
+        self.assertEqual(emulator.instrumentation.events, [])
+
+    def test_trace_allocations_without_reset_peak(self):
+        """Tests kernels allocations are measured without `tracemalloc.reset_peak` (Python 3.8)"""
+        emulator = CustomQuantumEmulator()
+        emulator.instrumentation = Instrumentation(trace_allocations=True, record_events=False)
+        state_vector = QuantumStateVector(18)
+        with patch.object(tracemalloc, "reset_peak", None):
+            emulator.apply_gate(OneQubitOperation.H([3]), state_vector)
+            emulator.apply_gate(OneQubitOperation.Z([3]), state_vector)
+
+        allocations = emulator.instrumentation.allocations
+        self.assertGreaterEqual(allocations["generic_1q"], state_vector.vector.nbytes // 2)
+        self.assertLess(allocations["diagonal_1q"], state_vector.vector.nbytes // 8)
+
+    def test_trace_allocations_stop(self):
+        """Tests tracemalloc is stopped only by the instrumentation that started it"""
+        emulator = CustomQuantumEmulator()
+        state_vector = QuantumStateVector(4)
+        emulator.instrumentation = Instrumentation(trace_allocations=True)
+        emulator.apply_gate(OneQubitOperation.H([0]), state_vector)
+        self.assertTrue(tracemalloc.is_tracing())
+        emulator.instrumentation.close()
+        self.assertFalse(tracemalloc.is_tracing())
+
+        emulator.apply_gate(OneQubitOperation.H([0]), state_vector)
+        self.assertTrue(tracemalloc.is_tracing())
+        emulator.instrumentation.trace_allocations = False
+        emulator.apply_gate(OneQubitOperation.H([0]), state_vector)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(emulator.instrumentation.counters["generic_1q"], 3)
+
+        emulator.instrumentation = Instrumentation(trace_allocations=True)
+        emulator.apply_gate(OneQubitOperation.H([0]), state_vector)
+        emulator.instrumentation = None
+        self.assertFalse(tracemalloc.is_tracing())
+
+        tracemalloc.start()
+        try:
+            instrumentation = Instrumentation(trace_allocations=True)
+            emulator.instrumentation = instrumentation
+            emulator.apply_gate(OneQubitOperation.H([0]), state_vector)
+            instrumentation.close()
+            del emulator.instrumentation, instrumentation
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+    def test_qiskit_emulator(self):
+        """Tests Qiskit emulator spans"""
+        emulator = QiskitQuantumEmulator()
+        emulator.instrumentation = Instrumentation()
+        emulator.apply_gate(TwoQubitsOperation.CX([0, 1]), QuantumStateVector(2))
+        circuit = QuantumCircuit(width=3, depth=10, weight_2q=0.4)
+        circuit.generate_gates_and_unite()
+        emulator.execute(circuit)
+        self.assertEqual(emulator.instrumentation.counters, {"qiskit_2q": 1})
+        self.assertEqual([event["name"] for event in emulator.instrumentation.events], ["qiskit_2q", "apply_circuit"])
+
+    def test_save_trace(self):
+        """Tests Chrome trace event format export"""
+        emulator = CustomQuantumEmulator()
+        emulator.instrumentation = Instrumentation()
+        emulator.apply_circuit_batch(QuantumCircuit(width=2, depth=1, weight_2q=0), [QuantumStateVector(2)] * 2)
+        emulator.apply_gate(OneQubitOperation.H([0]), QuantumStateVector(2))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            emulator.instrumentation.save_trace(path)
+            with open(path, encoding="utf-8") as file:
+                trace = json.load(file)
+
+        events = trace["traceEvents"]
+        self.assertEqual(
+            [(event["name"], event["cat"], event["ph"]) for event in events], [("apply_circuit_batch", "circuit", "X"), ("generic_1q", "gate", "X")]
+        )
+        self.assertEqual(events[0]["args"]["batch"], 2)
+        self.assertEqual(events[1]["args"]["target_qubits"], [0])
+        self.assertGreaterEqual(events[1]["ts"], events[0]["ts"] + events[0]["dur"])
+        self.assertEqual(trace["otherData"]["summary"]["generic_1q"]["count"], 1)
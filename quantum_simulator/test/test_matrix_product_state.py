@@ -0,0 +1,115 @@
+"""Matrix product state tests module"""
+
+from unittest import TestCase
+
+import numpy as np
+import pytest
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.matrix_product_state import MatrixProductState
+from quantum_simulator.mps_quantum_emulator import MPSQuantumEmulator
+from quantum_simulator.observable import Observable
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_operation import OneQubitOperation, TwoQubitsOperation
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+from quantum_simulator.random_generator import RandomGenerator
+
+
+@pytest.mark.mps
+class TestMatrixProductState(TestCase):
+    """MatrixProductState and MPSQuantumEmulator tests class"""
+
+    def test_mps_init(self):
+        """Tests MatrixProductState init"""
+        with self.assertRaises(TypeError):
+            MatrixProductState(2.0)
+        with self.assertRaises(ValueError):
+            MatrixProductState(0)
+        with self.assertRaises(ValueError):
+            MatrixProductState(3, max_bond_dimension=0)
+        with self.assertRaises(TypeError):
+            MatrixProductState(3, dtype=np.float64)
+        with self.assertRaises(ValueError):
+            MPSQuantumEmulator(truncation_threshold=-1)
+
+        state = MatrixProductState(4)
+        self.assertEqual((state.num_qubits, state.bond_dimensions, state.norm()), (4, [1, 1, 1], 1))
+        self.assertTrue((state.to_state_vector().vector == QuantumStateVector(4).vector).all())
+        with self.assertRaises(ValueError):
+            state.apply_gate(OneQubitOperation.X().matrix, [4])
+        with self.assertRaises(ValueError):
+            state.apply_gate(TwoQubitsOperation.CX().matrix, [1, 1])
+
+    def test_state_vector_conversion(self):
+        """Tests conversion from and to state vector"""
+        vector = RandomGenerator(seed=2).rands(2**6) + 1j * RandomGenerator(seed=3).rands(2**6)
+        state_vector = QuantumStateVector(vector / np.linalg.norm(vector))
+        state = MatrixProductState.from_state_vector(state_vector)
+        self.assertEqual(state.bond_dimensions, [2, 4, 8, 4, 2])
+        self.assertTrue(np.allclose(state.to_state_vector().vector, state_vector.vector))
+        self.assertTrue(np.allclose(state.copy().to_state_vector().vector, state_vector.vector))
+
+        truncated = MatrixProductState.from_state_vector(state_vector, max_bond_dimension=2)
+        self.assertEqual(max(truncated.bond_dimensions), 2)
+        self.assertGreater(truncated.truncation_error, 0)
+        self.assertAlmostEqual(truncated.norm(), 1)
+
+        wide = MatrixProductState(MatrixProductState.MAX_STATE_VECTOR_QUBITS + 1)
+        with self.assertRaises(ValueError):
+            wide.to_state_vector()
+
+    def test_routed_gates(self):
+        """Tests gates on non-adjacent and reversed qubits match the state vector simulation"""
+        rand_gen = RandomGenerator(seed=7)
+        state = MatrixProductState(6)
+        state_vector = QuantumStateVector(6)
+        for target_qubits in [[0], [5], [0, 5], [4, 1], [2, 3], [3, 2], [5, 0], [1, 4]]:
+            if len(target_qubits) == 1:
+                operation = OneQubitOperation(rand_gen.rand_unitary("1q"), target_qubits)
+            else:
+                operation = TwoQubitsOperation(rand_gen.rand_unitary("2q"), target_qubits)
+            state.apply_gate(operation.matrix, operation.target_qubits)
+            state_vector = CustomQuantumEmulator().apply_gate(operation, state_vector)
+            self.assertTrue(np.allclose(state.to_state_vector().vector, state_vector.vector))
+        # routed qubits are not swapped back
+        self.assertNotEqual(state.qubit_at, list(range(6)))
+        self.assertEqual(sorted(state.qubit_at), list(range(6)))
+
+    def test_truncated_circuit(self):
+        """Tests bond dimension truncation keeps high fidelity of a shallow circuit"""
+        circuit = QuantumCircuit(width=10, depth=60, weight_2q=0.5, seed=4)
+        circuit.generate_gates_and_unite()
+        expected_result = CustomQuantumEmulator().execute(circuit)
+
+        state = MPSQuantumEmulator(max_bond_dimension=8).execute_mps(circuit)
+        self.assertLessEqual(max(state.bond_dimensions), 8)
+        fidelity = abs(np.vdot(expected_result.vector, state.to_state_vector().vector)) ** 2
+        # discarded weight bounds the infidelity up to the first order
+        self.assertGreater(fidelity, 1 - 2 * state.truncation_error - 1e-9)
+        self.assertLess(fidelity, 1)
+
+        result = MPSQuantumEmulator(dtype=np.complex64).execute(circuit)
+        self.assertEqual(result.dtype, np.complex64)
+        self.assertGreater(abs(np.vdot(expected_result.vector, result.vector)) ** 2, 1 - 1e-5)
+
+    def test_wide_circuit(self):
+        """Tests 64-qubit GHZ state circuit shots and expectation values in bounded memory"""
+        width = 64
+        circuit = QuantumCircuit(width=width, depth=0, weight_2q=0)
+        circuit.append_gate(OneQubitOperation.H([0]))
+        for qubit in range(1, width):
+            circuit.append_gate(TwoQubitsOperation.CX([qubit, 0]))
+
+        emulator = MPSQuantumEmulator(max_bond_dimension=4)
+        state = emulator.execute_mps(circuit)
+        self.assertEqual(state.bond_dimensions, [2] * (width - 1))
+        self.assertLess(state.nbytes, 2**14)
+        self.assertAlmostEqual(state.truncation_error, 0)
+
+        counts = emulator.execute_shots(circuit, 1000, seed=3)
+        self.assertEqual(set(counts), {"0" * width, "1" * width})
+        self.assertEqual(sum(counts.values()), 1000)
+        self.assertEqual(counts, emulator.execute_shots(circuit, 1000, seed=3))
+
+        observable = Observable({"Z" + "I" * (width - 2) + "Z": 1.0, "X" * width: 0.5, "Z" + "I" * (width - 1): 2.0})
+        self.assertAlmostEqual(emulator.expectation_value(circuit, observable), 1.5)
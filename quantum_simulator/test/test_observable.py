@@ -0,0 +1,78 @@
+"""Observable tests module"""
+
+from itertools import product
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from qiskit.quantum_info import SparsePauliOp as QiskitSparsePauliOp
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.observable import Observable
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+
+
+@pytest.mark.observable
+class TestObservable(TestCase):
+    """Observable tests class"""
+
+    def test_observable_init(self):
+        """Tests Observable init from labels and errors"""
+        observable = Observable({"XIZ": 0.5, "yyi": -1})
+        self.assertEqual(observable.num_qubits, 3)
+        self.assertEqual(len(observable), 2)
+        self.assertEqual(observable.x_masks.tolist(), [0b001, 0b011])
+        self.assertEqual(observable.z_masks.tolist(), [0b100, 0b011])
+        self.assertEqual(observable.coefficients.tolist(), [0.5, -1])
+        self.assertEqual(observable.labels, ["XIZ", "YYI"])
+        self.assertEqual(Observable([("Z", 1), ("X", 2)]).labels, ["Z", "X"])
+
+        with self.assertRaises(TypeError):
+            Observable("XZ")
+        with self.assertRaises(ValueError):
+            Observable([])
+        with self.assertRaises(ValueError):
+            Observable({"XZ": 1, "X": 1})
+        with self.assertRaises(ValueError):
+            Observable({"XA": 1})
+        with self.assertRaises(ValueError):
+            Observable({"": 1})
+
+    def test_observable_qiskit(self):
+        """Tests Observable conversion to and from Qiskit SparsePauliOp (reversed labels)"""
+        observable = Observable({"XIZ": 0.5, "YYI": -1j})
+        qiskit_operator = observable.to_qiskit()
+        self.assertEqual(qiskit_operator.paulis.to_labels(), ["ZIX", "IYY"])
+        self.assertTrue(np.allclose(qiskit_operator.coeffs, [0.5, -1j]))
+
+        converted = Observable.from_qiskit(QiskitSparsePauliOp(["ZIX", "IYY"], [2, 3]))
+        self.assertEqual(converted.labels, ["XIZ", "YYI"])
+        self.assertEqual(converted.coefficients.tolist(), [2, 3])
+
+    def test_term_expectation_values(self):
+        """Tests Pauli strings expectation values against Qiskit for all Pauli strings"""
+        for width in [1, 2, 4]:
+            circuit = QuantumCircuit(width=width, depth=10 * width, weight_2q=0.4, seed=width)
+            circuit.generate_gates_and_unite()
+            state_vector = CustomQuantumEmulator().execute(circuit)
+            qiskit_state_vector = state_vector.to_qiskit()
+
+            # all strings - X groups use Walsh-Hadamard transform, a few strings - parity sums
+            for labels in [["".join(chars) for chars in product("IXYZ", repeat=width)], ["I" * width, "Y" * width, "Z" + "X" * (width - 1)]]:
+                observable = Observable([(label, 1) for label in labels])
+                expected_values = [qiskit_state_vector.expectation_value(QiskitSparsePauliOp(label[::-1])).real for label in labels]
+                self.assertTrue(np.allclose(observable.term_expectation_values(state_vector), expected_values))
+
+    def test_expectation_value(self):
+        """Tests Hamiltonian expectation value"""
+        bell_state = QuantumStateVector([1 / np.sqrt(2), 0, 0, 1 / np.sqrt(2)])
+        self.assertAlmostEqual(Observable({"ZZ": 1, "XX": 1, "YY": 1, "ZI": 3}).expectation_value(bell_state), 1)
+        self.assertIsInstance(Observable({"ZZ": 2}).expectation_value(bell_state), float)
+
+        value = Observable({"ZZ": 1j, "XX": 2}).expectation_value(bell_state)
+        self.assertIsInstance(value, complex)
+        self.assertAlmostEqual(value, 2 + 1j)
+
+        with self.assertRaises(ValueError):
+            Observable({"ZZZ": 1}).expectation_value(bell_state)
@@ -1,10 +1,18 @@
 """Random generator tests module"""
 
+import io
 from unittest import TestCase
 
+import numpy as np
 import pytest
+from qiskit import QuantumCircuit as QiskitQuantumCircuit
+from qiskit.quantum_info import Statevector as QiskitStateVector
 
-from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import GateView, QuantumCircuit
+from quantum_simulator.quantum_operation import OneQubitOperation, TwoQubitsOperation
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+from quantum_simulator.random_generator import RandomGenerator
 
 
 @pytest.mark.quant_circuit
@@ -47,3 +55,191 @@ class TestQuantumCircuit(TestCase):
             # ensure last layer qubits cannot be moved lower
             for _, target_qubits in quantum_circuit.gate_layers:
                 self.assertTrue(last_layer_target.issubset(target_qubits))
+
+    def test_fuse_gates(self):
+        """Tests QuantumCircuit.fuse_gates() optimization pass"""
+        emulator = CustomQuantumEmulator()
+        for width, weight_2q in [(1, 0), (2, 0.5), (3, 0.2), (5, 0.3), (6, 0.8)]:
+            for seed in range(5):
+                quantum_circuit = QuantumCircuit(width=width, depth=60, weight_2q=weight_2q, seed=seed)
+                quantum_circuit.generate_gates_and_unite()
+                fused_circuit = quantum_circuit.fuse_gates()
+                self.assertEqual(fused_circuit.width, width)
+                self.assertLessEqual(fused_circuit.gates_count, quantum_circuit.gates_count)
+
+                state_vector = QuantumStateVector(width)
+                expected_result = emulator.apply_circuit(quantum_circuit, state_vector)
+                result = emulator.apply_circuit(fused_circuit, state_vector)
+                self.assertTrue(np.allclose(result.vector, expected_result.vector))
+
+        # single qubit circuit is fused to a single gate
+        quantum_circuit = QuantumCircuit(width=1, depth=10, weight_2q=0)
+        quantum_circuit.generate_gates_and_unite()
+        self.assertEqual(quantum_circuit.gates_count, 10)
+        self.assertEqual(quantum_circuit.fuse_gates().gates_count, 1)
+
+        # 2-qubit circuit is fused to a single gate as soon as it has any 2-qubit gate
+        quantum_circuit = QuantumCircuit(width=2, depth=50, weight_2q=0.5)
+        quantum_circuit.generate_gates_and_unite()
+        self.assertEqual(quantum_circuit.fuse_gates().gates_count, 1)
+
+    def test_generate_gates_reproducibility(self):
+        """Tests batched QuantumCircuit.generate_gates_and_unite() reproduces gate by gate generation"""
+        quantum_circuit = QuantumCircuit(width=4, depth=200, weight_2q=0.4, seed=11)
+        quantum_circuit.generate_gates_and_unite()
+
+        # gate by gate generation with the same random numbers stream
+        rand_gen = RandomGenerator(seed=11)
+        expected_gates = []
+        for _ in range(200):
+            if rand_gen.rand() >= 0.4:
+                expected_gates.append(([rand_gen.rand_int() % 4], rand_gen.rand_unitary(mode="1q")))
+            else:
+                q1, q2 = rand_gen.rand_int() % 4, rand_gen.rand_int() % 4
+                while q2 == q1:
+                    q2 = rand_gen.rand_int() % 4
+                expected_gates.append(([q1, q2], rand_gen.rand_unitary(mode="2q")))
+        self.assertEqual(quantum_circuit.random_generator.state, rand_gen.state)
+
+        # layers keep generation order of the gates on the same qubits, so compare per-qubit gate sequences
+        for qubit in range(4):
+            gates = [gate for layer_gates, _ in quantum_circuit.gate_layers for gate in layer_gates if qubit in gate.target_qubits]
+            expected = [(target_qubits, matrix) for target_qubits, matrix in expected_gates if qubit in target_qubits]
+            self.assertEqual([gate.target_qubits for gate in gates], [target_qubits for target_qubits, _ in expected])
+            for gate, (_, matrix) in zip(gates, expected):
+                self.assertTrue(np.allclose(gate.matrix, matrix, atol=1e-10))
+
+    def test_packed_gates_storage(self):
+        """Tests QuantumCircuit structure of arrays gates storage and its views"""
+        quantum_circuit = QuantumCircuit(width=5, depth=300, weight_2q=0.4, seed=2)
+        quantum_circuit.generate_gates_and_unite()
+        n_gates = quantum_circuit.gates_count
+        self.assertEqual(n_gates, 300)
+        self.assertEqual(quantum_circuit.gate_targets.shape, (n_gates, 2))
+        self.assertEqual(quantum_circuit.gate_targets.dtype, np.int32)
+        self.assertEqual(quantum_circuit.gate_layer.shape, (n_gates,))
+        self.assertEqual(quantum_circuit.gate_offsets[-1], len(quantum_circuit.gate_matrices))
+        self.assertEqual(quantum_circuit.layers_count, len(quantum_circuit.gate_layers))
+
+        # packed arrays are read-only
+        with self.assertRaises(ValueError):
+            quantum_circuit.gate_targets[0, 0] = 1
+        with self.assertRaises(ValueError):
+            quantum_circuit.gate(0).matrix[0, 0] = 1
+
+        # layer offsets and compatibility view describe the same layers
+        order, offsets = quantum_circuit.layer_order, quantum_circuit.layer_offsets
+        self.assertEqual(sorted(order.tolist()), list(range(n_gates)))
+        for layer, (layer_gates, target_qubits) in enumerate(quantum_circuit.gate_layers):
+            indices = order[offsets[layer] : offsets[layer + 1]]
+            self.assertTrue((quantum_circuit.gate_layer[indices] == layer).all())
+            self.assertEqual(len(layer_gates), len(indices))
+            self.assertEqual(target_qubits, {qubit for gate in layer_gates for qubit in gate.target_qubits})
+            for index, gate in zip(indices.tolist(), layer_gates):
+                self.assertTrue((gate.matrix == quantum_circuit.gate(index).matrix).all())
+                self.assertEqual(gate.target_qubits, quantum_circuit.gate(index).target_qubits)
+                self.assertEqual(gate.matrix.shape, (2 ** len(gate.target_qubits),) * 2)
+
+        with self.assertRaises(IndexError):
+            quantum_circuit.gate(n_gates)
+
+    def test_gate_layers_cache(self):
+        """Tests QuantumCircuit gate_layers compatibility view is rebuilt after circuit modification"""
+        quantum_circuit = QuantumCircuit(width=3, depth=10, weight_2q=0.5)
+        self.assertEqual(quantum_circuit.gate_layers, [])
+        quantum_circuit.generate_gates_and_unite()
+        gate_layers = quantum_circuit.gate_layers
+        self.assertIs(quantum_circuit.gate_layers, gate_layers)
+        self.assertEqual(sum(len(layer_gates) for layer_gates, _ in gate_layers), 10)
+
+        quantum_circuit.generate_gates_and_unite()
+        self.assertIsNot(quantum_circuit.gate_layers, gate_layers)
+        self.assertEqual(sum(len(layer_gates) for layer_gates, _ in quantum_circuit.gate_layers), 20)
+
+    def test_append_gate(self):
+        """Tests QuantumCircuit.append_gate() incremental building with ASAP layering"""
+        quantum_circuit = QuantumCircuit(width=3, depth=0, weight_2q=0)
+        self.assertEqual(quantum_circuit.append_gate(OneQubitOperation.H([0])), 0)
+        self.assertEqual(quantum_circuit.append_gate(OneQubitOperation.X([1])), 0)
+        self.assertEqual(quantum_circuit.append_gate(TwoQubitsOperation.CX([0, 1])), 1)
+        self.assertEqual(quantum_circuit.append_gate(OneQubitOperation.Z([2])), 0)
+        self.assertEqual(quantum_circuit.append_gate(TwoQubitsOperation.CZ([2, 1])), 2)
+        self.assertEqual(quantum_circuit.append_gate(OneQubitOperation.T([0])), 2)
+        self.assertEqual(quantum_circuit.gates_count, 6)
+        self.assertEqual(quantum_circuit.layers_count, 3)
+        self.assertEqual([target_qubits for _, target_qubits in quantum_circuit.gate_layers], [{0, 1, 2}, {0, 1}, {0, 1, 2}])
+        self.assertTrue((quantum_circuit.gate(2).matrix == TwoQubitsOperation.CX().matrix).all())
+
+        # rebuilding generated circuit gate by gate gives the same layers
+        generated = QuantumCircuit(width=6, depth=200, weight_2q=0.4, seed=5)
+        generated.generate_gates_and_unite()
+        rebuilt = QuantumCircuit(width=6, depth=0, weight_2q=0)
+        for index in range(generated.gates_count):
+            rebuilt.append_gate(generated.gate(index))
+        self.assertTrue((rebuilt.gate_layer == generated.gate_layer).all())
+        self.assertTrue((rebuilt.gate_matrices == generated.gate_matrices).all())
+        self.assertEqual(rebuilt.layers_count, generated.layers_count)
+
+        with self.assertRaises(ValueError):
+            quantum_circuit.append_gate(OneQubitOperation.X([3]))
+        with self.assertRaises(ValueError):
+            quantum_circuit.append_gate(TwoQubitsOperation.CX([1, 1]))
+        with self.assertRaises(ValueError):
+            quantum_circuit.append_gate(GateView(np.eye(8), [0, 1, 2]))
+        with self.assertRaises(ValueError):
+            quantum_circuit.append_gate(GateView(np.eye(2), [0, 1]))
+        self.assertEqual(quantum_circuit.gates_count, 6)
+
+    def test_save_load(self):
+        """Tests QuantumCircuit save and load round trip"""
+        quantum_circuit = QuantumCircuit(width=5, depth=50, weight_2q=0.4, seed=8)
+        quantum_circuit.generate_gates_and_unite()
+        file = io.BytesIO()
+        quantum_circuit.save(file)
+        file.seek(0)
+        loaded = QuantumCircuit.load(file)
+
+        self.assertEqual((loaded.width, loaded.depth, loaded.weight_2q, loaded.seed), (5, 50, 0.4, 8))
+        self.assertEqual((loaded.gates_count, loaded.layers_count), (quantum_circuit.gates_count, quantum_circuit.layers_count))
+        for name in ["gate_matrices", "gate_offsets", "gate_targets", "gate_layer", "layer_order", "layer_offsets"]:
+            self.assertTrue((getattr(loaded, name) == getattr(quantum_circuit, name)).all())
+
+        # loaded circuit continues generation and layering as the saved one
+        quantum_circuit.generate_gates_and_unite()
+        loaded.generate_gates_and_unite()
+        self.assertTrue((loaded.gate_matrices == quantum_circuit.gate_matrices).all())
+        self.assertTrue((loaded.gate_layer == quantum_circuit.gate_layer).all())
+
+        empty = QuantumCircuit(width=2, depth=0, weight_2q=0)
+        file = io.BytesIO()
+        empty.save(file)
+        file.seek(0)
+        loaded = QuantumCircuit.load(file)
+        self.assertEqual((loaded.gates_count, loaded.layers_count), (0, 0))
+        self.assertEqual(loaded.append_gate(OneQubitOperation.X([1])), 0)
+
+    def test_to_qiskit(self):
+        """Tests QuantumCircuit translation to Qiskit circuit and its caching"""
+        quantum_circuit = QuantumCircuit(width=4, depth=30, weight_2q=0.5, seed=2)
+        quantum_circuit.generate_gates_and_unite()
+        qiskit_circuit = quantum_circuit.to_qiskit()
+        self.assertIsInstance(qiskit_circuit, QiskitQuantumCircuit)
+        self.assertEqual(qiskit_circuit.num_qubits, 4)
+        self.assertEqual(len(qiskit_circuit.data), 30)
+        self.assertIs(quantum_circuit.to_qiskit(), qiskit_circuit)
+
+        # instructions follow layers order, gate target qubits are qargs
+        index = 0
+        for layer_gates in quantum_circuit.iter_layers():
+            for gate in layer_gates:
+                instruction = qiskit_circuit.data[index]
+                self.assertEqual([qiskit_circuit.find_bit(qubit).index for qubit in instruction.qubits], gate.target_qubits)
+                self.assertTrue(np.allclose(instruction.operation.to_matrix(), gate.matrix))
+                index += 1
+        expected_vector = CustomQuantumEmulator().execute(quantum_circuit).vector
+        self.assertTrue(np.allclose(QiskitStateVector.from_int(0, 2**4).evolve(qiskit_circuit).data, expected_vector))
+
+        # modification invalidates the translation
+        quantum_circuit.append_gate(OneQubitOperation.X([3]))
+        self.assertIsNot(quantum_circuit.to_qiskit(), qiskit_circuit)
+        self.assertEqual(len(quantum_circuit.to_qiskit().data), 31)
@@ -92,3 +92,34 @@ class TestQuantumOperation(TestCase):
                 if i == j:
                     continue
                 self.assertTrue((sigma_i.matrix @ sigma_j.matrix == -1 * sigma_j.matrix @ sigma_i.matrix).all())
+
+    def test_classify(self):
+        """Tests operations matrix classification"""
+        for operation in [OneQubitOperation.I(), OneQubitOperation.Z(), OneQubitOperation.T(), TwoQubitsOperation.CZ()]:
+            self.assertEqual(operation.kind, operation.DIAGONAL)
+            self.assertTrue((operation.permutation == np.arange(len(operation.matrix))).all())
+            self.assertTrue((operation.phases == np.diag(operation.matrix)).all())
+
+        for operation in [OneQubitOperation.X(), OneQubitOperation.Y(), TwoQubitsOperation.CX(), TwoQubitsOperation.SWAP()]:
+            self.assertEqual(operation.kind, operation.PERMUTATION)
+            rows = np.arange(len(operation.matrix))
+            self.assertTrue((operation.matrix[rows, operation.permutation] == operation.phases).all())
+        self.assertEqual(TwoQubitsOperation.CX().permutation.tolist(), [0, 1, 3, 2])
+        self.assertEqual(TwoQubitsOperation.SWAP().permutation.tolist(), [0, 2, 1, 3])
+        self.assertEqual(OneQubitOperation.Y().phases.tolist(), [-1j, 1j])
+
+        H = OneQubitOperation.H()
+        self.assertEqual(H.kind, H.GENERIC)
+        self.assertIsNone(H.permutation)
+        self.assertIsNone(H.phases)
+        # a zero row is not a permutation
+        self.assertEqual(OneQubitOperation.classify(np.array([[1, 1], [0, 0]]))[0], OneQubitOperation.GENERIC)
+        self.assertEqual(OneQubitOperation.classify(np.array([[0, 0], [1, 1]]))[0], OneQubitOperation.GENERIC)
+
+    def test_to_qiskit(self):
+        """Tests operation translation to Qiskit gate"""
+        CX = TwoQubitsOperation.CX([0, 2])
+        qiskit_gate = CX.to_qiskit()
+        self.assertEqual(qiskit_gate.num_qubits, 2)
+        self.assertTrue((qiskit_gate.to_matrix() == CX.matrix).all())
+        self.assertIs(CX.to_qiskit(), qiskit_gate)
@@ -1,5 +1,7 @@
 """Quantum state vector tests module"""
 
+import os
+import tempfile
 from unittest import TestCase
 
 import numpy as np
@@ -21,7 +23,7 @@ class TestQuantumStateVector(TestCase):
         self.assertEqual(quant_state_vec.length, 2)
         self.assertEqual(quant_state_vec[0], 1)
         self.assertEqual(quant_state_vec[1], 0)
-        self.assertEqual(quant_state_vec.vector, [1, 0])
+        self.assertTrue((quant_state_vec.vector == [1, 0]).all())
 
     def test_quantum_state_vector_init_from_list(self):
         """Tests QuantumStateVector init from list"""
@@ -30,7 +32,7 @@ class TestQuantumStateVector(TestCase):
         self.assertEqual(quant_state_vec.length, 2)
         self.assertEqual(quant_state_vec[0], 1)
         self.assertEqual(quant_state_vec[1], 0)
-        self.assertEqual(quant_state_vec.vector, [1, 0])
+        self.assertTrue((quant_state_vec.vector == [1, 0]).all())
 
     def test_quantum_state_vector_init_errors(self):
         """Tests QuantumStateVector init errors"""
@@ -58,7 +60,7 @@ class TestQuantumStateVector(TestCase):
         self.assertEqual(quant_state_vec[1], 0)
         self.assertEqual(quant_state_vec[2], 0)
         self.assertEqual(quant_state_vec[3], 0)
-        self.assertEqual(quant_state_vec.vector, [1, 0, 0, 0])
+        self.assertTrue((quant_state_vec.vector == [1, 0, 0, 0]).all())
 
     def test_quantum_state_vector_get_item(self):
         """Tests QuantumStateVector vector values getter"""
@@ -67,7 +69,7 @@ class TestQuantumStateVector(TestCase):
         quant_state_vec = QuantumStateVector(target_vector)
         for ind, val in enumerate(target_vector):
             self.assertEqual(quant_state_vec[ind], val)
-        self.assertEqual(quant_state_vec.vector, target_vector)
+        self.assertTrue((quant_state_vec.vector == target_vector).all())
 
         with self.assertRaises(TypeError):
             _ = quant_state_vec[1.0]
@@ -78,11 +80,11 @@ class TestQuantumStateVector(TestCase):
         target_vector = [1, 2, 3, 4, 5, 6, 7, 8]
         quant_state_vec = QuantumStateVector(3)
         self.assertEqual(quant_state_vec.length, 8)
-        self.assertEqual(quant_state_vec.vector, [1, 0, 0, 0, 0, 0, 0, 0])
+        self.assertTrue((quant_state_vec.vector == [1, 0, 0, 0, 0, 0, 0, 0]).all())
         for ind, val in enumerate(target_vector):
             quant_state_vec[ind] = val
             self.assertEqual(quant_state_vec[ind], val)
-        self.assertEqual(quant_state_vec.vector, target_vector)
+        self.assertTrue((quant_state_vec.vector == target_vector).all())
 
         with self.assertRaises(TypeError):
             quant_state_vec[1.0] = 0
@@ -105,3 +107,152 @@ class TestQuantumStateVector(TestCase):
         self.assertTrue(isinstance(qiskit_state_vector, QiskitStateVector))
         self.assertEqual(qiskit_state_vector[0], 1)
         self.assertEqual(qiskit_state_vector[1], 0)
+
+    def test_quantum_state_vector_dtype(self):
+        """Tests QuantumStateVector amplitudes buffer dtype"""
+
+        quant_state_vec = QuantumStateVector(3)
+        self.assertEqual(quant_state_vec.dtype, np.complex128)
+        self.assertEqual(quant_state_vec.vector.dtype, np.complex128)
+        self.assertEqual(quant_state_vec.nbytes, 8 * 16)
+
+        quant_state_vec = QuantumStateVector([1, 0, 0, 0], dtype=np.complex64)
+        self.assertEqual(quant_state_vec.vector.dtype, np.complex64)
+        self.assertEqual(quant_state_vec.nbytes, 4 * 8)
+        self.assertEqual(quant_state_vec.copy().dtype, np.complex64)
+
+        with self.assertRaises(TypeError):
+            _ = QuantumStateVector(1, dtype=np.float64)
+
+    def test_quantum_state_vector_zero_copy(self):
+        """Tests QuantumStateVector shares memory with NumPy and Qiskit buffers"""
+
+        amplitudes = np.array([1, 0, 0, 1], dtype=np.complex128) / np.sqrt(2)
+        quant_state_vec = QuantumStateVector(amplitudes)
+        self.assertTrue(np.shares_memory(quant_state_vec.vector, amplitudes))
+
+        qiskit_state_vector = quant_state_vec.to_qiskit()
+        self.assertTrue(np.shares_memory(qiskit_state_vector.data, amplitudes))
+
+        quant_state_vec = QuantumStateVector().from_qiskit(qiskit_state_vector)
+        self.assertEqual(quant_state_vec.num_qubits, 2)
+        self.assertTrue(np.shares_memory(quant_state_vec.vector, amplitudes))
+
+        copied = quant_state_vec.copy()
+        self.assertFalse(np.shares_memory(copied.vector, amplitudes))
+        self.assertTrue((copied.vector == amplitudes).all())
+
+    def test_quantum_state_vector_probabilities(self):
+        """Tests QuantumStateVector measurement probabilities"""
+
+        quant_state_vec = QuantumStateVector([1 / np.sqrt(2), 0, 0, 1j / np.sqrt(2)])
+        self.assertTrue(np.allclose(quant_state_vec.probabilities(), [0.5, 0, 0, 0.5]))
+
+    def test_quantum_state_vector_bitstrings(self):
+        """Tests QuantumStateVector basis states bitstrings follow the qubit indexing convention"""
+
+        self.assertEqual(QuantumStateVector.bitstrings([0, 8, 10, 15], 4), ["0000", "0001", "0101", "1111"])
+        self.assertEqual(QuantumStateVector.bitstrings([1, 2], 2), ["10", "01"])
+
+    def test_quantum_state_vector_sample_counts(self):
+        """Tests QuantumStateVector shots sampling"""
+
+        # basis state is always measured
+        quant_state_vec = QuantumStateVector([0, 0, 0, 0, 1, 0, 0, 0])
+        self.assertEqual(quant_state_vec.sample_counts(1000, seed=1), {"001": 1000})
+
+        # Bell state measurements are correlated and reproducible
+        quant_state_vec = QuantumStateVector([1 / np.sqrt(2), 0, 0, 1 / np.sqrt(2)])
+        counts = quant_state_vec.sample_counts(10000, seed=1)
+        self.assertEqual(set(counts), {"00", "11"})
+        self.assertEqual(sum(counts.values()), 10000)
+        self.assertAlmostEqual(counts["00"] / 10000, 0.5, delta=0.03)
+        self.assertEqual(counts, quant_state_vec.sample_counts(10000, seed=1))
+
+        # sampled frequencies follow probabilities
+        amplitudes = np.sqrt(np.array([0.1, 0.2, 0.3, 0.4, 0, 0, 0, 0]))
+        samples = QuantumStateVector(amplitudes.tolist()).sample(100000, seed=2)
+        self.assertEqual(len(samples), 100000)
+        self.assertTrue(np.allclose(np.bincount(samples, minlength=8) / 100000, amplitudes**2, atol=0.01))
+
+        with self.assertRaises(ValueError):
+            quant_state_vec.sample(0)
+
+    def test_quantum_state_vector_from_file(self):
+        """Tests memory-mapped QuantumStateVector"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "state.bin")
+            quant_state_vec = QuantumStateVector(dtype=np.complex64).from_file(filename, 3)
+            self.assertEqual(quant_state_vec.filename, filename)
+            self.assertEqual(quant_state_vec.num_qubits, 3)
+            self.assertEqual(quant_state_vec.vector.dtype, np.complex64)
+            self.assertTrue((quant_state_vec.vector == [1, 0, 0, 0, 0, 0, 0, 0]).all())
+            self.assertEqual(os.path.getsize(filename), 8 * 8)
+
+            quant_state_vec[5] = 1j
+            quant_state_vec.flush()
+            reopened = QuantumStateVector(dtype=np.complex64).from_file(filename)
+            self.assertEqual(reopened.num_qubits, 3)
+            self.assertEqual(reopened[5], 1j)
+
+            # copies are kept in memory
+            copied = reopened.copy()
+            self.assertIsNone(copied.filename)
+            self.assertNotIsInstance(copied.vector, np.memmap)
+            self.assertTrue((copied.vector == reopened.vector).all())
+            del quant_state_vec, reopened
+
+            with self.assertRaises(ValueError):
+                QuantumStateVector().from_file(filename, 0)
+            with self.assertRaises(TypeError):
+                QuantumStateVector().from_file(filename, 2.0)
+            # 8 complex64 amplitudes are 4 complex128 ones, 3 complex128 amplitudes are not a state
+            self.assertEqual(QuantumStateVector().from_file(filename).num_qubits, 2)
+            with open(filename, "wb") as file:
+                file.write(bytes(3 * 16))
+            with self.assertRaises(ValueError):
+                QuantumStateVector().from_file(filename)
+
+    def test_quantum_state_vector_from_shared_memory(self):
+        """Tests QuantumStateVector in a shared memory block"""
+        quant_state_vec = QuantumStateVector(dtype=np.complex64).from_shared_memory(num_qubits=3)
+        name = quant_state_vec.shared_memory_name
+        self.assertIsNotNone(name)
+        self.assertIsNone(quant_state_vec.filename)
+        self.assertEqual(quant_state_vec.num_qubits, 3)
+        self.assertEqual(quant_state_vec.vector.dtype, np.complex64)
+        self.assertTrue((quant_state_vec.vector == [1, 0, 0, 0, 0, 0, 0, 0]).all())
+
+        # attached state shares the amplitudes, the vector setter keeps them in the block
+        attached = QuantumStateVector(dtype=np.complex64).from_shared_memory(name)
+        attached[5] = 1j
+        self.assertEqual(quant_state_vec[5], 1j)
+        quant_state_vec.vector = np.ones(8) / 8**0.5
+        self.assertEqual(attached.shared_memory_name, name)
+        self.assertTrue(np.allclose(attached.vector, 8**-0.5))
+
+        # copies are kept in memory, views outlive the state
+        copied = quant_state_vec.copy()
+        self.assertIsNone(copied.shared_memory_name)
+        self.assertTrue((copied.vector == quant_state_vec.vector).all())
+        view = quant_state_vec.vector[2:]
+        del quant_state_vec, attached
+        self.assertTrue(np.allclose(view, 8**-0.5))
+        # the block created by the state is unlinked
+        with self.assertRaises(FileNotFoundError):
+            QuantumStateVector().from_shared_memory(name)
+
+        reinitialized = QuantumStateVector().from_shared_memory(num_qubits=2)
+        name = reinitialized.shared_memory_name
+        reinitialized.from_num_qubits(2)
+        self.assertIsNone(reinitialized.shared_memory_name)
+        with self.assertRaises(FileNotFoundError):
+            QuantumStateVector().from_shared_memory(name)
+
+        with self.assertRaises(ValueError):
+            QuantumStateVector().from_shared_memory()
+        with self.assertRaises(ValueError):
+            QuantumStateVector().from_shared_memory(num_qubits=0)
+        with self.assertRaises(TypeError):
+            QuantumStateVector().from_shared_memory(num_qubits=2.0)
@@ -70,3 +70,63 @@ class TestRandomGenerator(TestCase):
             ]
         )
         self.assertTrue(np.isclose(U2, target_U2).all())
+
+    def test_random_generator_rand_ints(self):
+        """Tests RandomGenerator rand_ints() bulk draws reproduce rand_int() sequence"""
+        for n in [0, 1, 5, 64, 65, 1000, 4097]:
+            rand_gen, bulk_rand_gen = RandomGenerator(seed=n), RandomGenerator(seed=n)
+            expected = [rand_gen.rand_int() for _ in range(n)]
+            values = bulk_rand_gen.rand_ints(n)
+            self.assertEqual(values.tolist(), expected)
+            self.assertEqual(bulk_rand_gen.state, rand_gen.state)
+            # sequence continues from the same state
+            self.assertEqual(bulk_rand_gen.rand_int(), rand_gen.rand_int())
+
+        # large modulus falls back to Python integers
+        rand_gen = RandomGenerator(m=2**61 - 1, a=2**40 + 15, c=7, seed=3)
+        bulk_rand_gen = RandomGenerator(m=2**61 - 1, a=2**40 + 15, c=7, seed=3)
+        self.assertEqual(bulk_rand_gen.rand_ints(300).tolist(), [rand_gen.rand_int() for _ in range(300)])
+
+        with self.assertRaises(ValueError):
+            RandomGenerator().rand_ints(-1)
+
+    def test_random_generator_rands(self):
+        """Tests RandomGenerator rands() bulk draws reproduce rand() sequence bit for bit"""
+        rand_gen, bulk_rand_gen = RandomGenerator(), RandomGenerator()
+        self.assertEqual(bulk_rand_gen.rands(500).tolist(), [rand_gen.rand() for _ in range(500)])
+        self.assertEqual(bulk_rand_gen.rands(500, L=100).tolist(), [rand_gen.rand(L=100) for _ in range(500)])
+
+    def test_random_generator_skip(self):
+        """Tests RandomGenerator skip()"""
+        rand_gen, skip_rand_gen = RandomGenerator(), RandomGenerator()
+        for _ in range(12345):
+            rand_gen.rand_int()
+        skip_rand_gen.skip(12345)
+        self.assertEqual(skip_rand_gen.state, rand_gen.state)
+        self.assertEqual(skip_rand_gen.skip(0).state, rand_gen.state)
+        self.assertEqual(skip_rand_gen.jump_coefficients(1), (skip_rand_gen.a, skip_rand_gen.c))
+
+        with self.assertRaises(ValueError):
+            rand_gen.skip(-1)
+
+    def test_rand_unitaries(self):
+        """Tests RandomGenerator batched rand_unitaries() reproduce rand_unitary() to numerical tolerance"""
+        for mode in ["1q", "2q"]:
+            rand_gen, bulk_rand_gen = RandomGenerator(seed=3), RandomGenerator(seed=3)
+            expected = np.array([rand_gen.rand_unitary(mode) for _ in range(50)])
+            unitaries = bulk_rand_gen.rand_unitaries(mode, 50)
+            self.assertEqual(bulk_rand_gen.state, rand_gen.state)
+            self.assertTrue(np.allclose(unitaries, expected, atol=1e-10))
+            # unitarity
+            self.assertTrue(np.allclose(unitaries @ unitaries.conj().transpose(0, 2, 1), np.eye(expected.shape[1])))
+
+    def test_unitaries_from_states(self):
+        """Tests RandomGenerator unitaries_from_states() reproduce rand_unitary() called from given states"""
+        rand_gen = RandomGenerator()
+        states, expected = [], []
+        for mode in ["1q", "2q", "1q"]:
+            states.append(rand_gen.state)
+            expected.append(rand_gen.rand_unitary(mode))
+            rand_gen.rand_int()
+        self.assertTrue(np.allclose(rand_gen.unitaries_from_states(states[::2], "1q"), expected[::2], atol=1e-10))
+        self.assertTrue(np.allclose(rand_gen.unitaries_from_states(states[1:2], "2q"), expected[1:2], atol=1e-10))
@@ -0,0 +1,126 @@
+"""Shared memory quantum emulator tests module"""
+
+import os
+from multiprocessing import shared_memory
+from unittest import TestCase
+
+import numpy as np
+import pytest
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.quantum_circuit import QuantumCircuit
+from quantum_simulator.quantum_operation import QuantumOperation
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+from quantum_simulator.random_generator import RandomGenerator
+from quantum_simulator.shared_memory_quantum_emulator import SharedMemoryQuantumEmulator
+
+
+@pytest.mark.shared_memory
+class TestSharedMemoryQuantumEmulator(TestCase):
+    """SharedMemoryQuantumEmulator tests class"""
+
+    @staticmethod
+    def shared_memory_blocks() -> set:
+        """Returns names of the shared memory blocks in the system"""
+        return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+    def test_init(self):
+        """Tests SharedMemoryQuantumEmulator init"""
+        self.assertEqual(SharedMemoryQuantumEmulator().n_workers, os.cpu_count() or 1)
+        self.assertEqual(SharedMemoryQuantumEmulator(n_workers=3).n_workers, 3)
+        with self.assertRaises(ValueError):
+            SharedMemoryQuantumEmulator(n_workers=0)
+        with self.assertRaises(ValueError):
+            SharedMemoryQuantumEmulator(layer_block_qubits=0)
+
+    def test_group_blocks(self):
+        """Tests grouping of layer blocks between workers barriers"""
+        # pylint: disable=protected-access
+        identity = np.eye(2)
+        blocks = [(identity, [qubit], None) for qubit in [0, 1, 2, 3, 4, 5, 0]]
+        groups = SharedMemoryQuantumEmulator._group_blocks(blocks, 6, 4)
+        self.assertEqual([fixed for fixed, _ in groups], [[5, 4], [3, 2]])
+        self.assertEqual([[target for _, target, _ in chunk_blocks] for _, chunk_blocks in groups], [[[0], [1], [2], [3]], [[2], [3], [0]]])
+        self.assertEqual(len(SharedMemoryQuantumEmulator._group_blocks(blocks, 6, 1)), 1)
+        self.assertEqual(SharedMemoryQuantumEmulator._group_blocks([], 6, 4), [])
+
+    def test_random_circuits(self):
+        """Tests multi-process circuit application matches single-process one"""
+        blocks_before = self.shared_memory_blocks()
+        for n_workers, layer_block_qubits, remap_qubits in [(2, 5, False), (3, 3, True), (4, 1, False)]:
+            emulator = SharedMemoryQuantumEmulator(layer_block_qubits=layer_block_qubits, n_workers=n_workers, remap_qubits=remap_qubits)
+            emulator.PARALLEL_MIN_QUBITS = 1
+            emulator.REMAP_MIN_QUBITS = 1
+            for seed in range(3):
+                circuit = QuantumCircuit(width=7, depth=60, weight_2q=0.4, seed=seed)
+                circuit.generate_gates_and_unite()
+                rand_gen = RandomGenerator(seed=seed)
+                vector = rand_gen.rands(2**7) + 1j * rand_gen.rands(2**7)
+                state_vector = QuantumStateVector(vector / np.linalg.norm(vector))
+                expected_result = CustomQuantumEmulator().apply_circuit(circuit, state_vector)
+                result = emulator.apply_circuit(circuit, state_vector)
+                self.assertIsNotNone(result.shared_memory_name)
+                self.assertTrue(np.allclose(result.vector, expected_result.vector))
+                executed = emulator.execute(circuit)
+                expected_executed = CustomQuantumEmulator().execute(circuit)
+                self.assertIsNotNone(executed.shared_memory_name)
+                self.assertTrue(np.allclose(executed.vector, expected_executed.vector))
+
+                # shared states are processed in place by the workers, other states by the calling process
+                self.assertIs(emulator.apply_circuit_inplace(circuit, executed), executed)
+                self.assertTrue(np.allclose(executed.vector, CustomQuantumEmulator().apply_circuit(circuit, expected_executed).vector))
+                self.assertTrue(np.allclose(emulator.apply_circuit_inplace(circuit, state_vector.copy()).vector, expected_result.vector))
+                del result, executed
+            emulator.close()
+        self.assertEqual(self.shared_memory_blocks(), blocks_before)
+
+    def test_precision_and_fallbacks(self):
+        """Tests complex64 states, states processed by the calling process and worker restart"""
+        circuit = QuantumCircuit(width=6, depth=40, weight_2q=0.5, seed=4)
+        circuit.generate_gates_and_unite()
+        emulator = SharedMemoryQuantumEmulator(n_workers=2, dtype=np.complex64)
+        emulator.PARALLEL_MIN_QUBITS = 1
+        result = emulator.execute(circuit)
+        self.assertEqual(result.dtype, np.complex64)
+        self.assertEqual(result.vector.nbytes, 2**6 * 8)
+        self.assertTrue(np.allclose(result.vector, CustomQuantumEmulator().execute(circuit).vector, atol=1e-5))
+        emulator.close()
+        self.assertTrue(np.allclose(emulator.execute(circuit).vector, result.vector))
+        emulator.close()
+        emulator.close()
+
+        # small states are not shared with the workers
+        small_emulator = SharedMemoryQuantumEmulator(n_workers=2)
+        self.assertTrue(np.allclose(small_emulator.execute(circuit).vector, CustomQuantumEmulator().execute(circuit).vector))
+        self.assertIsNone(small_emulator._workers)  # pylint: disable=protected-access
+        self.assertIsNone(small_emulator.execute(circuit).shared_memory_name)
+        with self.assertRaises(ValueError):
+            emulator.apply_circuit(circuit, QuantumStateVector(5))
+
+    def test_worker_failure(self):
+        """Tests worker errors are raised and workers recover from them"""
+        # pylint: disable=protected-access
+        emulator = SharedMemoryQuantumEmulator(n_workers=3)
+        emulator.PARALLEL_MIN_QUBITS = 1
+        circuit = QuantumCircuit(width=5, depth=20, weight_2q=0.5, seed=1)
+        circuit.generate_gates_and_unite()
+        expected_result = CustomQuantumEmulator().execute(circuit)
+        self.assertTrue(np.allclose(emulator.execute(circuit).vector, expected_result.vector))
+
+        job = {"name": "missing_block", "shape": (2,) * 5, "dtype": "<c16", "groups": []}
+        with self.assertRaises(RuntimeError):
+            emulator._run_workers(job)
+
+        # qubit 12 is out of chunks, the unsplit state is processed by the first worker only while others wait at the barrier
+        matrix = RandomGenerator().rand_unitary("2q")
+        memory = shared_memory.SharedMemory(create=True, size=2**5 * 16)
+        try:
+            for fixed_qubits in [[4, 3], []]:
+                groups = [(fixed_qubits, [(matrix, [0, 12], QuantumOperation.classify(matrix))])]
+                with self.assertRaises(RuntimeError):
+                    emulator._run_workers({"name": memory.name, "shape": (2,) * 5, "dtype": "<c16", "groups": groups})
+        finally:
+            memory.close()
+            memory.unlink()
+        self.assertTrue(np.allclose(emulator.execute(circuit).vector, expected_result.vector))
+        emulator.close()
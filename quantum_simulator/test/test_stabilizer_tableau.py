@@ -0,0 +1,174 @@
+"""Stabilizer tableau and stabilizer emulator tests module"""
+
+from unittest import TestCase
+
+import numpy as np
+import pytest
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.mps_quantum_emulator import MPSQuantumEmulator
+from quantum_simulator.observable import Observable
+from quantum_simulator.qiskit_quantum_emulator import QiskitQuantumEmulator
+from quantum_simulator.quantum_circuit import GateView, QuantumCircuit
+from quantum_simulator.quantum_operation import OneQubitOperation, TwoQubitsOperation
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+from quantum_simulator.random_generator import RandomGenerator
+from quantum_simulator.stabilizer_quantum_emulator import StabilizerQuantumEmulator
+from quantum_simulator.stabilizer_tableau import StabilizerTableau
+
+
+@pytest.mark.stabilizer
+class TestStabilizerTableau(TestCase):
+    """StabilizerTableau and StabilizerQuantumEmulator tests class"""
+
+    @staticmethod
+    def random_clifford_circuit(width: int, depth: int, seed: int) -> QuantumCircuit:
+        """Returns circuit of random Clifford gates, 1-qubit gates with random global phases"""
+        rand_gen = RandomGenerator(seed=seed)
+        one_qubit = [OneQubitOperation.X, OneQubitOperation.Y, OneQubitOperation.Z, OneQubitOperation.H]
+        two_qubits = [TwoQubitsOperation.CX, TwoQubitsOperation.CZ, TwoQubitsOperation.SWAP]
+        circuit = QuantumCircuit(width, 0, 0.0)
+        for _ in range(depth):
+            qubit = rand_gen.rand_int() % width
+            kind = rand_gen.rand_int() % 9
+            if kind < 4 or width == 1:
+                matrix = one_qubit[kind % 4]().matrix * np.exp(1j * rand_gen.rand(L=3))
+                circuit.append_gate(GateView(matrix, [qubit]))
+            elif kind < 6:
+                circuit.append_gate(GateView(np.diag([1, 1j if kind == 4 else -1j]), [qubit]))
+            else:
+                other = (qubit + 1 + rand_gen.rand_int() % (width - 1)) % width
+                circuit.append_gate(two_qubits[kind - 6]([qubit, other]))
+        return circuit
+
+    def test_stabilizer_tableau_init(self):
+        """Tests StabilizerTableau init and gates recognition"""
+        tableau = StabilizerTableau(3)
+        self.assertEqual(tableau.stabilizers, ["+ZII", "+IZI", "+IIZ"])
+        self.assertEqual(tableau.nbytes, 2 * 6 + 6)
+        with self.assertRaises(TypeError):
+            StabilizerTableau(1.5)
+        with self.assertRaises(ValueError):
+            StabilizerTableau(0)
+
+        self.assertEqual(StabilizerTableau.clifford_gate(1j * OneQubitOperation.X().matrix), "x")
+        self.assertEqual(StabilizerTableau.clifford_gate(-OneQubitOperation.H().matrix), "h")
+        self.assertEqual(StabilizerTableau.clifford_gate(TwoQubitsOperation.CX().matrix), "cx_reversed")
+        self.assertIsNone(StabilizerTableau.clifford_gate(OneQubitOperation.T().matrix))
+        self.assertIsNone(StabilizerTableau.clifford_gate(RandomGenerator().rand_unitary("2q")))
+
+        tableau.apply_gate(OneQubitOperation.H().matrix, [0])
+        tableau.apply_gate(TwoQubitsOperation.CX().matrix, [1, 0])
+        tableau.apply_gate(OneQubitOperation.Y().matrix, [2])
+        self.assertEqual(tableau.stabilizers, ["+XXI", "+ZZI", "-IIZ"])
+        with self.assertRaises(ValueError):
+            tableau.apply_gate(OneQubitOperation.T().matrix, [0])
+        with self.assertRaises(ValueError):
+            tableau.apply_gate(OneQubitOperation.X().matrix, [3])
+
+        circuit = QuantumCircuit(2, 10, 0.5)
+        circuit.generate_gates_and_unite()
+        self.assertIsNone(StabilizerTableau.from_circuit(circuit))
+
+    def test_random_clifford_circuits(self):
+        """Tests tableau state, expectation values and shots against state vector simulation"""
+        for seed in range(12):
+            width = 1 + seed % 6
+            circuit = self.random_clifford_circuit(width, 40, seed)
+            tableau = StabilizerTableau.from_circuit(circuit)
+            state_vector = CustomQuantumEmulator().execute(circuit)
+            self.assertAlmostEqual(abs(np.vdot(tableau.to_state_vector().vector, state_vector.vector)), 1)
+
+            rand_gen = RandomGenerator(seed=seed)
+            labels = ["".join("IXYZ"[rand_gen.rand_int() % 4] for _ in range(width)) for _ in range(10)]
+            observable = Observable([(label, rand_gen.rand(L=1)) for label in labels])
+            self.assertAlmostEqual(tableau.expectation_value(observable), observable.expectation_value(state_vector))
+
+            counts = tableau.sample_counts(20000, seed=seed)
+            self.assertEqual(counts, tableau.sample_counts(20000, seed=seed))
+            frequencies = [counts.get(bitstring, 0) / 20000 for bitstring in QuantumStateVector.bitstrings(np.arange(2**width), width)]
+            self.assertTrue(np.allclose(frequencies, state_vector.probabilities(), atol=0.02))
+            self.assertEqual(tableau.sample(5, seed=seed).shape, (5, width))
+
+    def test_wide_ghz_state(self):
+        """Tests thousands of qubits GHZ state shots and expectation values"""
+        width = 2000
+        circuit = QuantumCircuit(width, 0, 0.0)
+        circuit.append_gate(OneQubitOperation.H([0]))
+        for qubit in range(1, width):
+            circuit.append_gate(TwoQubitsOperation.CX([qubit, qubit - 1]))
+
+        tableau = StabilizerQuantumEmulator().execute_tableau(circuit)
+        self.assertEqual(tableau.nbytes, 2 * (2 * width) * (width // 8) + 2 * width)
+        counts = tableau.sample_counts(1000, seed=1)
+        self.assertEqual(set(counts), {"0" * width, "1" * width})
+        self.assertEqual(sum(counts.values()), 1000)
+
+        observable = Observable({"ZZ" + "I" * (width - 2): 1.0, "X" * width: 0.5, "Z" + "I" * (width - 1): 2.0, "Y" * width: 1.0})
+        self.assertAlmostEqual(tableau.expectation_value(observable), 2.5)
+
+    def test_clifford_routing(self):
+        """Tests emulators route Clifford-only circuits shots and expectation values to stabilizer tableau"""
+        width = 40
+        circuit = QuantumCircuit(width, 0, 0.0)
+        circuit.append_gate(OneQubitOperation.H([0]))
+        for qubit in range(1, width):
+            circuit.append_gate(TwoQubitsOperation.CZ([qubit, 0]) if qubit % 2 else TwoQubitsOperation.CX([qubit, 0]))
+        # GHZ state of the even qubits
+        observable = Observable({"XI" * (width // 2): 1.0, "ZIZ" + "I" * (width - 3): 0.5, "Z" + "I" * (width - 1): 2.0})
+        routed_qiskit_emulator = QiskitQuantumEmulator()
+        routed_qiskit_emulator.route_clifford = True
+        for emulator in [CustomQuantumEmulator(), routed_qiskit_emulator, MPSQuantumEmulator(), StabilizerQuantumEmulator()]:
+            counts = emulator.execute_shots(circuit, 100, seed=2)
+            self.assertEqual(set(counts), {"0" * width, "10" * (width // 2)})
+            self.assertEqual(counts, StabilizerQuantumEmulator().execute_shots(circuit, 100, seed=2))
+            self.assertAlmostEqual(emulator.expectation_value(circuit, observable), 1.5)
+
+        small_circuit = self.random_clifford_circuit(4, 30, seed=3)
+        small_observable = Observable({"XYZI": 1.0, "ZZII": 0.5, "IIXX": -1.0})
+        emulator = CustomQuantumEmulator()
+        emulator.route_clifford = False
+        expected = emulator.expectation_value(small_circuit, small_observable)
+        self.assertAlmostEqual(CustomQuantumEmulator().expectation_value(small_circuit, small_observable), expected)
+        self.assertAlmostEqual(QiskitQuantumEmulator().expectation_value(small_circuit, small_observable), expected)
+        self.assertAlmostEqual(routed_qiskit_emulator.expectation_value(small_circuit, small_observable), expected)
+        # Qiskit reference emulator simulates Clifford circuits by Qiskit unless routing is set
+        self.assertFalse(QiskitQuantumEmulator.route_clifford)
+        self.assertTrue(CustomQuantumEmulator.route_clifford)
+        self.assertEqual(
+            set(QiskitQuantumEmulator().execute_shots(small_circuit, 1000, seed=1)),
+            set(StabilizerTableau.from_circuit(small_circuit).sample_counts(1000, seed=1)),
+        )
+
+        random_circuit = QuantumCircuit(3, 10, 0.5)
+        random_circuit.generate_gates_and_unite()
+        with self.assertRaises(ValueError):
+            StabilizerQuantumEmulator().execute_shots(random_circuit, 10)
+
+    def test_basis_input_states(self):
+        """Tests Clifford gates and circuits applied to computational basis states and unsupported inputs"""
+        emulator = StabilizerQuantumEmulator()
+        for index in [0, 5, 14]:
+            vector = np.zeros(16, dtype=complex)
+            vector[index] = 1j
+            state_vector = QuantumStateVector(vector)
+            circuit = self.random_clifford_circuit(4, 30, seed=index)
+            expected = CustomQuantumEmulator().apply_circuit(circuit, state_vector)
+            self.assertAlmostEqual(abs(np.vdot(emulator.apply_circuit(circuit, state_vector).vector, expected.vector)), 1)
+            gate = TwoQubitsOperation.CX([2, 0])
+            expected = CustomQuantumEmulator().apply_gate(gate, state_vector)
+            self.assertAlmostEqual(abs(np.vdot(emulator.apply_gate(gate, state_vector).vector, expected.vector)), 1)
+
+        superposition = CustomQuantumEmulator().apply_gate(OneQubitOperation.H([0]), QuantumStateVector(3))
+        with self.assertRaises(ValueError):
+            emulator.apply_gate(OneQubitOperation.X([0]), superposition)
+        with self.assertRaises(ValueError):
+            emulator.apply_circuit(self.random_clifford_circuit(3, 10, seed=1), superposition)
+        with self.assertRaises(ValueError):
+            emulator.apply_gate(OneQubitOperation.T([0]), QuantumStateVector(3))
+        random_circuit = QuantumCircuit(3, 10, 0.5)
+        random_circuit.generate_gates_and_unite()
+        with self.assertRaises(ValueError):
+            emulator.apply_circuit(random_circuit, QuantumStateVector(3))
+        with self.assertRaises(ValueError):
+            emulator.apply_circuit(random_circuit, QuantumStateVector(4))
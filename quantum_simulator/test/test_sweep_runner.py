@@ -0,0 +1,97 @@
+"""Sweep runner tests module"""
+
+import os
+import tempfile
+from unittest import TestCase
+
+import pytest
+
+from quantum_simulator.sweep_runner import SweepRunner, main, run_job
+
+
+@pytest.mark.sweep
+class TestSweepRunner(TestCase):
+    """SweepRunner tests class"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "results.jsonl")
+
+    def test_sweep_runner_init(self):
+        """Tests SweepRunner init"""
+        with self.assertRaises(ValueError):
+            SweepRunner(self.path, [])
+        with self.assertRaises(ValueError):
+            SweepRunner(self.path, ["unknown"])
+        with self.assertRaises(ValueError):
+            SweepRunner(self.path, ["custom"], n_workers=0)
+        with self.assertRaises(ValueError):
+            SweepRunner(self.path, ["custom"], repeats=0)
+
+        runner = SweepRunner(self.path, ["custom", "qiskit"], n_workers=1)
+        jobs = runner.jobs([3, 4], [10], [0.2, 0.5], [1, 2, 3])
+        self.assertEqual(len(jobs), 2 * 2 * 3 * 2)
+        self.assertEqual(len({runner.key(job) for job in jobs}), len(jobs))
+
+    def test_run_job(self):
+        """Tests single job record"""
+        record = run_job({"emulator": "custom", "width": 4, "depth": 20, "weight_2q": 0.5, "seed": 5})
+        self.assertEqual(tuple(record), SweepRunner.FIELDS)
+        self.assertEqual((record["width"], record["seed"], record["gates"], record["worker"]), (4, 5, 20, os.getpid()))
+
+        cached_record = run_job({"emulator": "qiskit", "width": 4, "depth": 20, "weight_2q": 0.5, "seed": 5}, cache_dir=self.directory.name)
+        self.assertEqual(cached_record["layers"], record["layers"])
+        self.assertTrue(any(name.endswith(".npz") for name in os.listdir(self.directory.name)))
+
+    def test_run_process_pool(self):
+        """Tests sweep run by worker processes is streamed to the results file and skipped on the next run"""
+        runner = SweepRunner(self.path, ["custom", "qiskit"], n_workers=2)
+        streamed = []
+        records = runner.run([3, 5], [15], [0.3], [1, 2], callback=streamed.append)
+        self.assertEqual(len(records), 8)
+        self.assertEqual(streamed, records)
+        self.assertEqual(SweepRunner.load(self.path), records)
+        self.assertEqual({runner.key(record) for record in records}, {runner.key(job) for job in runner.jobs([3, 5], [15], [0.3], [1, 2])})
+        self.assertEqual(runner.run([3, 5], [15], [0.3], [1, 2]), [])
+
+    def test_failed_jobs(self):
+        """Tests records of other jobs are written when jobs fail"""
+        for n_workers in [1, 2]:
+            path = os.path.join(self.directory.name, f"failed_{n_workers}.jsonl")
+            runner = SweepRunner(path, ["custom"], n_workers=n_workers)
+            streamed = []
+            # zero width circuits fail to generate
+            with self.assertRaises(RuntimeError) as context:
+                runner.run([0, 3], [10], [0.5], [1, 2], callback=streamed.append)
+            self.assertIn("2 of 4 jobs failed", str(context.exception))
+            self.assertIsInstance(context.exception.__cause__, ZeroDivisionError)
+            self.assertEqual(sorted(record["seed"] for record in SweepRunner.load(path)), [1, 2])
+            self.assertEqual(SweepRunner.load(path), streamed)
+            self.assertEqual(runner.run([3], [10], [0.5], [1, 2]), [])
+
+    def test_resume(self):
+        """Tests interrupted sweep is resumed"""
+        runner = SweepRunner(self.path, ["custom"], n_workers=1)
+        runner.run([3], [10], [0.5], [1, 2, 3])
+        with open(self.path, "rb") as file:
+            lines = file.readlines()
+
+        # crash while writing the third record
+        with open(self.path, "wb") as file:
+            file.writelines(lines[:2] + [lines[2][:10]])
+        self.assertEqual(len(SweepRunner.load(self.path)), 2)
+
+        records = runner.run([3], [10], [0.5], [1, 2, 3, 4])
+        self.assertEqual([record["seed"] for record in records], [3, 4])
+        self.assertEqual([record["seed"] for record in SweepRunner.load(self.path)], [1, 2, 3, 4])
+
+        with open(self.path, "ab") as file:
+            file.write(b"{damaged\n{}\n")
+        with self.assertRaises(ValueError):
+            SweepRunner.load(self.path)
+
+    def test_main(self):
+        """Tests command line entry point"""
+        self.assertEqual(main([self.path, "--widths", "3", "--depths", "10", "--weights-2q", "0.5", "--seeds", "7", "--n-seeds", "3", "--workers", "1"]), 0)
+        self.assertEqual([record["seed"] for record in SweepRunner.load(self.path)], [7, 8, 9])
@@ -0,0 +1,137 @@
+"""Noise model and trajectory simulator tests module"""
+
+from unittest import TestCase
+
+import numpy as np
+import pytest
+
+from quantum_simulator.custom_quantum_emulator import CustomQuantumEmulator
+from quantum_simulator.noise_model import NoiseModel
+from quantum_simulator.observable import Observable
+from quantum_simulator.quantum_circuit import GateView, QuantumCircuit
+from quantum_simulator.quantum_operation import OneQubitOperation
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+from quantum_simulator.trajectory_simulator import TrajectorySimulator
+
+
+@pytest.mark.noise
+class TestTrajectorySimulator(TestCase):
+    """NoiseModel and TrajectorySimulator tests class"""
+
+    def setUp(self):
+        self.x_circuit = QuantumCircuit(1, 0, 0.0)
+        self.x_circuit.append_gate(OneQubitOperation.X([0]))
+
+    def test_noise_model(self):
+        """Tests NoiseModel channels attachment"""
+        model = NoiseModel().add_depolarizing(0.1, gate_kinds=["2q"]).add_amplitude_damping(0.2, qubits=[1]).add_readout_error(0.1, 0.2, qubits=[0])
+        self.assertEqual(model.locations([0]), [])
+        self.assertEqual(model.locations([1]), [(1, 1)])
+        self.assertEqual(model.locations([1, 2]), [(0, 1), (0, 2), (1, 1)])
+        self.assertEqual(model.readout_errors, {0: (0.1, 0.2)})
+        self.assertTrue(NoiseModel().is_noiseless)
+        self.assertFalse(model.is_noiseless)
+
+        with self.assertRaises(ValueError):
+            NoiseModel().add_depolarizing(1.5)
+        with self.assertRaises(ValueError):
+            NoiseModel().add_amplitude_damping(0.1, gate_kinds=["3q"])
+        with self.assertRaises(ValueError):
+            NoiseModel().add_readout_error(0.1, -0.1)
+
+    def test_trajectory_simulator_init(self):
+        """Tests TrajectorySimulator init errors"""
+        with self.assertRaises(ValueError):
+            TrajectorySimulator(NoiseModel(), "unknown")
+        with self.assertRaises(ValueError):
+            TrajectorySimulator(NoiseModel(), n_trajectories=0)
+        with self.assertRaises(ValueError):
+            TrajectorySimulator(NoiseModel(), n_workers=0)
+        with self.assertRaises(ValueError):
+            TrajectorySimulator(NoiseModel()).execute_shots(self.x_circuit, 0)
+
+    def test_single_qubit_channels(self):
+        """Tests trajectories average of single qubit channels on |1⟩ state"""
+        z = Observable({"Z": 1})
+        for emulator, n_trajectories, delta in [("custom", 2000, 0.06), ("qiskit", 300, 0.2), ("mps", 300, 0.2)]:
+            damped = TrajectorySimulator(NoiseModel().add_amplitude_damping(0.3), emulator, n_trajectories=n_trajectories)
+            self.assertAlmostEqual(damped.expectation_value(self.x_circuit, z, seed=1), -0.4, delta=delta)
+        depolarized = TrajectorySimulator(NoiseModel().add_depolarizing(0.3), n_trajectories=2000)
+        # X and Y errors flip |1⟩ to |0⟩
+        self.assertAlmostEqual(depolarized.expectation_value(self.x_circuit, z, seed=1), -0.6, delta=0.06)
+
+        counts = TrajectorySimulator(NoiseModel().add_readout_error(0.0, 0.1), n_trajectories=10).execute_shots(self.x_circuit, 10000, seed=3)
+        self.assertEqual(sum(counts.values()), 10000)
+        self.assertAlmostEqual(counts["0"] / 10000, 0.1, delta=0.015)
+
+    def test_density_matrix(self):
+        """Tests trajectories average against exact density matrix evolution"""
+        circuit = QuantumCircuit(3, 12, 0.4, seed=12)
+        circuit.generate_gates_and_unite()
+        model = NoiseModel().add_depolarizing(0.1, gate_kinds=["2q"]).add_amplitude_damping(0.15, qubits=[0, 2])
+        observable = Observable({"ZII": 1, "IZI": 0.5, "XXI": 1, "IYY": -1})
+
+        density_matrix = np.zeros((8, 8), dtype=complex)
+        density_matrix[0, 0] = 1
+        paulis = [np.array([[0, 1], [1, 0]]), np.array([[0, -1j], [1j, 0]]), np.array([[1, 0], [0, -1]])]
+        for layer_gates in circuit.iter_layers():
+            for gate in layer_gates:
+                unitary = self._operator(gate.matrix, gate.target_qubits, 3)
+                density_matrix = unitary @ density_matrix @ unitary.conj().T
+                for index, qubit in model.locations(gate.target_qubits):
+                    channel, parameter, _, _ = model.channels[index]
+                    if channel == NoiseModel.DEPOLARIZING:
+                        kraus = [np.sqrt(1 - parameter) * np.eye(2)] + [np.sqrt(parameter / 3) * pauli for pauli in paulis]
+                    else:
+                        kraus = [np.array([[1, 0], [0, np.sqrt(1 - parameter)]]), np.array([[0, np.sqrt(parameter)], [0, 0]])]
+                    operators = [self._operator(matrix, [qubit], 3) for matrix in kraus]
+                    density_matrix = sum(operator @ density_matrix @ operator.conj().T for operator in operators)
+        exact = sum(
+            coefficient * np.trace(self._operator_of_label(label) @ density_matrix).real
+            for label, coefficient in zip(observable.labels, observable.coefficients)
+        )
+
+        simulator = TrajectorySimulator(model, n_trajectories=600)
+        self.assertAlmostEqual(simulator.expectation_value(circuit, observable, seed=5), exact, delta=0.1)
+
+    def test_reproducible_streams(self):
+        """Tests results do not depend on worker processes and incremental aggregation"""
+        circuit = QuantumCircuit(4, 30, 0.3, seed=3)
+        circuit.generate_gates_and_unite()
+        model = NoiseModel().add_depolarizing(0.05).add_amplitude_damping(0.1, gate_kinds=["2q"]).add_readout_error(0.05)
+
+        partial = []
+        sequential = TrajectorySimulator(model, n_trajectories=40).execute_shots(circuit, 400, seed=9)
+        parallel = TrajectorySimulator(model, n_trajectories=40, n_workers=2).execute_shots(
+            circuit, 400, seed=9, callback=lambda done, counts: partial.append((done, sum(counts.values())))
+        )
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(len(partial), 8)
+        self.assertEqual(partial[-1], (40, 400))
+        self.assertEqual(sorted(partial), partial)
+        self.assertNotEqual(TrajectorySimulator(model, n_trajectories=40).execute_shots(circuit, 400, seed=10), sequential)
+
+        simulator = TrajectorySimulator(model, n_trajectories=40)
+        self.assertEqual(simulator.stream_length(circuit), sum(len(model.locations(circuit.gate(index).target_qubits)) for index in range(30)) + 1)
+        with self.assertRaises(ValueError):
+            TrajectorySimulator(model, n_trajectories=2**30).expectation_value(circuit, Observable({"ZZZZ": 1}))
+
+    @staticmethod
+    def _operator(matrix: np.ndarray, target_qubits: list, num_qubits: int) -> np.ndarray:
+        """Returns `num_qubits` operator of `matrix` acting on `target_qubits`, built column by column"""
+        emulator = CustomQuantumEmulator()
+        columns = []
+        for index in range(2**num_qubits):
+            basis_state = QuantumStateVector(num_qubits)
+            basis_state[0], basis_state[index] = 0, 1
+            columns.append(emulator.apply_gate(GateView(np.asarray(matrix, dtype=complex), target_qubits), basis_state).vector)
+        return np.stack(columns, axis=1)
+
+    @classmethod
+    def _operator_of_label(cls, label: str) -> np.ndarray:
+        """Returns operator of Pauli string `label` (first qubit is leftmost)"""
+        paulis = {"I": np.eye(2), "X": np.array([[0, 1], [1, 0]]), "Y": np.array([[0, -1j], [1j, 0]]), "Z": np.array([[1, 0], [0, -1]])}
+        operator = np.eye(2 ** len(label), dtype=complex)
+        for qubit, pauli in enumerate(label):
+            operator = cls._operator(paulis[pauli], [qubit], len(label)) @ operator
+        return operator
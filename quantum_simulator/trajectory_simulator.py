@@ -0,0 +1,209 @@
+"""Monte Carlo quantum trajectories simulator module"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# TODO: typing.Dict and typing.List are deprecated since Python 3.9. Use dict and list after version update
+from typing import Dict, List
+
+import numpy as np
+
+from quantum_simulator.abstract_quantum_emulator import AbstractQuantumEmulator
+from quantum_simulator.emulator_benchmark import EMULATORS
+from quantum_simulator.noise_model import NoiseModel
+from quantum_simulator.observable import Observable
+from quantum_simulator.quantum_circuit import GateView, QuantumCircuit
+from quantum_simulator.quantum_state_vector import QuantumStateVector
+from quantum_simulator.random_generator import RandomGenerator
+
+_worker_emulators: Dict[str, AbstractQuantumEmulator] = {}
+"Emulators created by the worker process - `{name: emulator}`, reused by its trajectories"
+
+
+class TrajectorySimulator:
+    """
+    Monte Carlo quantum trajectories simulator class
+
+    Runs noisy circuits as ensembles of pure state trajectories on an `EMULATORS` emulator, so memory stays `2**n`
+    amplitudes instead of a `4**n` density matrix. Gates and sampled Pauli errors between amplitude damping points are
+    applied by a single `apply_circuit` call. Trajectory `t` draws its random numbers from its own `RandomGenerator`
+    stream, `t * stream_length` steps after the seeded state, so results do not depend on `n_workers` and chunking.
+    Trajectories run in chunks on a process pool and results are aggregated as chunks complete
+    """
+
+    STREAM_M: int = 2**31 - 1
+    "Streams generator modulus - prime, so the multiplicative generator period is `STREAM_M - 1`"
+
+    STREAM_A: int = 48271
+    "Streams generator multiplier - primitive root of `STREAM_M`"
+
+    CHUNKS_PER_WORKER: int = 4
+    "Number of trajectory chunks per worker process, so results are aggregated while the pool runs"
+
+    emulator: str
+    "Name of the `EMULATORS` emulator running trajectories"
+
+    noise_model: NoiseModel
+    "Noise model unravelled into trajectories"
+
+    n_trajectories: int
+    "Number of trajectories"
+
+    n_workers: int
+    "Number of worker processes. Trajectories are run by the calling process if it is one"
+
+    def __init__(self, noise_model: NoiseModel, emulator: str = "custom", n_trajectories: int = 100, n_workers: int = 1):
+        if emulator not in EMULATORS:
+            raise ValueError(f"Unknown emulator {emulator}. Should be from {list(EMULATORS)}")
+        if n_trajectories < 1:
+            raise ValueError("n_trajectories must be not less than one")
+        if n_workers < 1:
+            raise ValueError("n_workers must be not less than one")
+        self.noise_model = noise_model
+        self.emulator = emulator
+        self.n_trajectories = n_trajectories
+        self.n_workers = n_workers
+
+    def execute_shots(self, circuit: QuantumCircuit, n_shots: int, seed: int = None, callback=None) -> Dict[str, int]:
+        """
+        Executes noisy shots using given circuit. Returns `{bitstring: count}` of the measured bitstrings
+
+        Shots are split evenly between `min(n_trajectories, n_shots)` trajectories. `callback` is called with the number of
+        completed trajectories and the counts aggregated so far as trajectory chunks complete
+        """
+        if n_shots < 1:
+            raise ValueError("Number of shots must be not less than one.")
+        n_trajectories = min(self.n_trajectories, n_shots)
+        shots = [n_shots // n_trajectories + (trajectory < n_shots % n_trajectories) for trajectory in range(n_trajectories)]
+
+        counts = np.zeros(2**circuit.width, dtype=np.int64)
+        for done, (chunk_counts, _) in self._run(circuit, n_trajectories, seed, shots, None):
+            counts += chunk_counts
+            if callback is not None:
+                callback(done, self._counts_dict(counts, circuit.width))
+        return self._counts_dict(counts, circuit.width)
+
+    def expectation_value(self, circuit: QuantumCircuit, observable: Observable, seed: int = None, callback=None) -> float:
+        """
+        Returns trajectories mean of ⟨ψ|H|ψ⟩ for `observable` H (readout errors do not apply)
+
+        `callback` is called with the number of completed trajectories and the mean of their values as chunks complete
+        """
+        total, n_done = 0.0, 0
+        for n_done, (_, chunk_sum) in self._run(circuit, self.n_trajectories, seed, None, observable):
+            total += chunk_sum
+            if callback is not None:
+                callback(n_done, total / n_done)
+        return total / n_done
+
+    def stream_length(self, circuit: QuantumCircuit) -> int:
+        """Returns number of random numbers a trajectory of `circuit` draws - one per channel application and a sampling seed"""
+        return sum(len(self.noise_model.locations(gate.target_qubits)) for layer_gates in circuit.iter_layers() for gate in layer_gates) + 1
+
+    def _run(self, circuit: QuantumCircuit, n_trajectories: int, seed: int, shots: List[int], observable: Observable):
+        """Runs trajectories in chunks. Yields `(completed_trajectories, chunk_result)` as chunks complete"""
+        if seed is None:
+            seed = int(np.random.default_rng().integers(self.STREAM_M - 1))
+        stream_length = self.stream_length(circuit)
+        if n_trajectories * stream_length >= self.STREAM_M - 1:
+            raise ValueError(f"{n_trajectories} trajectories of {stream_length} random numbers overlap generator streams")
+
+        n_chunks = min(n_trajectories, 1 if self.n_workers == 1 else self.n_workers * self.CHUNKS_PER_WORKER)
+        bounds = np.linspace(0, n_trajectories, n_chunks + 1).astype(int).tolist()
+        chunks = [
+            {
+                "emulator": self.emulator,
+                "noise_model": self.noise_model,
+                "circuit": circuit,
+                "seed": seed,
+                "stream_length": stream_length,
+                "start": start,
+                "stop": stop,
+                "shots": None if shots is None else shots[start:stop],
+                "observable": observable,
+            }
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+
+        done = 0
+        if n_chunks == 1:
+            for chunk in chunks:
+                done += chunk["stop"] - chunk["start"]
+                yield done, run_trajectories(chunk)
+            return
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            futures = {executor.submit(run_trajectories, chunk): chunk["stop"] - chunk["start"] for chunk in chunks}
+            for future in as_completed(futures):
+                done += futures[future]
+                yield done, future.result()
+
+    @staticmethod
+    def _counts_dict(counts: np.ndarray, num_qubits: int) -> Dict[str, int]:
+        """Returns `{bitstring: count}` of the non-zero basis state `counts`"""
+        indices = np.flatnonzero(counts)
+        return dict(zip(QuantumStateVector.bitstrings(indices, num_qubits), counts[indices].tolist()))
+
+
+def run_trajectories(chunk: dict) -> tuple:
+    """
+    Runs trajectories `[start, stop)` of a `TrajectorySimulator` chunk. Returns `(counts, observable_sum)`
+
+    `counts` are basis state counts of `shots[t]` shots of each trajectory `t` (`None` without `shots`), `observable_sum`
+    is the sum of the trajectories `observable` values (`0.0` without `observable`)
+    """
+    emulator, noise_model, circuit, shots, observable = chunk["emulator"], chunk["noise_model"], chunk["circuit"], chunk["shots"], chunk["observable"]
+    start, stop, stream_length = chunk["start"], chunk["stop"], chunk["stream_length"]
+    if emulator not in _worker_emulators:
+        _worker_emulators[emulator] = EMULATORS[emulator]()
+    generator = RandomGenerator(
+        m=TrajectorySimulator.STREAM_M, a=TrajectorySimulator.STREAM_A, c=0, seed=chunk["seed"] % (TrajectorySimulator.STREAM_M - 1) + 1
+    )
+    generator.skip(start * stream_length)
+
+    counts = None if shots is None else np.zeros(2**circuit.width, dtype=np.int64)
+    observable_sum = 0.0
+    for trajectory in range(start, stop):
+        uniforms = generator.rands(stream_length)
+        state_vector = run_trajectory(_worker_emulators[emulator], noise_model, circuit, uniforms[:-1])
+        # last stream number seeds shots and readout errors sampling
+        rng = np.random.default_rng(int(uniforms[-1] * TrajectorySimulator.STREAM_M))
+        if shots is not None and shots[trajectory - start]:
+            indices = state_vector.sample(shots[trajectory - start], rng)
+            counts += np.bincount(noise_model.apply_readout_errors(indices, circuit.width, rng), minlength=len(counts))
+        if observable is not None:
+            observable_sum += float(np.real(observable.expectation_value(state_vector)))
+    return counts, observable_sum
+
+
+def run_trajectory(emulator: AbstractQuantumEmulator, noise_model: NoiseModel, circuit: QuantumCircuit, uniforms: np.ndarray) -> QuantumStateVector:
+    """
+    Runs a trajectory of `circuit` on |0...0⟩ state. Returns its final state vector
+
+    `uniforms` are consumed by channel applications in circuit layers order. Gates and depolarizing Pauli errors are
+    collected into a segment circuit, which is applied by `emulator` before amplitude damping and at the end
+    """
+    state_vector = QuantumStateVector(circuit.width)
+    segment = QuantumCircuit(circuit.width, 0, 0.0)
+    position = 0
+    for layer_gates in circuit.iter_layers():
+        for gate in layer_gates:
+            segment.append_gate(gate)
+            for index, qubit in noise_model.locations(gate.target_qubits):
+                if noise_model.channels[index][0] == NoiseModel.DEPOLARIZING:
+                    pauli = noise_model.apply_channel(index, state_vector, qubit, uniforms[position])
+                    if pauli is not None:
+                        segment.append_gate(GateView(pauli, [qubit]))
+                else:
+                    state_vector = _apply_segment(emulator, segment, state_vector)
+                    segment = QuantumCircuit(circuit.width, 0, 0.0)
+                    noise_model.apply_channel(index, state_vector, qubit, uniforms[position])
+                position += 1
+    return _apply_segment(emulator, segment, state_vector)
+
+
+def _apply_segment(emulator: AbstractQuantumEmulator, segment: QuantumCircuit, state_vector: QuantumStateVector) -> QuantumStateVector:
+    """Applies `segment` circuit by `emulator`. Returns a writable state vector"""
+    if segment.gates_count:
+        state_vector = emulator.apply_circuit(segment, state_vector)
+    if not np.asarray(state_vector.vector).flags.writeable:
+        state_vector = state_vector.copy()
+    return state_vector